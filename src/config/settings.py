@@ -9,21 +9,48 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, is_dataclass, replace
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 import yaml
 
 
 @dataclass
 class DataSourceConfig:
-    """Veri kaynağı yapılandırması."""
+    """Veri kaynağı yapılandırması.
+
+    ``type: catalog`` için ``root`` altında ``symbol/timeframe/date``
+    bölümlenmiş dosyalar okunur; ``symbol`` ve ``timeframe`` verilmezse
+    ``runtime`` değerleri kullanılır. ``type: csv`` ile ``follow: true``
+    dosyayı sonuna eklenen satırlar için izler (``TailCSVFeed``);
+    ``ticks_path`` verilirse oradaki ``timestamp,price`` işlemleri bar içi
+    koruma için tick olarak izlenir.
+    """
 
     type: str
     path: Optional[str] = None
     delay_seconds: float = 0.0
+    root: Optional[str] = None
+    symbol: Optional[str] = None
+    timeframe: Optional[str] = None
+    start: Optional[str] = None
+    end: Optional[str] = None
+    prefetch: bool = True
+    follow: bool = False
+    poll_min_seconds: float = 0.05
+    poll_max_seconds: float = 1.0
+    idle_timeout_seconds: Optional[float] = None
+    ticks_path: Optional[str] = None
+
+
+@dataclass
+class ClockConfig:
+    """Simülasyon saati yapılandırması (``wall``, ``virtual`` veya ``scaled``)."""
+
+    mode: str = "wall"
+    speed: float = 1.0
 
 
 @dataclass
@@ -40,6 +67,8 @@ class RuntimeConfig:
     min_hold_bars: int
     cooldown_after_stop_minutes: int
     data_source: Optional[DataSourceConfig] = None
+    clock: ClockConfig = field(default_factory=ClockConfig)
+    higher_timeframes: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -125,6 +154,140 @@ class BanditConfig:
     min_exploration: float
 
 
+def _default_feature_names() -> List[str]:
+    return ["return_1", "return_5", "return_10", "volatility_10", "sma_ratio", "volume_zscore"]
+
+
+@dataclass
+class FeaturesConfig:
+    """Karar vektörüne girecek özelliklerin seçimi."""
+
+    names: List[str] = field(default_factory=_default_feature_names)
+
+
+@dataclass
+class FeatureStoreConfig:
+    """Kalıcı özellik deposu (bellek eşlemeli ``.npy``) yapılandırması."""
+
+    enabled: bool = False
+    root: str = "runs/feature_store"
+    max_bytes: int = 2 * 1024**3
+
+
+@dataclass
+class JournalConfig:
+    """İkili çalışma günlüğü (run journal) yapılandırması."""
+
+    enabled: bool = False
+    path: str = "runs/journal.bin"
+    batch_size: int = 4096
+    flush_interval_seconds: float = 1.0
+    fsync: str = "batch"
+    fsync_interval_seconds: float = 5.0
+
+
+@dataclass
+class MonitoringConfig:
+    """Prometheus metrik uç noktası yapılandırması."""
+
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 9108
+    read_timeout_seconds: float = 5.0
+
+
+@dataclass
+class MemoryProfilingConfig:
+    """tracemalloc/GC tabanlı bellek ölçümü yapılandırması."""
+
+    enabled: bool = False
+    snapshot_interval_bars: int = 1000
+    top_modules: int = 10
+    frames: int = 1
+    warmup_bars: int = 0
+    trace: bool = True
+
+
+@dataclass
+class SamplingProfilerConfig:
+    """Sinyalle açılıp kapatılan örnekleyici profilleyici yapılandırması."""
+
+    enabled: bool = True
+    signal: str = "SIGUSR1"
+    interval_ms: float = 5.0
+    output_dir: str = "runs/profiles"
+    max_depth: int = 128
+
+
+@dataclass
+class ShardingConfig:
+    """Çok süreçli sembol paylaştırma yapılandırması (``python -m src.supervisor``)."""
+
+    symbols: List[str] = field(default_factory=list)
+    workers: int = 0
+    ring_capacity: int = 4096
+    max_restarts: int = 3
+    report_interval_seconds: float = 1.0
+
+
+@dataclass
+class DownloaderConfig:
+    """Toplu tarihsel kline indirici (``python -m src.data.downloader``) yapılandırması."""
+
+    root: str = "data/catalog"
+    base_url: str = "https://fapi.binance.com"
+    endpoint: str = "/fapi/v1/klines"
+    concurrency: int = 8
+    limit: int = 1500
+    max_weight_per_minute: int = 2400
+    max_retries: int = 5
+    timeout_seconds: float = 10.0
+
+
+@dataclass
+class SweepConfig:
+    """Successive-halving parametre taraması (``src.evaluation.sweep``)."""
+
+    min_bars: int = 500
+    eta: int = 2
+
+
+@dataclass
+class DeadlineConfig:
+    """Bar başı karar süresi sınırı; ``budget_seconds`` boşsa ``runtime.max_latency_seconds``."""
+
+    enabled: bool = False
+    budget_seconds: Optional[float] = None
+    catchup_updates: int = 4
+    max_deferred: int = 1024
+
+
+@dataclass
+class LazyConfig:
+    """Sakin barlarda önbellekteki kararı yeniden kullanan tembel değerlendirme."""
+
+    enabled: bool = False
+    price_threshold: float = 0.0005
+    volume_threshold: float = 0.5
+    max_skip_bars: int = 10
+
+
+@dataclass
+class CompactConfig:
+    """Kompakt mod: bar/pencere/özellik/equity tamponları önceden ayrılmış ``float32`` dizilerde."""
+
+    enabled: bool = False
+    bar_window: int = 200
+
+
+@dataclass
+class LedgerConfig:
+    """Pipeline işlem defteri; ``max_trades`` dolunca en eski işlemler atılır."""
+
+    enabled: bool = False
+    max_trades: int = 100_000
+
+
 @dataclass
 class Settings:
     runtime: RuntimeConfig
@@ -132,6 +295,19 @@ class Settings:
     sizing: SizingConfig
     safety: SafetyConfig
     bandit: BanditConfig
+    journal: JournalConfig = field(default_factory=JournalConfig)
+    features: FeaturesConfig = field(default_factory=FeaturesConfig)
+    feature_store: FeatureStoreConfig = field(default_factory=FeatureStoreConfig)
+    monitoring: MonitoringConfig = field(default_factory=MonitoringConfig)
+    memory_profiling: MemoryProfilingConfig = field(default_factory=MemoryProfilingConfig)
+    sampling_profiler: SamplingProfilerConfig = field(default_factory=SamplingProfilerConfig)
+    sharding: ShardingConfig = field(default_factory=ShardingConfig)
+    sweep: SweepConfig = field(default_factory=SweepConfig)
+    downloader: DownloaderConfig = field(default_factory=DownloaderConfig)
+    compact: CompactConfig = field(default_factory=CompactConfig)
+    deadline: DeadlineConfig = field(default_factory=DeadlineConfig)
+    lazy: LazyConfig = field(default_factory=LazyConfig)
+    ledger: LedgerConfig = field(default_factory=LedgerConfig)
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
@@ -145,7 +321,8 @@ def _parse_settings(data: Dict[str, Any]) -> Settings:
     data_source = None
     if data_source_raw is not None:
         data_source = DataSourceConfig(**data_source_raw)
-    runtime = RuntimeConfig(**runtime_raw, data_source=data_source)
+    clock = ClockConfig(**(runtime_raw.pop("clock", None) or {}))
+    runtime = RuntimeConfig(**runtime_raw, data_source=data_source, clock=clock)
     metrics = MetricsConfig(
         windows=MetricsWindowsConfig(**data["metrics"]["windows"]),
         targets=MetricsTargetsConfig(**data["metrics"]["targets"]),
@@ -163,7 +340,56 @@ def _parse_settings(data: Dict[str, Any]) -> Settings:
         cooldown_after_stop_minutes=data["safety"]["cooldown_after_stop_minutes"],
     )
     bandit = BanditConfig(**data["bandit"])
-    return Settings(runtime=runtime, metrics=metrics, sizing=sizing, safety=safety, bandit=bandit)
+    journal = JournalConfig(**(data.get("journal") or {}))
+    features = FeaturesConfig(**(data.get("features") or {}))
+    feature_store = FeatureStoreConfig(**(data.get("feature_store") or {}))
+    monitoring = MonitoringConfig(**(data.get("monitoring") or {}))
+    memory_profiling = MemoryProfilingConfig(**(data.get("memory_profiling") or {}))
+    sampling_profiler = SamplingProfilerConfig(**(data.get("sampling_profiler") or {}))
+    sharding = ShardingConfig(**(data.get("sharding") or {}))
+    sweep = SweepConfig(**(data.get("sweep") or {}))
+    downloader = DownloaderConfig(**(data.get("downloader") or {}))
+    compact = CompactConfig(**(data.get("compact") or {}))
+    deadline = DeadlineConfig(**(data.get("deadline") or {}))
+    lazy = LazyConfig(**(data.get("lazy") or {}))
+    ledger = LedgerConfig(**(data.get("ledger") or {}))
+    return Settings(
+        runtime=runtime,
+        metrics=metrics,
+        sizing=sizing,
+        safety=safety,
+        bandit=bandit,
+        journal=journal,
+        features=features,
+        feature_store=feature_store,
+        monitoring=monitoring,
+        memory_profiling=memory_profiling,
+        sampling_profiler=sampling_profiler,
+        sharding=sharding,
+        sweep=sweep,
+        downloader=downloader,
+        compact=compact,
+        deadline=deadline,
+        lazy=lazy,
+        ledger=ledger,
+    )
+
+
+def override_settings(settings: Settings, overrides: Mapping[str, Any]) -> Settings:
+    """Noktalı yollarla (``"sizing.beta_mdd"``) değiştirilmiş bir kopya döndür; özgün nesne değişmez."""
+
+    for path, value in overrides.items():
+        settings = _replace_path(settings, path.split("."), value, path)
+    return settings
+
+
+def _replace_path(node: Any, parts: List[str], value: Any, path: str) -> Any:
+    name = parts[0]
+    if not is_dataclass(node) or name not in {f.name for f in fields(node)}:
+        raise KeyError(f"Bilinmeyen ayar yolu: {path}")
+    if len(parts) > 1:
+        value = _replace_path(getattr(node, name), parts[1:], value, path)
+    return replace(node, **{name: value})
 
 
 @lru_cache(maxsize=1)
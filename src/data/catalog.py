@@ -0,0 +1,220 @@
+"""Bölümlenmiş, sıkıştırılmış tarihsel veri kataloğu.
+
+Veriler ``<root>/<SYMBOL>/<timeframe>/<YYYY-MM-DD>.csv[.gz|.zst]`` düzeninde
+günlük dosyalar olarak tutulur. ``DataCatalog`` dizini bir kez tarar ve
+``(symbol, start, end)`` sorgularını yalnızca ilgili günlerin dosyalarını
+seçerek yanıtlar. ``CatalogFeed`` seçilen bölümleri akış halinde açıp çözer;
+mevcut bölüm yayınlanırken bir sonrakini arka planda önceden okur.
+
+``.zst`` dosyaları için isteğe bağlı ``zstandard`` paketi gerekir.
+
+Örnek:
+    from src.data.catalog import CatalogFeed, DataCatalog
+
+    catalog = DataCatalog("data/catalog")
+    feed = CatalogFeed(catalog, "BTCUSDT", start="2023-01-01", end="2023-02-01")
+    async for bar in feed.stream_klines():
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import gzip
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, TextIO, Tuple, Union
+
+from src.data.live_feed import read_csv_bars
+from src.utils.time import Clock, get_clock
+from src.utils.types import BarData
+
+PARTITION_SUFFIXES = (".csv.gz", ".csv.zst", ".csv")
+TimeBound = Union[int, float, str, dt.date, dt.datetime, None]
+
+
+@dataclass(frozen=True, slots=True)
+class Partition:
+    """Tek bir sembol/zaman dilimi/gün dosyası."""
+
+    symbol: str
+    timeframe: str
+    day: dt.date
+    path: Path
+
+    @property
+    def start_ts(self) -> int:
+        return int(dt.datetime.combine(self.day, dt.time(), tzinfo=dt.timezone.utc).timestamp())
+
+    @property
+    def end_ts(self) -> int:
+        return self.start_ts + 86400
+
+
+class DataCatalog:
+    """``symbol/timeframe/date`` düzenindeki bölümleri indeksler."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root).expanduser()
+        self._index: Dict[Tuple[str, str], List[Partition]] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Dizini yeniden tara."""
+
+        if not self.root.is_dir():
+            raise FileNotFoundError(f"Veri kataloğu dizini bulunamadı: {self.root}")
+        index: Dict[Tuple[str, str], Dict[dt.date, Partition]] = {}
+        for path in self.root.glob("*/*/*"):
+            day = _partition_day(path.name)
+            if day is None or not path.is_file():
+                continue
+            symbol, timeframe = path.parent.parent.name, path.parent.name
+            # Aynı gün için birden çok biçim varsa sıkıştırılmamış olan tercih edilir.
+            existing = index.setdefault((symbol, timeframe), {}).get(day)
+            if existing is None or path.name.endswith(".csv"):
+                index[(symbol, timeframe)][day] = Partition(symbol, timeframe, day, path)
+        self._index = {key: [days[d] for d in sorted(days)] for key, days in index.items()}
+
+    def symbols(self) -> List[str]:
+        return sorted({symbol for symbol, _ in self._index})
+
+    def partitions(self, symbol: str, timeframe: str = "1m") -> List[Partition]:
+        return list(self._index.get((symbol, timeframe), []))
+
+    def query(
+        self,
+        symbol: str,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        timeframe: str = "1m",
+    ) -> List[Partition]:
+        """``[start, end)`` aralığıyla kesişen bölümleri kronolojik sırayla döndür."""
+
+        start_ts, end_ts = to_epoch(start), to_epoch(end)
+        return [
+            part
+            for part in self._index.get((symbol, timeframe), [])
+            if (start_ts is None or part.end_ts > start_ts) and (end_ts is None or part.start_ts < end_ts)
+        ]
+
+
+def to_epoch(value: TimeBound) -> Optional[int]:
+    """Sayı, ISO tarih/saat metni ya da ``date``/``datetime`` değerini UTC epoch saniyesine çevir."""
+
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if text.lstrip("-").isdigit():
+            return int(text)
+        value = dt.datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if isinstance(value, dt.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=dt.timezone.utc)
+        return int(value.timestamp())
+    if isinstance(value, dt.date):
+        return int(dt.datetime.combine(value, dt.time(), tzinfo=dt.timezone.utc).timestamp())
+    raise TypeError(f"Desteklenmeyen zaman sınırı: {value!r}")
+
+
+def open_partition(path: Path) -> TextIO:
+    """Bölüm dosyasını uzantısına göre akış halinde çözerek metin olarak aç."""
+
+    name = path.name
+    if name.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    if name.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as exc:  # pragma: no cover - isteğe bağlı bağımlılık
+            raise ImportError(".zst bölümleri için 'zstandard' paketi kurulmalıdır.") from exc
+        raw = path.open("rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8", newline="")
+    return path.open("r", encoding="utf-8", newline="")
+
+
+def read_partition(partition: Partition, start: Optional[int] = None, end: Optional[int] = None) -> List[BarData]:
+    """Bölümü okuyup ``[start, end)`` aralığındaki barları döndür."""
+
+    with open_partition(partition.path) as handle:
+        return [
+            bar
+            for bar in read_csv_bars(handle)
+            if (start is None or bar.timestamp >= start) and (end is None or bar.timestamp < end)
+        ]
+
+
+class CatalogFeed:
+    """Katalog sorgusunu bölüm bölüm, bir sonrakini önceden okuyarak yayınla."""
+
+    def __init__(
+        self,
+        catalog: DataCatalog,
+        symbol: str,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        timeframe: str = "1m",
+        prefetch: bool = True,
+        delay_seconds: float = 0.0,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        self.catalog = catalog
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.start = to_epoch(start)
+        self.end = to_epoch(end)
+        self.prefetch = prefetch
+        self.delay_seconds = delay_seconds
+        self._clock = clock
+        self.partitions = catalog.query(symbol, self.start, self.end, timeframe)
+        if not self.partitions:
+            raise ValueError(f"Katalogda {symbol}/{timeframe} için istenen aralıkta veri yok.")
+        self._buffered = 0
+        self._position = 0
+
+    def qsize(self) -> int:
+        """Belleğe okunmuş ama henüz yayınlanmamış bar sayısı."""
+
+        return max(0, self._buffered - self._position)
+
+    async def stream_klines(self) -> AsyncIterator[BarData]:
+        clock = self._clock or get_clock()
+        delay = max(0.0, self.delay_seconds)
+        loop = asyncio.get_running_loop()
+        pending: Optional[asyncio.Future] = None
+        try:
+            for i, partition in enumerate(self.partitions):
+                if pending is None:
+                    pending = loop.run_in_executor(None, read_partition, partition, self.start, self.end)
+                bars = await pending
+                pending = None
+                if self.prefetch and i + 1 < len(self.partitions):
+                    pending = loop.run_in_executor(
+                        None, read_partition, self.partitions[i + 1], self.start, self.end
+                    )
+                self._buffered = len(bars)
+                for position, bar in enumerate(bars, 1):
+                    self._position = position
+                    await clock.advance_to(bar.timestamp)
+                    yield bar
+                    if delay:
+                        await clock.sleep(delay)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+def _partition_day(name: str) -> Optional[dt.date]:
+    for suffix in PARTITION_SUFFIXES:
+        if name.endswith(suffix):
+            try:
+                return dt.date.fromisoformat(name[: -len(suffix)])
+            except ValueError:
+                return None
+    return None
@@ -0,0 +1,302 @@
+"""Eşzamanlı toplu tarihsel kline indirici.
+
+Binance uyumlu bir REST uç noktasından (``GET <endpoint>?symbol=&interval=
+&startTime=&endTime=&limit=``) birçok sembol ve tarih aralığı için klineları
+indirir ve doğrudan katalog düzenine yazar:
+``<root>/<SYMBOL>/<timeframe>/<YYYY-MM-DD>.csv`` (``HistoricalCSVFeed`` ve
+``DataCatalog``'un okuduğu başlıklı OHLCV biçimi, epoch saniyesi zaman damgası).
+
+* Tek bir havuzlu ``httpx.AsyncClient`` kullanılır; aynı anda en çok
+  ``concurrency`` gün bölümü indirilir.
+* Hız sınırı: ``X-MBX-USED-WEIGHT-1M`` başlığı ``max_weight_per_minute``'a
+  yaklaşınca tüm istekler bir sonraki dakikaya kadar bekletilir; 429/418
+  yanıtlarında ``Retry-After`` kadar beklenip yeniden denenir. Geçici
+  hatalar (5xx, bağlantı) üstel geri çekilmeyle ``max_retries`` kez denenir.
+* Devam ettirilebilirlik: her bölüm geçici dosyaya yazılıp atomik olarak
+  yerine taşınır, ardından ``<gün>.csv.sha256`` yan dosyası yazılır. Yeniden
+  çalıştırmada yan dosyası olan ve özeti tutan bölümler atlanır; özeti
+  tutmayan (bozulmuş) ya da yan dosyası olmayan (yarım kalmış, henüz
+  kapanmamış gün) bölümler yeniden indirilir.
+
+Örnek:
+    python -m src.data.downloader BTCUSDT ETHUSDT --start 2023-01-01 --end 2023-02-01
+
+    from src.data.downloader import KlineDownloader
+
+    async with KlineDownloader.from_settings() as downloader:
+        report = await downloader.download(["BTCUSDT"], "2023-01-01", "2023-01-08")
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import hashlib
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from src.config.settings import get_settings
+from src.data.catalog import TimeBound, to_epoch
+from src.data.live_feed import CSV_COLUMNS
+from src.utils.logging import setup_logger
+from src.utils.time import timeframe_to_seconds
+
+LOGGER = setup_logger()
+
+CHECKSUM_SUFFIX = ".sha256"
+_RETRY_STATUS = {429, 418}
+
+
+@dataclass
+class DownloadReport:
+    """İndirme özeti; bölümler ``SYMBOL/timeframe/YYYY-MM-DD`` anahtarlarıyla listelenir."""
+
+    downloaded: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    repaired: List[str] = field(default_factory=list)
+    empty: List[str] = field(default_factory=list)
+    bars: int = 0
+    requests: int = 0
+    retries: int = 0
+    elapsed_seconds: float = 0.0
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def verify_partition(path: Path) -> Optional[bool]:
+    """Yan dosya yoksa ``None``, varsa bölüm özetinin tutup tutmadığı."""
+
+    sidecar = path.with_name(path.name + CHECKSUM_SUFFIX)
+    if not path.exists() or not sidecar.exists():
+        return None
+    expected = sidecar.read_text(encoding="ascii").split()[0]
+    return file_sha256(path) == expected
+
+
+class KlineDownloader:
+    """Havuzlu ``httpx.AsyncClient`` ile gün bölümlerini eşzamanlı indirir."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        base_url: str = "https://fapi.binance.com",
+        endpoint: str = "/fapi/v1/klines",
+        concurrency: int = 8,
+        limit: int = 1500,
+        max_weight_per_minute: int = 2400,
+        max_retries: int = 5,
+        timeout_seconds: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.root = Path(root).expanduser()
+        self.endpoint = endpoint
+        self.concurrency = max(1, int(concurrency))
+        self.limit = max(1, int(limit))
+        self.max_weight_per_minute = int(max_weight_per_minute)
+        self.max_retries = int(max_retries)
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout_seconds,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            transport=transport,
+        )
+        self._resume_at = 0.0
+        self._report = DownloadReport()
+
+    @classmethod
+    def from_settings(cls, **overrides: Any) -> "KlineDownloader":
+        cfg = get_settings().downloader
+        options: Dict[str, Any] = dict(
+            root=cfg.root,
+            base_url=cfg.base_url,
+            endpoint=cfg.endpoint,
+            concurrency=cfg.concurrency,
+            limit=cfg.limit,
+            max_weight_per_minute=cfg.max_weight_per_minute,
+            max_retries=cfg.max_retries,
+            timeout_seconds=cfg.timeout_seconds,
+        )
+        options.update(overrides)
+        return cls(options.pop("root"), **options)
+
+    async def __aenter__(self) -> "KlineDownloader":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def partition_path(self, symbol: str, timeframe: str, day: dt.date) -> Path:
+        return self.root / symbol / timeframe / f"{day.isoformat()}.csv"
+
+    async def download(
+        self,
+        symbols: Sequence[str],
+        start: TimeBound,
+        end: TimeBound,
+        timeframe: str = "1m",
+    ) -> DownloadReport:
+        """``[start, end)`` aralığındaki her UTC günü için eksik bölümleri indir."""
+
+        start_ts, end_ts = to_epoch(start), to_epoch(end)
+        if start_ts is None or end_ts is None or end_ts <= start_ts:
+            raise ValueError("Geçerli bir [start, end) aralığı verilmelidir.")
+        first = dt.datetime.fromtimestamp(start_ts, dt.timezone.utc).date()
+        last = dt.datetime.fromtimestamp(end_ts - 1, dt.timezone.utc).date()
+        days = [first + dt.timedelta(days=i) for i in range((last - first).days + 1)]
+        self._report = report = DownloadReport()
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(symbol: str, day: dt.date) -> None:
+            async with semaphore:
+                await self._download_partition(symbol, timeframe, day)
+
+        await asyncio.gather(*(run(symbol, day) for symbol in symbols for day in days))
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    async def _download_partition(self, symbol: str, timeframe: str, day: dt.date) -> None:
+        path = self.partition_path(symbol, timeframe, day)
+        key = f"{symbol}/{timeframe}/{day.isoformat()}"
+        status = verify_partition(path)
+        if status:
+            self._report.skipped.append(key)
+            return
+        step_ms = timeframe_to_seconds(timeframe) * 1000
+        day_start = int(dt.datetime.combine(day, dt.time(), tzinfo=dt.timezone.utc).timestamp()) * 1000
+        day_end = day_start + 86400 * 1000
+        rows: List[list] = []
+        cursor = day_start
+        while cursor < day_end:
+            page = await self._request(
+                {
+                    "symbol": symbol,
+                    "interval": timeframe,
+                    "startTime": cursor,
+                    "endTime": day_end - 1,
+                    "limit": self.limit,
+                }
+            )
+            page = [row for row in page if day_start <= int(row[0]) < day_end]
+            if not page:
+                break
+            rows.extend(page)
+            cursor = int(page[-1][0]) + step_ms
+        if not rows:
+            self._report.empty.append(key)
+            return
+        # Henüz kapanmamış gün özetsiz yazılır; sonraki çalıştırmada tamamlanır.
+        self._write_partition(path, rows, checksum=day_end <= time.time() * 1000)
+        self._report.bars += len(rows)
+        (self._report.repaired if status is False else self._report.downloaded).append(key)
+
+    async def _request(self, params: Dict[str, Any]) -> List[list]:
+        attempt = 0
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._report.requests += 1
+            try:
+                response = await self._client.get(self.endpoint, params=params)
+            except httpx.TransportError as exc:
+                if attempt >= self.max_retries:
+                    raise
+                error: str = repr(exc)
+                wait = 0.5 * 2**attempt
+            else:
+                self._observe_weight(response)
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code not in _RETRY_STATUS and response.status_code < 500:
+                    response.raise_for_status()
+                if attempt >= self.max_retries:
+                    response.raise_for_status()
+                error = f"HTTP {response.status_code}"
+                wait = _retry_after(response, default=0.5 * 2**attempt)
+                if response.status_code in _RETRY_STATUS:
+                    self._resume_at = max(self._resume_at, time.monotonic() + wait)
+            attempt += 1
+            self._report.retries += 1
+            LOGGER.warning(f"Kline isteği başarısız ({error}), {wait:.1f} sn sonra yeniden denenecek.\n")
+            await asyncio.sleep(wait)
+
+    def _observe_weight(self, response: httpx.Response) -> None:
+        used = response.headers.get("x-mbx-used-weight-1m")
+        if used is None or not used.isdigit():
+            return
+        if int(used) >= self.max_weight_per_minute * 0.9:
+            # Ağırlık penceresi dakika başında sıfırlanır.
+            wait = 60.0 - time.time() % 60.0
+            self._resume_at = max(self._resume_at, time.monotonic() + wait)
+
+    @staticmethod
+    def _write_partition(path: Path, rows: List[list], checksum: bool = True) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        lines = [",".join(CSV_COLUMNS)]
+        lines += [f"{int(row[0]) // 1000},{row[1]},{row[2]},{row[3]},{row[4]},{row[5]}" for row in rows]
+        tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        digest = file_sha256(tmp)
+        sidecar = path.with_name(path.name + CHECKSUM_SUFFIX)
+        sidecar.unlink(missing_ok=True)
+        os.replace(tmp, path)
+        if not checksum:
+            return
+        sidecar_tmp = sidecar.with_name(f".{sidecar.name}.{uuid.uuid4().hex}.tmp")
+        sidecar_tmp.write_text(f"{digest}  {path.name}\n", encoding="ascii")
+        os.replace(sidecar_tmp, sidecar)
+
+
+def _retry_after(response: httpx.Response, default: float) -> float:
+    value = response.headers.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value is not None else default
+    except ValueError:
+        return default
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Tarihsel klineları katalog düzenine indir.")
+    parser.add_argument("symbols", nargs="*", help="Semboller (boşsa runtime.symbol)")
+    parser.add_argument("--start", required=True, help="Başlangıç (ISO tarih, dahil)")
+    parser.add_argument("--end", required=True, help="Bitiş (ISO tarih, hariç)")
+    parser.add_argument("--timeframe", default=settings.runtime.timeframe)
+    parser.add_argument("--root", default=settings.downloader.root)
+    parser.add_argument("--concurrency", type=int, default=settings.downloader.concurrency)
+    args = parser.parse_args(argv)
+
+    async def run() -> DownloadReport:
+        async with KlineDownloader.from_settings(root=args.root, concurrency=args.concurrency) as downloader:
+            return await downloader.download(
+                args.symbols or [settings.runtime.symbol], args.start, args.end, args.timeframe
+            )
+
+    report = asyncio.run(run())
+    LOGGER.info(
+        f"{len(report.downloaded)} bölüm indirildi, {len(report.repaired)} onarıldı, "
+        f"{len(report.skipped)} atlandı; {report.bars} bar, {report.requests} istek, "
+        f"{report.retries} yeniden deneme, {report.elapsed_seconds:.1f} sn.\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
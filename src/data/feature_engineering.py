@@ -1,51 +1,398 @@
-"""Bar verilerinden özellik üreticileri."""
+"""Bar verilerinden özellik üreticileri.
+
+Özellikler bir kayıt defterinde (registry) tanımlanır. Her özellik ihtiyaç
+duyduğu ara sonuçları (getiriler, kapanışın hareketli ortalaması, true range,
+EMA'lar...) ``requires`` ile bildirir; motor seçilen özelliklerin ara
+sonuçlarını bağımlılık sırasıyla hesaplar ve her birini tek bir hesaplamada
+yalnızca bir kez üretir. Tüm göstergeler NumPy ile vektörel hesaplanır.
+
+Örnek:
+    from src.data.feature_engineering import available_features, compute_features
+
+    frame = compute_features(df)                                # ayardaki seçim
+    frame = compute_features(df, names=["return_1", "rsi_14"])  # açık seçim
+    print(available_features())
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
 
-_FEATURE_COLUMNS = [
+from src.config.settings import get_settings
+
+BASE_COLUMNS = ("open", "high", "low", "close", "volume")
+DEFAULT_FEATURES = (
     "return_1",
     "return_5",
     "return_10",
     "volatility_10",
     "sma_ratio",
     "volume_zscore",
-]
+)
+
+Arrays = Mapping[str, np.ndarray]
+
+
+@dataclass(frozen=True)
+class _Node:
+    name: str
+    requires: Tuple[str, ...]
+    func: Callable[[Arrays], np.ndarray]
+
+
+_INTERMEDIATES: Dict[str, _Node] = {}
+_FEATURES: Dict[str, _Node] = {}
+
+
+def intermediate(name: str, requires: Sequence[str]) -> Callable:
+    """Paylaşılan bir ara sonucu kaydeden dekoratör."""
+
+    def decorator(func: Callable[[Arrays], np.ndarray]) -> Callable[[Arrays], np.ndarray]:
+        _INTERMEDIATES[name] = _Node(name, tuple(requires), func)
+        return func
+
+    return decorator
+
+
+def feature(name: str, requires: Sequence[str]) -> Callable:
+    """Özellik vektörüne girebilecek bir özelliği kaydeden dekoratör."""
+
+    def decorator(func: Callable[[Arrays], np.ndarray]) -> Callable[[Arrays], np.ndarray]:
+        _FEATURES[name] = _Node(name, tuple(requires), func)
+        return func
+
+    return decorator
+
+
+def available_features() -> List[str]:
+    return list(_FEATURES)
+
+
+def feature_dependencies(names: Iterable[str]) -> List[str]:
+    """Seçili özelliklerin ara sonuçlarını bağımlılık (topolojik) sırasıyla döndür."""
+
+    order: List[str] = []
+    visiting: set[str] = set()
+
+    def visit(key: str) -> None:
+        if key in BASE_COLUMNS or key in order:
+            return
+        node = _INTERMEDIATES.get(key)
+        if node is None:
+            raise KeyError(f"Tanımsız ara sonuç: {key}")
+        if key in visiting:
+            raise ValueError(f"Döngüsel bağımlılık: {key}")
+        visiting.add(key)
+        for dep in node.requires:
+            visit(dep)
+        visiting.discard(key)
+        order.append(key)
+
+    for name in names:
+        if name not in _FEATURES:
+            raise KeyError(f"Tanımsız özellik: {name}")
+        for dep in _FEATURES[name].requires:
+            visit(dep)
+    return order
+
+
+def compute_feature_matrix(
+    arrays: Arrays,
+    names: Optional[Sequence[str]] = None,
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
+    """OHLCV dizilerinden (N, len(names)) özellik matrisi üret.
+
+    Tüm ara sonuçlar ``dtype`` ile hesaplanır; ``np.float32`` kompakt modun
+    yarı bellekli yoludur (sapma ``tests/test_compact.py`` içinde ölçülür).
+    """
+
+    names = _resolve_names(names)
+    values: Dict[str, np.ndarray] = {col: np.asarray(arrays[col], dtype=dtype) for col in BASE_COLUMNS}
+    for key in feature_dependencies(names):
+        node = _INTERMEDIATES[key]
+        values[key] = node.func(_Scope(values, node))
+    out = np.empty((len(values["close"]), len(names)), dtype=dtype)
+    for i, name in enumerate(names):
+        node = _FEATURES[name]
+        out[:, i] = node.func(_Scope(values, node))
+    return out
+
+
+def compute_features(df: pd.DataFrame, names: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """OHLCV çerçevesinden faktörleri üret.
+
+    ``names`` verilmezse ``features.names`` ayarındaki seçim kullanılır.
+    """
+
+    frame = _prepare(df)
+    names = _resolve_names(names)
+    arrays = {col: frame[col].to_numpy(dtype=np.float64) for col in BASE_COLUMNS}
+    return pd.DataFrame(compute_feature_matrix(arrays, names), columns=list(names), index=frame.index)
+
+
+class _Scope(Mapping[str, np.ndarray]):
+    """Bir düğümün yalnızca bildirdiği bağımlılıklara erişmesini sağlar."""
+
+    __slots__ = ("_values", "_node")
+
+    def __init__(self, values: Dict[str, np.ndarray], node: _Node) -> None:
+        self._values = values
+        self._node = node
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._node.requires:
+            raise KeyError(f"{self._node.name} '{key}' bağımlılığını bildirmedi.")
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._node.requires)
+
+    def __len__(self) -> int:
+        return len(self._node.requires)
+
+
+def _resolve_names(names: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    if names is None:
+        names = get_settings().features.names
+    return tuple(names)
 
 
 def _prepare(df: pd.DataFrame) -> pd.DataFrame:
-    required = {"open", "high", "low", "close", "volume"}
+    required = set(BASE_COLUMNS)
     missing = required.difference(df.columns)
     if missing:
         raise ValueError(f"Eksik sütunlar: {sorted(missing)}")
-    return df.copy()
+    return df
 
 
-def _rolling_zscore(series: pd.Series, window: int) -> pd.Series:
-    rolling = series.rolling(window=window)
-    mean = rolling.mean()
-    std = rolling.std(ddof=1)
-    z = (series - mean) / std
-    return z.replace([np.inf, -np.inf], 0.0).fillna(0.0)
+# --- NumPy yardımcıları -----------------------------------------------------
 
 
-def compute_features(df: pd.DataFrame) -> pd.DataFrame:
-    """OHLCV çerçevesinden temel faktörleri üret."""
+def _clean(values: np.ndarray, nan: float = 0.0) -> np.ndarray:
+    return np.nan_to_num(values, nan=nan, posinf=0.0, neginf=0.0)
 
-    frame = _prepare(df)
-    returns = frame["close"].pct_change().replace([np.inf, -np.inf], 0.0).fillna(0.0)
-    frame["return_1"] = returns
-    frame["return_5"] = frame["close"].pct_change(periods=5).replace([np.inf, -np.inf], 0.0).fillna(0.0)
-    frame["return_10"] = frame["close"].pct_change(periods=10).replace([np.inf, -np.inf], 0.0).fillna(0.0)
-    frame["volatility_10"] = (
-        returns.rolling(window=10).std(ddof=1).replace([np.inf, -np.inf], 0.0).fillna(0.0)
-    )
-    fast = frame["close"].rolling(window=5).mean()
-    slow = frame["close"].rolling(window=15).mean()
-    ratio = fast / slow
-    frame["sma_ratio"] = ratio.replace([np.inf, -np.inf], 0.0).fillna(1.0)
-    frame["volume_zscore"] = _rolling_zscore(frame["volume"], window=10)
-
-    return frame[_FEATURE_COLUMNS].fillna(0.0)
+
+def _pct_change(values: np.ndarray, periods: int) -> np.ndarray:
+    out = np.full(values.shape, np.nan, dtype=values.dtype)
+    if len(values) > periods:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[periods:] = values[periods:] / values[:-periods] - 1.0
+    return out
+
+
+def _rolling(values: np.ndarray, window: int, reducer: Callable[..., np.ndarray], **kwargs) -> np.ndarray:
+    out = np.full(values.shape, np.nan, dtype=values.dtype)
+    if len(values) >= window:
+        out[window - 1 :] = reducer(sliding_window_view(values, window), axis=1, **kwargs)
+    return out
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling(values, window, np.mean)
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    std = _rolling(values, window, np.std, ddof=1)
+    # Sabit pencerelerde kayan nokta artığını sıfıra yuvarla (pandas davranışı).
+    scale = np.abs(_rolling_mean(values, window))
+    std[std <= 1e-12 * np.maximum(scale, 1e-300)] = 0.0
+    return std
+
+
+def _ema(values: np.ndarray, alpha: float) -> np.ndarray:
+    """``adjust=False`` EMA; ilk değer seriyle başlatılır."""
+
+    if len(values) == 0:
+        return values.copy()
+    # Katsayılar girdinin tipinde verilir; aksi halde lfilter float64'e yükseltir.
+    dtype = values.dtype
+    zi = np.array([(1.0 - alpha) * values[0]], dtype=dtype)
+    out, _ = lfilter(np.array([alpha], dtype=dtype), np.array([1.0, -(1.0 - alpha)], dtype=dtype), values, zi=zi)
+    return out
+
+
+def _zscore(values: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _clean((values - mean) / std)
+
+
+# --- Ara sonuçlar -----------------------------------------------------------
+
+
+@intermediate("returns", requires=("close",))
+def _returns(v: Arrays) -> np.ndarray:
+    return _clean(_pct_change(v["close"], 1))
+
+
+@intermediate("returns_std_10", requires=("returns",))
+def _returns_std_10(v: Arrays) -> np.ndarray:
+    return _rolling_std(v["returns"], 10)
+
+
+@intermediate("close_sma_5", requires=("close",))
+def _close_sma_5(v: Arrays) -> np.ndarray:
+    return _rolling_mean(v["close"], 5)
+
+
+@intermediate("close_sma_15", requires=("close",))
+def _close_sma_15(v: Arrays) -> np.ndarray:
+    return _rolling_mean(v["close"], 15)
+
+
+@intermediate("close_sma_20", requires=("close",))
+def _close_sma_20(v: Arrays) -> np.ndarray:
+    return _rolling_mean(v["close"], 20)
+
+
+@intermediate("close_std_20", requires=("close",))
+def _close_std_20(v: Arrays) -> np.ndarray:
+    return _rolling_std(v["close"], 20)
+
+
+@intermediate("volume_mean_10", requires=("volume",))
+def _volume_mean_10(v: Arrays) -> np.ndarray:
+    return _rolling_mean(v["volume"], 10)
+
+
+@intermediate("volume_std_10", requires=("volume",))
+def _volume_std_10(v: Arrays) -> np.ndarray:
+    return _rolling_std(v["volume"], 10)
+
+
+@intermediate("true_range", requires=("high", "low", "close"))
+def _true_range(v: Arrays) -> np.ndarray:
+    high, low, close = v["high"], v["low"], v["close"]
+    prev_close = np.concatenate([close[:1], close[:-1]])
+    return np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+@intermediate("atr_14_raw", requires=("true_range",))
+def _atr_14(v: Arrays) -> np.ndarray:
+    return _ema(v["true_range"], 1.0 / 14)
+
+
+@intermediate("close_ema_12", requires=("close",))
+def _close_ema_12(v: Arrays) -> np.ndarray:
+    return _ema(v["close"], 2.0 / 13)
+
+
+@intermediate("close_ema_26", requires=("close",))
+def _close_ema_26(v: Arrays) -> np.ndarray:
+    return _ema(v["close"], 2.0 / 27)
+
+
+@intermediate("macd_line", requires=("close_ema_12", "close_ema_26"))
+def _macd_line(v: Arrays) -> np.ndarray:
+    return v["close_ema_12"] - v["close_ema_26"]
+
+
+@intermediate("macd_signal_line", requires=("macd_line",))
+def _macd_signal_line(v: Arrays) -> np.ndarray:
+    return _ema(v["macd_line"], 2.0 / 10)
+
+
+@intermediate("rsi_14_raw", requires=("close",))
+def _rsi_14_raw(v: Arrays) -> np.ndarray:
+    diff = np.diff(v["close"], prepend=v["close"][:1])
+    gain = _ema(np.maximum(diff, 0.0), 1.0 / 14)
+    loss = _ema(np.maximum(-diff, 0.0), 1.0 / 14)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+    rsi[(loss == 0) & (gain > 0)] = 100.0
+    rsi[(loss == 0) & (gain == 0)] = 50.0
+    return rsi
+
+
+@intermediate("obv", requires=("close", "volume"))
+def _obv(v: Arrays) -> np.ndarray:
+    direction = np.sign(np.diff(v["close"], prepend=v["close"][:1]))
+    return np.cumsum(direction * v["volume"])
+
+
+# --- Özellikler -------------------------------------------------------------
+
+
+@feature("return_1", requires=("returns",))
+def _return_1(v: Arrays) -> np.ndarray:
+    return v["returns"]
+
+
+@feature("return_5", requires=("close",))
+def _return_5(v: Arrays) -> np.ndarray:
+    return _clean(_pct_change(v["close"], 5))
+
+
+@feature("return_10", requires=("close",))
+def _return_10(v: Arrays) -> np.ndarray:
+    return _clean(_pct_change(v["close"], 10))
+
+
+@feature("volatility_10", requires=("returns_std_10",))
+def _volatility_10(v: Arrays) -> np.ndarray:
+    return _clean(v["returns_std_10"])
+
+
+@feature("sma_ratio", requires=("close_sma_5", "close_sma_15"))
+def _sma_ratio(v: Arrays) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _clean(v["close_sma_5"] / v["close_sma_15"], nan=1.0)
+
+
+@feature("volume_zscore", requires=("volume", "volume_mean_10", "volume_std_10"))
+def _volume_zscore(v: Arrays) -> np.ndarray:
+    return _zscore(v["volume"], v["volume_mean_10"], v["volume_std_10"])
+
+
+@feature("rsi_14", requires=("rsi_14_raw",))
+def _rsi_14(v: Arrays) -> np.ndarray:
+    return _clean(v["rsi_14_raw"] / 100.0 - 0.5)
+
+
+@feature("atr_14", requires=("atr_14_raw", "close"))
+def _atr_14_ratio(v: Arrays) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _clean(v["atr_14_raw"] / v["close"])
+
+
+@feature("macd", requires=("macd_line", "close"))
+def _macd(v: Arrays) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _clean(v["macd_line"] / v["close"])
+
+
+@feature("macd_signal", requires=("macd_signal_line", "close"))
+def _macd_signal(v: Arrays) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _clean(v["macd_signal_line"] / v["close"])
+
+
+@feature("macd_hist", requires=("macd_line", "macd_signal_line", "close"))
+def _macd_hist(v: Arrays) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _clean((v["macd_line"] - v["macd_signal_line"]) / v["close"])
+
+
+@feature("bb_percent_b", requires=("close", "close_sma_20", "close_std_20"))
+def _bb_percent_b(v: Arrays) -> np.ndarray:
+    lower = v["close_sma_20"] - 2.0 * v["close_std_20"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _clean((v["close"] - lower) / (4.0 * v["close_std_20"]), nan=0.5)
+
+
+@feature("bb_width", requires=("close_sma_20", "close_std_20"))
+def _bb_width(v: Arrays) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _clean(4.0 * v["close_std_20"] / v["close_sma_20"])
+
+
+@feature("obv_zscore", requires=("obv",))
+def _obv_zscore(v: Arrays) -> np.ndarray:
+    obv = v["obv"]
+    return _zscore(obv, _rolling_mean(obv, 20), _rolling_std(obv, 20))
@@ -0,0 +1,198 @@
+"""Kalıcı, bellek eşlemeli özellik deposu.
+
+Aynı geçmiş üzerinde tekrarlanan backtest/replay çalışmaları aynı özellik
+matrisini yeniden hesaplar. ``FeatureStore`` hesaplanmış matrisleri
+``<root>/<anahtar>.npy`` olarak saklar ve ``np.load(mmap_mode="r")`` ile
+kopyasız açar. Anahtar iki özetin birleşimidir:
+
+* veri özeti: OHLCV dizilerinin baytları (ve uzunluğu),
+* tanım özeti: ``FEATURES_VERSION``, seçili özellik adları, özellik modülünün
+  kaynağı ve seçimde kullanılan her düğüm fonksiyonunun kaynağı (pencereler
+  kaynakta sabit olduğundan bir pencere değişikliği de anahtarı değiştirir).
+
+Toplam boyut ``max_bytes``'ı aşınca en uzun süredir kullanılmayan dosyalar
+silinir (LRU; erişim zamanı dosya ``mtime``'ında tutulur).
+
+Örnek:
+    from src.data.feature_store import FeatureStore
+
+    store = FeatureStore("runs/feature_store", max_bytes=2 * 1024**3)
+    features = store.get_or_compute(arrays)  # ilk çağrı hesaplar, sonrakiler diskten eşler
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import sys
+import uuid
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.config.settings import FeatureStoreConfig, get_settings
+from src.data import feature_engineering as fe
+
+FEATURES_VERSION = 1
+
+
+def data_hash(arrays: Mapping[str, np.ndarray]) -> str:
+    """OHLCV dizilerinin içerik özeti."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for column in fe.BASE_COLUMNS:
+        values = np.ascontiguousarray(arrays[column], dtype=np.float64)
+        digest.update(column.encode("ascii"))
+        digest.update(len(values).to_bytes(8, "little"))
+        digest.update(memoryview(values).cast("B"))
+    return digest.hexdigest()
+
+
+def definition_hash(names: Optional[Sequence[str]] = None) -> str:
+    """Seçili özelliklerin tanım özeti (sürüm, adlar, modül ve düğüm kaynakları)."""
+
+    names = fe._resolve_names(names)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{FEATURES_VERSION}|{','.join(names)}|{np.__version__}".encode("utf-8"))
+    digest.update(_module_source_digest(fe.__name__))
+    nodes = [fe._INTERMEDIATES[key] for key in fe.feature_dependencies(names)]
+    nodes += [fe._FEATURES[name] for name in names]
+    for node in nodes:
+        digest.update(f"{node.name}|{','.join(node.requires)}|".encode("utf-8"))
+        digest.update(_source(node.func).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class FeatureStore:
+    """Özellik matrislerini diskte saklayan, boyuta göre LRU budanan depo."""
+
+    def __init__(self, root: str | Path, max_bytes: int = 2 * 1024**3) -> None:
+        self.root = Path(root).expanduser()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: FeatureStoreConfig) -> "FeatureStore":
+        return cls(config.root, max_bytes=config.max_bytes)
+
+    def key(self, arrays: Mapping[str, np.ndarray], names: Optional[Sequence[str]] = None) -> str:
+        return f"{data_hash(arrays)}-{definition_hash(names)}"
+
+    def path(self, key: str) -> Path:
+        return self.root / f"{key}.npy"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Kayıtlı matrisi salt okunur bellek eşlemesiyle aç; yoksa ``None``."""
+
+        path = self.path(key)
+        try:
+            matrix = np.load(path, mmap_mode="r")
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        os.utime(path)
+        return matrix
+
+    def put(self, key: str, matrix: np.ndarray) -> np.ndarray:
+        """Matrisi atomik olarak yaz, gerekirse budayıp eşlenmiş halini döndür."""
+
+        path = self.path(key)
+        tmp = path.with_name(f".{path.stem}.{uuid.uuid4().hex}.tmp.npy")
+        np.save(tmp, np.ascontiguousarray(matrix))
+        os.replace(tmp, path)
+        self.evict(keep=path)
+        return np.load(path, mmap_mode="r")
+
+    def get_or_compute(self, arrays: Mapping[str, np.ndarray], names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Depoda varsa eşle, yoksa ``compute_feature_matrix`` ile hesaplayıp kaydet."""
+
+        names = fe._resolve_names(names)
+        key = self.key(arrays, names)
+        cached = self.get(key)
+        if cached is not None and cached.shape == (len(arrays["close"]), len(names)):
+            self.hits += 1
+            return cached
+        self.misses += 1
+        return self.put(key, fe.compute_feature_matrix(arrays, names))
+
+    def entries(self) -> List[Tuple[Path, int, float]]:
+        """``(yol, boyut, son erişim)`` listesi, en eski erişim başta."""
+
+        items = []
+        for path in self.root.glob("*.npy"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            items.append((path, stat.st_size, stat.st_mtime))
+        items.sort(key=lambda item: item[2])
+        return items
+
+    def total_bytes(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: Optional[Path] = None) -> List[Path]:
+        """Toplam boyut ``max_bytes`` altına inene kadar en eski dosyaları sil."""
+
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed: List[Path] = []
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed.append(path)
+        return removed
+
+
+def cached_feature_matrix(
+    arrays: Mapping[str, np.ndarray],
+    names: Optional[Sequence[str]] = None,
+    store: Optional[FeatureStore] = None,
+) -> np.ndarray:
+    """``feature_store.enabled`` açıksa (ya da ``store`` verilirse) depodan, değilse doğrudan hesapla."""
+
+    if store is None:
+        config = get_settings().feature_store
+        if not config.enabled:
+            return fe.compute_feature_matrix(arrays, names)
+        store = _default_store(config)
+    return store.get_or_compute(arrays, names)
+
+
+_STORES: Dict[Tuple[str, int], FeatureStore] = {}
+
+
+def _default_store(config: FeatureStoreConfig) -> FeatureStore:
+    key = (config.root, config.max_bytes)
+    if key not in _STORES:
+        _STORES[key] = FeatureStore.from_config(config)
+    return _STORES[key]
+
+
+def _source(func) -> str:
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return getattr(func, "__qualname__", repr(func))
+
+
+_MODULE_DIGESTS: Dict[str, bytes] = {}
+
+
+def _module_source_digest(module_name: str) -> bytes:
+    if module_name not in _MODULE_DIGESTS:
+        module = sys.modules[module_name]
+        _MODULE_DIGESTS[module_name] = hashlib.blake2b(_source(module).encode("utf-8"), digest_size=16).digest()
+    return _MODULE_DIGESTS[module_name]
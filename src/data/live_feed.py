@@ -1,18 +1,38 @@
-"""Gerçek ve sentetik veri akışlarını sağlayan yardımcılar."""
+"""Gerçek ve sentetik veri akışlarını sağlayan yardımcılar.
+
+``TailCSVFeed`` çalışma sırasında sonuna kapanmış kline eklenen bir CSV'yi
+izler (``follow`` modu): dosya tanıtıcısı açık kalır, bayt konumu saklanır ve
+yalnızca yeni eklenen tam satırlar çözülür. Yarım kalan son satır bir sonraki
+okumaya kadar tamponda bekler; dosya döndürülür (inode değişir) ya da
+kısaltılırsa yeni içerik baştan, başlık satırıyla birlikte okunur. Veri
+gelmedikçe bekleme süresi ``poll_min_seconds``'tan ``poll_max_seconds``'a
+kadar ikiye katlanır, yeni veri gelince en kısa süreye döner. ``ticks_path``
+verilirse ``timestamp,price`` işlem dosyası aynı şekilde izlenir ve
+``stream_ticks`` her tick'i dosyadan okunduğu anın damgasıyla yayınlar.
+
+Örnek:
+    from src.data.live_feed import HistoricalCSVFeedConfig, TailCSVFeed
+
+    feed = TailCSVFeed(HistoricalCSVFeedConfig(path="data/live.csv", follow=True))
+    async for bar in feed.stream_klines():
+        ...
+"""
 
 from __future__ import annotations
 
 import asyncio
 import csv
+import os
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass
-from typing import AsyncIterator, Iterable, Optional
+from typing import AsyncIterator, BinaryIO, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 import numpy as np
 
 from src.config.settings import get_settings
-from src.utils.time import utc_timestamp
+from src.utils.time import Clock, get_clock, timeframe_to_seconds
 from src.utils.types import BarData
 
 
@@ -21,6 +41,7 @@ class LiveFeedConfig:
     symbol: str
     seed: Optional[int] = None
     delay_seconds: float = 0.0
+    interval_seconds: Optional[float] = None
 
 
 @dataclass(slots=True)
@@ -30,27 +51,41 @@ class HistoricalCSVFeedConfig:
     path: str
     timestamp_format: Optional[str] = None
     delay_seconds: float = 0.0
+    follow: bool = False
+    poll_min_seconds: float = 0.05
+    poll_max_seconds: float = 1.0
+    idle_timeout_seconds: Optional[float] = None
+    ticks_path: Optional[str] = None
 
 
 class BinanceLiveFeed:
     """Gerçek zamanlı borsayı taklit eden basit akış."""
 
-    def __init__(self, config: LiveFeedConfig | None = None) -> None:
+    def __init__(self, config: LiveFeedConfig | None = None, clock: Optional[Clock] = None) -> None:
         settings = get_settings()
         if config is None:
             config = LiveFeedConfig(symbol=settings.runtime.symbol)
         self.config = config
+        self._clock = clock
+        self._interval = config.interval_seconds or timeframe_to_seconds(settings.runtime.timeframe)
         self._rng = np.random.default_rng(config.seed)
         self._last_price = 100.0
 
     async def stream_klines(self) -> AsyncIterator[BarData]:
-        """Sonsuz bar akışı üret."""
+        """Sonsuz bar akışı üret.
 
+        Her bar saat üzerinde bir zaman dilimi kadar yer kaplar: sanal saatte
+        anında, ölçekli saatte hız çarpanına göre ilerlenir.
+        """
+
+        clock = self._clock or get_clock()
         delay = max(0.0, self.config.delay_seconds)
         while True:
-            yield self._next_bar()
+            bar = self._next_bar(int(clock.now()))
+            yield bar
+            await clock.advance_to(bar.timestamp + self._interval)
             if delay:
-                await asyncio.sleep(delay)
+                await clock.sleep(delay)
 
     def prime(self, prices: Iterable[float]) -> None:
         """Testler için başlangıç fiyat serisini yükle."""
@@ -59,7 +94,7 @@ class BinanceLiveFeed:
         if prices:
             self._last_price = float(prices[-1])
 
-    def _next_bar(self) -> BarData:
+    def _next_bar(self, timestamp: int) -> BarData:
         drift = 0.0005
         shock = float(self._rng.normal(0.0, 0.002))
         close = max(1e-3, self._last_price * (1 + drift + shock))
@@ -67,7 +102,7 @@ class BinanceLiveFeed:
         low = min(self._last_price, close) * (1 - abs(float(self._rng.normal(0.0, 0.0007))))
         volume = float(abs(self._rng.normal(1.0, 0.2)))
         bar = BarData(
-            timestamp=utc_timestamp(),
+            timestamp=timestamp,
             open=self._last_price,
             high=max(high, close),
             low=min(low, close),
@@ -81,50 +116,35 @@ class BinanceLiveFeed:
 class HistoricalCSVFeed:
     """Yerel CSV dosyasından gerçek OHLCV barlarını yayınla."""
 
-    def __init__(self, config: HistoricalCSVFeedConfig) -> None:
+    def __init__(self, config: HistoricalCSVFeedConfig, clock: Optional[Clock] = None) -> None:
         self.config = config
+        self._clock = clock
         self._bars = self._load_bars(self._resolve_path(config.path))
 
+    @property
+    def bars(self) -> list[BarData]:
+        """Yüklenmiş barların tamamı (offline değerlendirme için)."""
+
+        return self._bars
+
     async def stream_klines(self) -> AsyncIterator[BarData]:
+        clock = self._clock or get_clock()
         delay = max(0.0, self.config.delay_seconds)
         for bar in self._bars:
+            await clock.advance_to(bar.timestamp)
             yield bar
             if delay:
-                await asyncio.sleep(delay)
+                await clock.sleep(delay)
 
     def _resolve_path(self, raw_path: str) -> Path:
-        path = Path(raw_path).expanduser()
-        if not path.is_absolute():
-            path = Path.cwd() / path
-        return path
+        return _resolve_path(raw_path)
 
     def _load_bars(self, path: Path) -> list[BarData]:
         if not path.exists():
             raise FileNotFoundError(f"CSV veri kaynağı bulunamadı: {path}")
 
         with path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            if reader.fieldnames is None:
-                raise ValueError("CSV dosyasında başlık satırı bulunamadı.")
-
-            required = {"timestamp", "open", "high", "low", "close", "volume"}
-            missing = required.difference(reader.fieldnames)
-            if missing:
-                raise ValueError(f"CSV dosyasında eksik sütun(lar): {', '.join(sorted(missing))}")
-
-            bars: list[BarData] = []
-            for row in reader:
-                timestamp = self._parse_timestamp(row["timestamp"])
-                bars.append(
-                    BarData(
-                        timestamp=timestamp,
-                        open=float(row["open"]),
-                        high=float(row["high"]),
-                        low=float(row["low"]),
-                        close=float(row["close"]),
-                        volume=float(row["volume"]),
-                    )
-                )
+            bars = list(read_csv_bars(handle, self.config.timestamp_format))
 
         if not bars:
             raise ValueError("CSV dosyası boş görünüyor; yayınlanacak bar yok.")
@@ -132,22 +152,265 @@ class HistoricalCSVFeed:
         return bars
 
     def _parse_timestamp(self, value: str) -> int:
-        value = value.strip()
-        if not value:
-            raise ValueError("Zaman damgası boş olamaz.")
+        return parse_timestamp(value, self.config.timestamp_format)
+
+
+class _CSVTail:
+    """Sonuna satır eklenen başlıklı bir CSV'yi bayt konumundan izler.
+
+    ``poll`` yalnızca yeni eklenen tam satırları ``columns`` sırasına
+    yansıtılmış alan listeleri olarak döndürür; yarım son satır tamponda
+    bekler. Dosya döndürülür (inode değişir) ya da kısaltılırsa yeni içerik
+    baştan, başlık satırıyla birlikte okunur.
+    """
+
+    def __init__(self, path: Path, columns: Tuple[str, ...]) -> None:
+        self.path = path
+        self.columns = columns
+        self._handle: Optional[BinaryIO] = None
+        self._inode: Optional[Tuple[int, int]] = None
+        self._offset = 0
+        self._partial = b""
+        self._indices: Optional[Tuple[int, ...]] = None
+        self.rotations = 0
+
+    @property
+    def offset(self) -> int:
+        return self._offset - len(self._partial)
+
+    def poll(self) -> List[List[str]]:
+        if self._handle is None and not self._open():
+            return []
+        rows = self._check_replaced()
+        rows.extend(self._read_rows())
+        return rows
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _open(self) -> bool:
+        try:
+            handle = self.path.open("rb")
+        except FileNotFoundError:
+            return False
+        stat = os.fstat(handle.fileno())
+        self._handle = handle
+        self._inode = (stat.st_dev, stat.st_ino)
+        self._offset = 0
+        self._partial = b""
+        self._indices = None
+        return True
+
+    def _read_rows(self) -> List[List[str]]:
+        data = self._handle.read()
+        if not data:
+            return []
+        self._offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        rows: List[List[str]] = []
+        for row in csv.reader(line.decode("utf-8") for line in lines if line.strip()):
+            if self._indices is None:
+                self._indices = _column_indices([name.strip() for name in row], self.columns)
+                continue
+            rows.append([row[i] for i in self._indices])
+        return rows
+
+    def _check_replaced(self) -> List[List[str]]:
+        """Dosya döndürüldüyse ya da kısaltıldıysa yeni içeriğe baştan geç."""
+
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []  # Döndürme sırasında yeni dosya henüz oluşmadı; eskisini okumaya devam et.
+        if (stat.st_dev, stat.st_ino) != self._inode:
+            # Eski dosyaya son anda eklenenleri kaçırmamak için önce onu sonuna kadar oku.
+            rows = self._read_rows()
+            self.close()
+            self.rotations += 1
+            self._open()
+            return rows
+        if stat.st_size < self._offset:
+            self._handle.seek(0)
+            self.rotations += 1
+            self._offset = 0
+            self._partial = b""
+            self._indices = None
+        return []
+
+
+class TailCSVFeed:
+    """Sonuna satır eklenen CSV dosyasını izleyip yalnızca yeni barları yayınla.
+
+    ``idle_timeout_seconds`` verilirse o kadar süre yeni satır gelmediğinde
+    akış biter; aksi halde süresiz bekler. ``ticks_path`` verilirse
+    ``stream_ticks`` aynı şekilde izlenen ``timestamp,price`` işlem dosyasından
+    bar içi fiyatları yayınlar (``IntrabarGuard`` için).
+    """
+
+    def __init__(self, config: HistoricalCSVFeedConfig, clock: Optional[Clock] = None) -> None:
+        self.config = config
+        self.path = _resolve_path(config.path)
+        self._clock = clock
+        self._tail = _CSVTail(self.path, CSV_COLUMNS)
+        self._pending: List[BarData] = []
+
+    @property
+    def offset(self) -> int:
+        """Çözülmüş (tam satır) içeriğin bittiği bayt konumu."""
+
+        return self._tail.offset
+
+    @property
+    def rotations(self) -> int:
+        return self._tail.rotations
+
+    @property
+    def ticks_enabled(self) -> bool:
+        return self.config.ticks_path is not None
+
+    def qsize(self) -> int:
+        return len(self._pending)
+
+    def poll(self) -> List[BarData]:
+        """Son okumadan bu yana eklenen tam satırları çöz."""
+
+        fmt = self.config.timestamp_format
+        return [
+            BarData(parse_timestamp(ts, fmt), float(o), float(h), float(l), float(c), float(v))
+            for ts, o, h, l, c, v in self._tail.poll()
+        ]
+
+    async def stream_klines(self) -> AsyncIterator[BarData]:
+        clock = self._clock or get_clock()
+        delay = max(0.0, self.config.delay_seconds)
+        try:
+            async for _ in self._wait_for_data(lambda: bool(self._pending or self._refill())):
+                bars, self._pending = self._pending, []
+                for bar in bars:
+                    await clock.advance_to(bar.timestamp)
+                    yield bar
+                    if delay:
+                        await clock.sleep(delay)
+        finally:
+            self.close()
+
+    async def stream_ticks(self) -> AsyncIterator[Tuple[float, float, int]]:
+        """``(timestamp, price, received_ns)`` tick akışı.
+
+        ``received_ns`` satırların dosyadan okunduğu andaki
+        ``time.perf_counter_ns()`` değeridir; tüketici tick'ten aksiyona
+        gecikmeyi bu damgadan ölçer.
+        """
+
+        if self.config.ticks_path is None:
+            return
+        tail = _CSVTail(_resolve_path(self.config.ticks_path), TICK_COLUMNS)
+        rows: List[List[str]] = []
+
+        def refill() -> bool:
+            rows.extend(tail.poll())
+            return bool(rows)
+
+        fmt = self.config.timestamp_format
+        try:
+            async for _ in self._wait_for_data(refill):
+                received_ns = time.perf_counter_ns()
+                batch = rows[:]
+                rows.clear()
+                for ts, price in batch:
+                    yield parse_timestamp(ts, fmt), float(price), received_ns
+        finally:
+            tail.close()
+
+    def close(self) -> None:
+        self._tail.close()
+
+    def _refill(self) -> bool:
+        self._pending = self.poll()
+        return bool(self._pending)
+
+    async def _wait_for_data(self, ready) -> AsyncIterator[None]:
+        """``ready()`` doğru oldukça bir kez üret; veri yokken artan aralıklarla bekle."""
+
+        poll_min = max(1e-3, self.config.poll_min_seconds)
+        poll_max = max(poll_min, self.config.poll_max_seconds)
+        timeout = self.config.idle_timeout_seconds
+        backoff = poll_min
+        last_data = time.monotonic()
+        while True:
+            if not ready():
+                if timeout is not None and time.monotonic() - last_data >= timeout:
+                    return
+                await asyncio.sleep(backoff)
+                backoff = min(poll_max, backoff * 2)
+                continue
+            backoff = poll_min
+            last_data = time.monotonic()
+            yield
+
+
+CSV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+TICK_COLUMNS = ("timestamp", "price")
+
+
+def _resolve_path(raw_path: str) -> Path:
+    path = Path(raw_path).expanduser()
+    if not path.is_absolute():
+        path = Path.cwd() / path
+    return path
+
+
+def _column_indices(fieldnames: List[str], columns: Tuple[str, ...] = CSV_COLUMNS) -> Tuple[int, ...]:
+    missing = set(columns).difference(fieldnames)
+    if missing:
+        raise ValueError(f"CSV dosyasında eksik sütun(lar): {', '.join(sorted(missing))}")
+    return tuple(fieldnames.index(name) for name in columns)
+
+
+def read_csv_bars(handle: TextIO, timestamp_format: Optional[str] = None) -> Iterator[BarData]:
+    """Başlıklı OHLCV CSV akışını satır satır ``BarData``'ya çevir."""
+
+    reader = csv.DictReader(handle)
+    if reader.fieldnames is None:
+        raise ValueError("CSV dosyasında başlık satırı bulunamadı.")
+
+    missing = set(CSV_COLUMNS).difference(reader.fieldnames)
+    if missing:
+        raise ValueError(f"CSV dosyasında eksik sütun(lar): {', '.join(sorted(missing))}")
+
+    for row in reader:
+        yield BarData(
+            timestamp=parse_timestamp(row["timestamp"], timestamp_format),
+            open=float(row["open"]),
+            high=float(row["high"]),
+            low=float(row["low"]),
+            close=float(row["close"]),
+            volume=float(row["volume"]),
+        )
+
+
+def parse_timestamp(value: str, timestamp_format: Optional[str] = None) -> int:
+    """Epoch saniyesi, ondalıklı epoch ya da ISO-8601 zaman damgasını çözümle."""
+
+    value = value.strip()
+    if not value:
+        raise ValueError("Zaman damgası boş olamaz.")
 
-        if self.config.timestamp_format:
-            dt = datetime.strptime(value, self.config.timestamp_format)
-            return int(dt.timestamp())
+    if timestamp_format:
+        dt = datetime.strptime(value, timestamp_format)
+        return int(dt.timestamp())
 
-        if value.isdigit():
-            return int(value)
+    if value.isdigit():
+        return int(value)
 
+    try:
+        return int(float(value))
+    except ValueError:
         try:
-            return int(float(value))
-        except ValueError:
-            try:
-                dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-            except ValueError as exc:
-                raise ValueError(f"Zaman damgası çözümlenemedi: {value!r}") from exc
-            return int(dt.timestamp())
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError as exc:
+            raise ValueError(f"Zaman damgası çözümlenemedi: {value!r}") from exc
+        return int(dt.timestamp())
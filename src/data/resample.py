@@ -0,0 +1,149 @@
+"""Akış halinde çoklu zaman dilimi bar birleştirici.
+
+Temel zaman dilimindeki (ör. 1m) her bar geldiğinde 5m/15m/1h/4h gibi üst
+zaman dilimlerinin oluşmakta olan (kısmi) barları O(1) işlemle güncellenir;
+bir üst bar tamamlandığında sınırlı uzunluktaki geçmişe taşınır. Pandas ile
+yeniden örnekleme gerekmez.
+
+Örnek:
+    from src.data.resample import MultiTimeframeAggregator, ResampledFeed
+
+    aggregator = MultiTimeframeAggregator(("5m", "1h"))
+    feed = ResampledFeed(HistoricalCSVFeed(config), aggregator)
+    async for bar in feed.stream_klines():
+        hourly = aggregator.partial("1h")
+        extra = aggregator.feature_vector()
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.config.settings import get_settings
+from src.utils.time import timeframe_to_seconds
+from src.utils.types import BarData
+
+DEFAULT_TIMEFRAMES = ("5m", "15m", "1h", "4h")
+FEATURES_PER_TIMEFRAME = ("partial_return", "range_position", "closed_return")
+
+
+class _TimeframeState:
+    __slots__ = ("seconds", "partial", "bucket_end", "closed")
+
+    def __init__(self, seconds: int, history: int) -> None:
+        self.seconds = seconds
+        self.partial: Optional[BarData] = None
+        self.bucket_end = 0
+        self.closed: Deque[BarData] = deque(maxlen=history)
+
+
+class MultiTimeframeAggregator:
+    """Üst zaman dilimi OHLCV barlarını artımlı olarak tutar."""
+
+    def __init__(
+        self,
+        timeframes: Iterable[str] = DEFAULT_TIMEFRAMES,
+        history: int = 200,
+        base_interval_seconds: Optional[int] = None,
+    ) -> None:
+        if base_interval_seconds is None:
+            base_interval_seconds = timeframe_to_seconds(get_settings().runtime.timeframe)
+        self.base_interval = base_interval_seconds
+        self.timeframes = tuple(timeframes)
+        self._states: Dict[str, _TimeframeState] = {}
+        for tf in self.timeframes:
+            seconds = timeframe_to_seconds(tf)
+            if seconds < base_interval_seconds or seconds % base_interval_seconds:
+                raise ValueError(f"{tf} temel zaman diliminin tam katı olmalıdır.")
+            self._states[tf] = _TimeframeState(seconds, history)
+        self._features = np.zeros(len(self.timeframes) * len(FEATURES_PER_TIMEFRAME), dtype=np.float64)
+
+    def update(self, bar: BarData) -> List[str]:
+        """Barı tüm zaman dilimlerine işle; bu barla kapanan zaman dilimlerini döndür."""
+
+        closed_now: List[str] = []
+        for tf, state in self._states.items():
+            partial = state.partial
+            if partial is not None and bar.timestamp >= state.bucket_end:
+                state.closed.append(partial)
+                partial = state.partial = None
+                closed_now.append(tf)
+            if partial is None:
+                start = bar.timestamp - bar.timestamp % state.seconds
+                state.bucket_end = start + state.seconds
+                partial = state.partial = BarData(
+                    timestamp=start,
+                    open=bar.open,
+                    high=bar.high,
+                    low=bar.low,
+                    close=bar.close,
+                    volume=bar.volume,
+                )
+            else:
+                if bar.high > partial.high:
+                    partial.high = bar.high
+                if bar.low < partial.low:
+                    partial.low = bar.low
+                partial.close = bar.close
+                partial.volume += bar.volume
+            if bar.timestamp + self.base_interval >= state.bucket_end:
+                state.closed.append(partial)
+                state.partial = None
+                closed_now.append(tf)
+        return closed_now
+
+    def partial(self, timeframe: str) -> Optional[BarData]:
+        """Oluşmakta olan (henüz kapanmamış) bar."""
+
+        return self._states[timeframe].partial
+
+    def closed(self, timeframe: str) -> Deque[BarData]:
+        """Kapanmış barlar, eskiden yeniye."""
+
+        return self._states[timeframe].closed
+
+    def last_closed(self, timeframe: str) -> Optional[BarData]:
+        closed = self._states[timeframe].closed
+        return closed[-1] if closed else None
+
+    def feature_names(self) -> List[str]:
+        return [f"{tf}_{name}" for tf in self.timeframes for name in FEATURES_PER_TIMEFRAME]
+
+    def feature_vector(self) -> np.ndarray:
+        """Her zaman dilimi için kısmi getiri, aralık içi konum ve son kapanan bar getirisi.
+
+        Kısmi bar yoksa (bar az önce kapandıysa) son kapanan bar kullanılır.
+        Dönen dizi yeniden kullanılan tampondur; saklanacaksa kopyalanmalıdır.
+        """
+
+        out = self._features
+        width = len(FEATURES_PER_TIMEFRAME)
+        for i, state in enumerate(self._states.values()):
+            closed = state.closed
+            current = state.partial or (closed[-1] if closed else None)
+            base = i * width
+            if current is None:
+                out[base : base + width] = 0.0
+                continue
+            out[base] = current.close / current.open - 1.0 if current.open else 0.0
+            span = current.high - current.low
+            out[base + 1] = (current.close - current.low) / span if span > 0 else 0.5
+            last = closed[-1] if closed else None
+            out[base + 2] = last.close / last.open - 1.0 if last is not None and last.open else 0.0
+        return out
+
+
+class ResampledFeed:
+    """Bir akışı sarmalayıp her barı yayınlamadan önce birleştiriciye işler."""
+
+    def __init__(self, feed: Any, aggregator: MultiTimeframeAggregator) -> None:
+        self.feed = feed
+        self.aggregator = aggregator
+
+    async def stream_klines(self) -> AsyncIterator[BarData]:
+        async for bar in self.feed.stream_klines():
+            self.aggregator.update(bar)
+            yield bar
@@ -0,0 +1,171 @@
+"""Süreçler arası paylaşımlı bellek bar halkası.
+
+``BarRing`` tek yazar/tek okur halka tamponudur: ``multiprocessing.shared_memory``
+üzerindeki bir başlık (yazma/okuma sıraları, kapanış bayrağı) ve
+``capacity x 6`` float64 bar yuvasından oluşur. Yazar önce yuvayı, sonra yazma
+sırasını günceller; okur yalnızca yayınlanmış sıraya kadar okur. Okuma sırası
+da paylaşımlı bellekte tutulduğundan çöken bir okurun yerine başlatılan süreç
+kaldığı yerden devam eder. Veriler pickle edilmeden NumPy görünümleriyle
+okunur.
+
+Örnek:
+    from src.data.shm_ring import BarRing, ShmRingFeed
+
+    ring = BarRing.create(capacity=4096)          # ingest süreci
+    ring.write(bar)
+    ...
+    reader = BarRing.attach(ring.name)            # işçi süreç
+    async for bar in ShmRingFeed(reader).stream_klines():
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from multiprocessing import shared_memory
+from typing import AsyncIterator, Optional
+
+import numpy as np
+
+from src.utils.time import Clock, get_clock
+from src.utils.types import BarData
+
+# Başlık: [write_seq, read_seq, closed, capacity]
+_HEADER_FIELDS = 4
+_WRITE, _READ, _CLOSED, _CAPACITY = range(_HEADER_FIELDS)
+BAR_FIELDS = 6  # timestamp, open, high, low, close, volume
+
+
+class BarRing:
+    """``shared_memory`` üzerinde tek yazar/tek okur bar halkası."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        self._header = np.ndarray((_HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        self.capacity = int(self._header[_CAPACITY])
+        self._slots = np.ndarray(
+            (self.capacity, BAR_FIELDS), dtype=np.float64, buffer=shm.buf, offset=_HEADER_FIELDS * 8
+        )
+
+    @classmethod
+    def create(cls, capacity: int = 4096, name: Optional[str] = None) -> "BarRing":
+        capacity = max(1, int(capacity))
+        size = (_HEADER_FIELDS + capacity * BAR_FIELDS) * 8
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((_HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[_CAPACITY] = capacity
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "BarRing":
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def closed(self) -> bool:
+        return bool(self._header[_CLOSED])
+
+    @property
+    def write_seq(self) -> int:
+        return int(self._header[_WRITE])
+
+    @property
+    def read_seq(self) -> int:
+        return int(self._header[_READ])
+
+    def pending(self) -> int:
+        """Yazılmış ama henüz okunmamış bar sayısı."""
+
+        return int(self._header[_WRITE] - self._header[_READ])
+
+    def free(self) -> int:
+        return self.capacity - self.pending()
+
+    def write(self, bar: BarData, block: bool = True, poll_seconds: float = 0.0005) -> bool:
+        """Barı halkaya yaz; ``block`` ise okur yer açana kadar bekler.
+
+        ``block=False`` iken halka doluysa bar yazılmaz ve ``False`` döner.
+        """
+
+        while self.free() <= 0:
+            if not block:
+                return False
+            time.sleep(poll_seconds)
+        seq = int(self._header[_WRITE])
+        self._slots[seq % self.capacity] = (bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume)
+        self._header[_WRITE] = seq + 1
+        return True
+
+    def close_writer(self) -> None:
+        """Akışın bittiğini okura bildir."""
+
+        self._header[_CLOSED] = 1
+
+    def peek(self, max_items: Optional[int] = None) -> np.ndarray:
+        """Okunmamış barların kopyasız görünümü (halka sonunda bölünmeden, en çok ``max_items``)."""
+
+        read = int(self._header[_READ])
+        count = int(self._header[_WRITE]) - read
+        if max_items is not None:
+            count = min(count, max_items)
+        start = read % self.capacity
+        count = min(count, self.capacity - start)
+        return self._slots[start : start + count]
+
+    def advance(self, count: int) -> None:
+        """``peek`` ile okunan ``count`` barı tüketilmiş işaretle."""
+
+        self._header[_READ] += count
+
+    def close(self) -> None:
+        self._header = None  # type: ignore[assignment]
+        self._slots = None  # type: ignore[assignment]
+        self._shm.close()
+
+    def unlink(self) -> None:
+        if self._owner:
+            self._shm.unlink()
+
+
+class ShmRingFeed:
+    """``BarRing`` okurunu ``stream_klines`` arabirimiyle sunar."""
+
+    def __init__(
+        self,
+        ring: BarRing,
+        poll_seconds: float = 0.001,
+        batch: int = 256,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        self.ring = ring
+        self.poll_seconds = poll_seconds
+        self.batch = batch
+        self._clock = clock
+
+    def qsize(self) -> int:
+        return self.ring.pending()
+
+    async def stream_klines(self) -> AsyncIterator[BarData]:
+        clock = self._clock or get_clock()
+        ring = self.ring
+        while True:
+            rows = ring.peek(self.batch)
+            if not len(rows):
+                if ring.closed and ring.pending() == 0:
+                    return
+                await asyncio.sleep(self.poll_seconds)
+                continue
+            for row in rows.tolist():
+                bar = BarData(int(row[0]), row[1], row[2], row[3], row[4], row[5])
+                # Bar işlenmek üzere teslim edildiğinde tüketilmiş sayılır; yeniden
+                # başlatılan bir okur aynı barı ikinci kez işlemez.
+                ring.advance(1)
+                await clock.advance_to(bar.timestamp)
+                yield bar
@@ -0,0 +1,161 @@
+"""PnL serileri için vektörel bootstrap güven aralıkları.
+
+Seri korelasyonu korumak için durağan (stationary, Politis-Romano) ya da
+dairesel blok bootstrap ile binlerce yeniden örnek üretir. Metrikler tüm
+örnekler üzerinde tek bir 2B NumPy işlemiyle hesaplanır; bellek için örnekler
+isteğe bağlı olarak parçalara bölünür.
+
+Örnek:
+    from src.evaluation.bootstrap import bootstrap_summary
+
+    result = bootstrap_summary(pnls, n_resamples=5000, block_length=20, seed=1)
+    low, high = result.intervals["sharpe"]
+    print(result.target_probabilities["sharpe"])
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Literal, Optional, Tuple
+
+import numpy as np
+
+from src.config.settings import get_settings
+from src.evaluation.metrics import MetricsSummary, compute_summary
+
+BootstrapMethod = Literal["stationary", "block"]
+METRIC_NAMES = ("winrate", "profit_factor", "sharpe", "roi", "mdd")
+
+
+@dataclass
+class BootstrapResult:
+    point: MetricsSummary
+    intervals: Dict[str, Tuple[float, float]]
+    target_probabilities: Dict[str, float]
+    samples: Dict[str, np.ndarray]
+    confidence: float
+
+
+def resample_indices(
+    n: int,
+    n_resamples: int,
+    block_length: float,
+    method: BootstrapMethod,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """(n_resamples, n) boyutunda yeniden örnekleme indeksleri üret."""
+
+    if n <= 0:
+        raise ValueError("Boş seri yeniden örneklenemez.")
+    if block_length < 1:
+        raise ValueError("block_length en az 1 olmalıdır.")
+    positions = np.arange(n)
+    if method == "block":
+        length = int(block_length)
+        n_blocks = -(-n // length)
+        starts = rng.integers(0, n, size=(n_resamples, n_blocks))
+        return (np.repeat(starts, length, axis=1)[:, :n] + positions % length) % n
+    if method == "stationary":
+        new_block = rng.random((n_resamples, n)) < 1.0 / block_length
+        new_block[:, 0] = True
+        starts = rng.integers(0, n, size=(n_resamples, n))
+        block_begin = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+        begin_values = np.take_along_axis(starts, block_begin, axis=1)
+        return (begin_values + positions - block_begin) % n
+    raise ValueError(f"Bilinmeyen bootstrap yöntemi: {method}")
+
+
+def batch_metrics(pnls: np.ndarray, start_equity: float = 1.0) -> Dict[str, np.ndarray]:
+    """(B, N) PnL matrisinin her satırı için ``compute_summary`` metriklerini hesapla.
+
+    Equity eğrisi, ``PaperTrader`` ile uyumlu olarak ``start_equity`` üzerine
+    PnL'lerin toplamsal birikimiyle kurulur.
+    """
+
+    pnls = np.atleast_2d(np.asarray(pnls, dtype=float))
+    n = pnls.shape[1]
+    winrate = (pnls > 0).mean(axis=1) if n else np.zeros(len(pnls))
+    gains = np.where(pnls > 0, pnls, 0.0).sum(axis=1)
+    losses = -np.where(pnls < 0, pnls, 0.0).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        profit_factor = np.where(losses > 0, gains / np.where(losses > 0, losses, 1.0), np.inf)
+
+    if n >= 2:
+        std = pnls.std(axis=1, ddof=1)
+        safe_std = np.where(std == 0, 1.0, std)
+        sharpe = np.where(std == 0, 0.0, np.sqrt(252) * pnls.mean(axis=1) / safe_std)
+    else:
+        sharpe = np.zeros(len(pnls))
+
+    equity = start_equity + np.cumsum(pnls, axis=1)
+    equity = np.concatenate([np.full((len(pnls), 1), start_equity), equity], axis=1)
+    roi = equity[:, -1] / start_equity - 1 if start_equity > 0 else np.zeros(len(pnls))
+    peaks = np.maximum.accumulate(equity, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mdd = -((equity - peaks) / peaks).min(axis=1)
+    return {"winrate": winrate, "profit_factor": profit_factor, "sharpe": sharpe, "roi": roi, "mdd": mdd}
+
+
+def bootstrap_summary(
+    pnls: Iterable[float],
+    *,
+    n_resamples: int = 2000,
+    block_length: float = 10.0,
+    method: BootstrapMethod = "stationary",
+    confidence: float = 0.95,
+    chunk_size: Optional[int] = None,
+    start_equity: float = 1.0,
+    seed: Optional[int] = None,
+) -> BootstrapResult:
+    """PnL serisinden metrik güven aralıklarını ve hedef tutma olasılıklarını hesapla.
+
+    ``chunk_size`` verildiğinde en fazla bu kadar örnek aynı anda bellekte
+    tutulur. Parçalama rastgele akışın tüketim sırasını değiştirdiğinden
+    aynı tohumla bile örnekler birebir aynı olmaz, dağılım aynıdır.
+    """
+
+    series = np.asarray(list(pnls), dtype=float)
+    if not 0 < confidence < 1:
+        raise ValueError("confidence 0 ile 1 arasında olmalıdır.")
+    rng = np.random.default_rng(seed)
+    chunk = n_resamples if not chunk_size else max(1, int(chunk_size))
+
+    collected: Dict[str, list[np.ndarray]] = {name: [] for name in METRIC_NAMES}
+    done = 0
+    while done < n_resamples:
+        size = min(chunk, n_resamples - done)
+        indices = resample_indices(series.size, size, block_length, method, rng)
+        for name, values in batch_metrics(series[indices], start_equity).items():
+            collected[name].append(values)
+        done += size
+    samples = {name: np.concatenate(parts) for name, parts in collected.items()}
+
+    tail = (1.0 - confidence) / 2
+    intervals = {
+        name: (
+            float(np.quantile(values, tail, method="lower")),
+            float(np.quantile(values, 1.0 - tail, method="higher")),
+        )
+        for name, values in samples.items()
+    }
+    equity_curve = np.concatenate([[start_equity], start_equity + np.cumsum(series)])
+    return BootstrapResult(
+        point=compute_summary(series.tolist(), equity_curve.tolist()),
+        intervals=intervals,
+        target_probabilities=target_probabilities(samples),
+        samples=samples,
+        confidence=confidence,
+    )
+
+
+def target_probabilities(samples: Dict[str, np.ndarray]) -> Dict[str, float]:
+    """``evaluate_targets`` kurallarına göre her hedefin tutulma olasılığı."""
+
+    targets = get_settings().metrics.targets
+    return {
+        "winrate": float(np.mean(samples["winrate"] >= targets.winrate)),
+        "profit_factor": float(np.mean(samples["profit_factor"] >= targets.profit_factor)),
+        "sharpe": float(np.mean(samples["sharpe"] >= targets.sharpe)),
+        "roi": float(np.mean(samples["roi"] >= targets.roi)),
+        "mdd": float(np.mean(samples["mdd"] <= targets.mdd)),
+    }
@@ -0,0 +1,245 @@
+"""Canlı pipeline için Prometheus biçimli metrik dışa aktarıcı.
+
+``PipelineMetrics`` sıcak döngüde yalnızca öznitelik atamaları ve toplamalarla
+güncellenir (tek iş parçacıklı asyncio döngüsünde kilit gerekmez). Metin
+biçimlendirme yalnızca ``/metrics`` isteği geldiğinde yapılır; sunucu aynı
+asyncio döngüsünde, engellemeden çalışır. Aşama süreleri toplam, ölçüm sayısı
+ve en uzun süre olarak yayınlanır (ortalama = ``_total / _count``). İstek
+başlıkları ``read_timeout`` içinde gelmezse ya da istemci bağlantıyı
+koparırsa bağlantı kapatılır; yavaş istemci döngüde görev bırakmaz.
+
+Örnek:
+    from src.evaluation.exporter import PipelineMetrics, PrometheusExporter
+
+    metrics = PipelineMetrics()
+    exporter = PrometheusExporter(metrics, constraints=constraints, bandit=bandit)
+    await exporter.start()
+    # curl http://127.0.0.1:9108/metrics
+    await exporter.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Any, List, Optional
+
+from src.config.settings import MonitoringConfig
+from src.execution.risk import KILL_STATES
+
+STAGES = ("features", "decide", "step", "constraints", "learn", "total")
+(
+    STAGE_FEATURES,
+    STAGE_DECIDE,
+    STAGE_STEP,
+    STAGE_CONSTRAINTS,
+    STAGE_LEARN,
+    STAGE_TOTAL,
+) = range(len(STAGES))
+
+_PREFIX = "maybelong"
+
+
+class PipelineMetrics:
+    """Sıcak döngüde güncellenen düz sayaçlar ve göstergeler."""
+
+    __slots__ = (
+        "bars_processed",
+        "stage_seconds",
+        "stage_counts",
+        "stage_max_seconds",
+        "equity",
+        "sharpe",
+        "mdd",
+        "roi",
+        "kill_state",
+        "queue_depth",
+        "peak_equity",
+        "all_time_mdd",
+        "all_time_roi",
+        "deadline_misses",
+        "deferred_updates",
+        "decisions_skipped",
+    )
+
+    def __init__(self) -> None:
+        self.bars_processed = 0
+        self.stage_seconds: List[float] = [0.0] * len(STAGES)
+        self.stage_counts: List[int] = [0] * len(STAGES)
+        self.stage_max_seconds: List[float] = [0.0] * len(STAGES)
+        self.equity = 0.0
+        self.sharpe = 0.0
+        self.mdd = 0.0
+        self.roi = 0.0
+        self.kill_state = "NORMAL"
+        self.queue_depth = 0
+        self.peak_equity = 0.0
+        self.all_time_mdd = 0.0
+        self.all_time_roi = 0.0
+        self.deadline_misses = 0
+        self.deferred_updates = 0
+        self.decisions_skipped = 0
+
+    def observe(self, stage: int, seconds: float) -> None:
+        self.stage_seconds[stage] += seconds
+        self.stage_counts[stage] += 1
+        if seconds > self.stage_max_seconds[stage]:
+            self.stage_max_seconds[stage] = seconds
+
+
+class PrometheusExporter:
+    """``/metrics`` uç noktasını asyncio üzerinde sunar."""
+
+    def __init__(
+        self,
+        metrics: PipelineMetrics,
+        *,
+        constraints: Any = None,
+        bandit: Any = None,
+        feed: Any = None,
+        host: str = "127.0.0.1",
+        port: int = 9108,
+        read_timeout: float = 5.0,
+    ) -> None:
+        self.metrics = metrics
+        self.constraints = constraints
+        self.bandit = bandit
+        self.feed = feed
+        self.host = host
+        self.port = port
+        self.read_timeout = float(read_timeout)
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    @classmethod
+    def from_config(cls, config: MonitoringConfig, metrics: PipelineMetrics, **sources: Any) -> "PrometheusExporter":
+        return cls(
+            metrics, host=config.host, port=config.port, read_timeout=config.read_timeout_seconds, **sources
+        )
+
+    @property
+    def bound_port(self) -> int:
+        """Gerçekte dinlenen port (``port=0`` ile rastgele port seçildiğinde yararlı)."""
+
+        if self._server is None or not self._server.sockets:
+            return self.port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def render(self) -> str:
+        """Anlık değerleri Prometheus metin biçiminde üret."""
+
+        m = self.metrics
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List[tuple[str, float]]) -> None:
+            lines.append(f"# HELP {_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {_PREFIX}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{_PREFIX}_{name}{labels} {_format(value)}")
+
+        metric("bars_processed_total", "counter", "Islenen bar sayisi.", [("", m.bars_processed)])
+        metric(
+            "stage_seconds_total",
+            "counter",
+            "Asama bazinda toplam sure (saniye).",
+            [(f'{{stage="{stage}"}}', m.stage_seconds[i]) for i, stage in enumerate(STAGES)],
+        )
+        metric(
+            "stage_seconds_count",
+            "counter",
+            "Asama bazinda olcum sayisi.",
+            [(f'{{stage="{stage}"}}', m.stage_counts[i]) for i, stage in enumerate(STAGES)],
+        )
+        metric(
+            "stage_max_seconds",
+            "gauge",
+            "Asama bazinda gorulen en uzun sure (saniye).",
+            [(f'{{stage="{stage}"}}', m.stage_max_seconds[i]) for i, stage in enumerate(STAGES)],
+        )
+        queue_depth = m.queue_depth
+        qsize = getattr(self.feed, "qsize", None)
+        if callable(qsize):
+            queue_depth = qsize()
+        metric(
+            "deadline_misses_total",
+            "counter",
+            "Karar suresi siniri asilip yedek eylem kullanilan bar sayisi.",
+            [("", m.deadline_misses)],
+        )
+        metric(
+            "decisions_skipped_total",
+            "counter",
+            "Tembel degerlendirmede onbellekteki kararin kullanildigi bar sayisi.",
+            [("", m.decisions_skipped)],
+        )
+        metric("deferred_updates", "gauge", "Bekleyen ertelenmis ogrenme guncellemeleri.", [("", m.deferred_updates)])
+        metric("queue_depth", "gauge", "Bekleyen bar kuyrugu derinligi.", [("", queue_depth)])
+        metric("equity", "gauge", "Guncel equity.", [("", m.equity)])
+        metric("sharpe", "gauge", "Rolling Sharpe tahmini.", [("", m.sharpe)])
+        metric("max_drawdown", "gauge", "Rolling maksimum gerileme.", [("", m.mdd)])
+        metric("roi", "gauge", "Rolling ROI.", [("", m.roi)])
+        metric("peak_equity", "gauge", "Tum zamanlarin equity zirvesi.", [("", m.peak_equity)])
+        metric("all_time_max_drawdown", "gauge", "Tum zamanlarin maksimum gerilemesi.", [("", m.all_time_mdd)])
+        metric("all_time_roi", "gauge", "Baslangictan bu yana ROI.", [("", m.all_time_roi)])
+        metric(
+            "kill_switch_state",
+            "gauge",
+            "Kill-switch durumu (etkin durum 1).",
+            [(f'{{state="{state}"}}', 1.0 if state == m.kill_state else 0.0) for state in KILL_STATES],
+        )
+        if self.constraints is not None:
+            metric(
+                "lagrange_alpha",
+                "gauge",
+                "ConstraintEvaluator Lagrange carpanlari.",
+                [(f'{{constraint="{key}"}}', value) for key, value in self.constraints.alphas.items()],
+            )
+        if self.bandit is not None:
+            metric("exploration_rate", "gauge", "Bandit kesif orani.", [("", self.bandit.exploration)])
+        return "\n".join(lines) + "\n"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(_read_head(reader), self.read_timeout)
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, body = "200 OK", self.render().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                status, body, content_type = "404 Not Found", b"not found\n", "text/plain"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+            )
+            await asyncio.wait_for(writer.drain(), self.read_timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _read_head(reader: asyncio.StreamReader) -> bytes:
+    """İstek satırını oku, kalan başlıkları boş satıra kadar atla."""
+
+    request_line = await reader.readline()
+    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+        pass
+    return request_line
+
+
+def _format(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
@@ -0,0 +1,174 @@
+"""Çok çözünürlüklü equity geçmişi (zaman serisi piramidi).
+
+``run_pipeline`` equity'yi yalnızca ``metrics.windows.mdd`` uzunluğunda bir
+deque'da tutar; pencere kaydıkça uzun vadeli düşüş ve ROI kaybolur.
+``EquityHistory`` son ``capacity`` noktayı tam çözünürlükte, daha eskileri
+ise her seviyede ``fanout`` kat seyreltilmiş ``first/min/max/last`` kovaları
+halinde saklar. Bir seviye dolunca en eski ``fanout`` kova birleştirilip bir
+üst seviyeye aktarılır; bellek ``capacity * log_fanout(N / capacity)`` ile
+sınırlıdır. Tüm zamanların zirvesi, maksimum düşüşü ve ROI her eklemede
+artımlı güncellenir ve O(1) okunur.
+
+``dtype`` verilirse (kompakt mod, ``np.float32``) seviyeler nesne listeleri
+yerine önceden ayrılmış NumPy halkalarında tutulur: zaman damgaları ve sayaçlar
+``int64``, equity değerleri ``dtype`` ile. Zirve/düşüş/ROI skalerleri her iki
+modda da float64 kalır.
+
+Örnek:
+    from src.evaluation.history import EquityHistory
+
+    history = EquityHistory(capacity=2048)                    # ya da dtype=np.float32
+    history.append(bar.timestamp, trader.equity)
+    print(history.peak, history.max_drawdown, history.roi)
+    timestamps, lows, highs, lasts = history.series()
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Kova alanları: [start_ts, end_ts, first, min, max, last, count]
+_START, _END, _FIRST, _LOW, _HIGH, _LAST, _COUNT = range(7)
+
+
+class _ArrayLevel:
+    """``deque`` arayüzlü (append/popleft/len/iter), önceden ayrılmış kova halkası."""
+
+    __slots__ = ("_bounds", "_values", "_counts", "_head", "_size")
+
+    def __init__(self, slots: int, dtype: np.dtype) -> None:
+        self._bounds = np.zeros((slots, 2), dtype=np.int64)
+        self._values = np.zeros((slots, 4), dtype=dtype)
+        self._counts = np.zeros(slots, dtype=np.int64)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, bucket: list) -> None:
+        slots = len(self._counts)
+        if self._size == slots:
+            raise OverflowError("Seviye kapasitesi aşıldı.")
+        i = (self._head + self._size) % slots
+        self._bounds[i] = bucket[_START], bucket[_END]
+        self._values[i] = bucket[_FIRST], bucket[_LOW], bucket[_HIGH], bucket[_LAST]
+        self._counts[i] = bucket[_COUNT]
+        self._size += 1
+
+    def popleft(self) -> list:
+        if not self._size:
+            raise IndexError("Boş seviyeden okuma.")
+        i = self._head
+        bucket = self._bucket(i)
+        self._head = (i + 1) % len(self._counts)
+        self._size -= 1
+        return bucket
+
+    def __iter__(self) -> Iterator[list]:
+        slots = len(self._counts)
+        for k in range(self._size):
+            yield self._bucket((self._head + k) % slots)
+
+    def _bucket(self, i: int) -> list:
+        return [*self._bounds[i].tolist(), *self._values[i].tolist(), int(self._counts[i])]
+
+
+class EquityHistory:
+    """Sınırlı bellekli, tüm zamanları kapsayan equity geçmişi."""
+
+    def __init__(self, capacity: int = 2048, fanout: int = 4, dtype: Optional[np.dtype] = None) -> None:
+        if fanout < 2:
+            raise ValueError("fanout en az 2 olmalıdır.")
+        self.capacity = max(fanout, int(capacity))
+        self.fanout = int(fanout)
+        self.dtype = np.dtype(dtype) if dtype is not None else None
+        self.levels: List[Union[Deque[list], _ArrayLevel]] = [self._new_level()]
+        self.count = 0
+        self.first: Optional[float] = None
+        self.last = 0.0
+        self.peak = float("-inf")
+        self.peak_ts = 0
+        self.max_drawdown = 0.0
+        self.max_drawdown_ts = 0
+
+    @property
+    def roi(self) -> float:
+        if self.first is None or self.first <= 0:
+            return 0.0
+        return self.last / self.first - 1.0
+
+    @property
+    def drawdown(self) -> float:
+        """Tüm zamanların zirvesine göre mevcut düşüş."""
+
+        if self.peak <= 0:
+            return 0.0
+        return (self.peak - self.last) / self.peak
+
+    def __len__(self) -> int:
+        return sum(len(level) for level in self.levels)
+
+    def append(self, timestamp: int, equity: float) -> None:
+        if self.first is None:
+            self.first = equity
+        self.last = equity
+        self.count += 1
+        if equity > self.peak:
+            self.peak = equity
+            self.peak_ts = timestamp
+        elif self.peak > 0:
+            drawdown = (self.peak - equity) / self.peak
+            if drawdown > self.max_drawdown:
+                self.max_drawdown = drawdown
+                self.max_drawdown_ts = timestamp
+        level = self.levels[0]
+        level.append([timestamp, timestamp, equity, equity, equity, equity, 1])
+        if len(level) > self.capacity:
+            self._cascade(0)
+
+    def recent(self, n: Optional[int] = None) -> np.ndarray:
+        """Tam çözünürlüklü son ``n`` equity değeri."""
+
+        level = self.levels[0]
+        values = [bucket[_LAST] for bucket in level]
+        if n is not None:
+            values = values[-n:]
+        return np.asarray(values, dtype=np.float64)
+
+    def series(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Eskiden yeniye ``(bitiş zamanı, min, max, son)`` dizileri; eski kısımlar kaba çözünürlüklüdür."""
+
+        buckets = [bucket for level in reversed(self.levels) for bucket in level]
+        if not buckets:
+            empty = np.empty(0)
+            return empty.astype(np.int64), empty, empty, empty
+        array = np.asarray(buckets, dtype=np.float64)
+        return array[:, _END].astype(np.int64), array[:, _LOW], array[:, _HIGH], array[:, _LAST]
+
+    def _new_level(self) -> Union[Deque[list], _ArrayLevel]:
+        if self.dtype is None:
+            return deque()
+        # Seviye birleştirmeden önce en çok ``capacity + 1`` kova tutar.
+        return _ArrayLevel(self.capacity + 1, self.dtype)
+
+    def _cascade(self, index: int) -> None:
+        while len(self.levels[index]) > self.capacity:
+            source = self.levels[index]
+            group = [source.popleft() for _ in range(self.fanout)]
+            merged = [
+                group[0][_START],
+                group[-1][_END],
+                group[0][_FIRST],
+                min(bucket[_LOW] for bucket in group),
+                max(bucket[_HIGH] for bucket in group),
+                group[-1][_LAST],
+                sum(bucket[_COUNT] for bucket in group),
+            ]
+            if index + 1 == len(self.levels):
+                self.levels.append(self._new_level())
+            self.levels[index + 1].append(merged)
+            index += 1
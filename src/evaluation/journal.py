@@ -0,0 +1,268 @@
+"""Yalnızca eklemeli (append-only) ikili çalışma günlüğü.
+
+Her bar için sabit genişlikli bir kayıt (bar, özellik vektörü, bandit eylemi,
+harmanlanmış karar, PnL, equity, kısıt cezası, ihlal seviyesi, kill-switch
+durumu, pozisyon boyutu) tutulur. Sıcak yolda kayıt yalnızca bir listeye tuple
+eklemekten ibarettir; yapılandırılmış NumPy dizisine dönüştürme ve diske
+yazma arka plandaki asyncio görevi tarafından toplu halde, bir iş parçacığında
+yapılır. Dosya yalnızca tam kayıtlarla büyür; çökme sonrası son yazılan
+partiye kadar olan kayıtlar okunabilir, yarım kalan son kayıt yok sayılır.
+
+Dosya düzeni: 8 baytlık sihirli değer, 4 baytlık başlık uzunluğu, JSON başlık
+ve ardından ``record_dtype(feature_dim)`` kayıtları.
+
+Örnek:
+    from src.evaluation.journal import RunJournal, read_journal
+
+    journal = RunJournal("runs/journal.bin")
+    await journal.start()
+    journal.record(bar, features, "LONG", "FLAT", pnl, equity, 0.0, 0.0, "NORMAL", 1.0)
+    await journal.close()
+    records = read_journal("runs/journal.bin")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from src.config.settings import JournalConfig
+from src.execution.risk import KILL_STATES
+from src.utils.types import DECISIONS, BarData
+
+MAGIC = b"MLJRNL01"
+FORMAT_VERSION = 1
+FSYNC_POLICIES = ("never", "batch", "interval")
+
+_DECISION_CODES = {name: code for code, name in enumerate(DECISIONS)}
+_KILL_CODES = {name: code for code, name in enumerate(KILL_STATES)}
+
+
+def record_dtype(feature_dim: int) -> np.dtype:
+    """Verilen özellik boyutu için kayıt tipini döndür."""
+
+    return np.dtype(
+        [
+            ("timestamp", "<i8"),
+            ("open", "<f8"),
+            ("high", "<f8"),
+            ("low", "<f8"),
+            ("close", "<f8"),
+            ("volume", "<f8"),
+            ("features", "<f8", (feature_dim,)),
+            ("action", "i1"),
+            ("decision", "i1"),
+            ("kill_state", "i1"),
+            ("pnl", "<f8"),
+            ("equity", "<f8"),
+            ("penalty", "<f8"),
+            ("violation_level", "<f8"),
+            ("position_size", "<f8"),
+        ]
+    )
+
+
+class RunJournal:
+    """Toplu yazan, arka planda flush eden çalışma günlüğü."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_size: int = 4096,
+        flush_interval_seconds: float = 1.0,
+        fsync: str = "batch",
+        fsync_interval_seconds: float = 5.0,
+    ) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Desteklenmeyen fsync politikası: {fsync}")
+        self.path = Path(path)
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_seconds = flush_interval_seconds
+        self.fsync = fsync
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.records_written = 0
+        self._pending: List[tuple] = []
+        self._dtype: Optional[np.dtype] = None
+        self._handle = None
+        self._last_fsync = time.monotonic()
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @classmethod
+    def from_config(cls, config: JournalConfig) -> "RunJournal":
+        return cls(
+            config.path,
+            batch_size=config.batch_size,
+            flush_interval_seconds=config.flush_interval_seconds,
+            fsync=config.fsync,
+            fsync_interval_seconds=config.fsync_interval_seconds,
+        )
+
+    def record(
+        self,
+        bar: BarData,
+        features: np.ndarray,
+        action: str,
+        decision: str,
+        pnl: float,
+        equity: float,
+        penalty: float,
+        violation_level: float,
+        kill_state: str,
+        position_size: float,
+    ) -> None:
+        """Sıcak yol: kaydı tampona ekle. ``features`` sonradan değiştirilmemelidir."""
+
+        self._pending.append(
+            (
+                bar.timestamp,
+                bar.open,
+                bar.high,
+                bar.low,
+                bar.close,
+                bar.volume,
+                features,
+                _DECISION_CODES[action],
+                _DECISION_CODES[decision],
+                _KILL_CODES[kill_state],
+                pnl,
+                equity,
+                penalty,
+                violation_level,
+                position_size,
+            )
+        )
+        if len(self._pending) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+
+    async def start(self) -> None:
+        """Arka plan flush görevini başlat."""
+
+        if self._task is None:
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """Görevi durdur, kalan kayıtları yaz ve dosyayı senkronize et."""
+
+        if self._task is not None and self._wake is not None:
+            self._closing = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        self.flush()
+        if self._handle is not None:
+            if self.fsync != "never":
+                os.fsync(self._handle.fileno())
+            self._handle.close()
+            self._handle = None
+
+    def flush(self) -> int:
+        """Bekleyen kayıtları senkron olarak yaz; yazılan kayıt sayısını döndür."""
+
+        batch, self._pending = self._pending, []
+        return self._write_batch(batch)
+
+    async def _flush_loop(self) -> None:
+        assert self._wake is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if self._pending:
+                batch, self._pending = self._pending, []
+                await loop.run_in_executor(None, self._write_batch, batch)
+            if self._closing:
+                return
+
+    def _write_batch(self, batch: List[tuple]) -> int:
+        if not batch:
+            return 0
+        if self._handle is None:
+            self._open(feature_dim=len(batch[0][6]))
+        records = np.array(batch, dtype=self._dtype)
+        self._handle.write(records.tobytes())
+        self._handle.flush()
+        now = time.monotonic()
+        if self.fsync == "batch" or (
+            self.fsync == "interval" and now - self._last_fsync >= self.fsync_interval_seconds
+        ):
+            os.fsync(self._handle.fileno())
+            self._last_fsync = now
+        self.records_written += len(records)
+        return len(records)
+
+    def _open(self, feature_dim: int) -> None:
+        self._dtype = record_dtype(feature_dim)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size > 0:
+            header, data_offset = _read_header(self.path)
+            if header["feature_dim"] != feature_dim:
+                raise ValueError(
+                    f"Günlük özellik boyutu uyuşmuyor: dosya {header['feature_dim']}, kayıt {feature_dim}"
+                )
+            _truncate_partial_record(self.path, data_offset, self._dtype.itemsize)
+            self._handle = self.path.open("ab")
+            return
+        self._handle = self.path.open("wb")
+        header_bytes = json.dumps(
+            {"version": FORMAT_VERSION, "feature_dim": feature_dim, "decisions": DECISIONS, "kill_states": KILL_STATES}
+        ).encode("utf-8")
+        self._handle.write(MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes)
+        self._handle.flush()
+
+
+def _read_header(path: Path) -> tuple[dict, int]:
+    with path.open("rb") as handle:
+        magic = handle.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f"Geçersiz günlük dosyası: {path}")
+        (length,) = struct.unpack("<I", handle.read(4))
+        header = json.loads(handle.read(length).decode("utf-8"))
+    return header, len(MAGIC) + 4 + length
+
+
+def _truncate_partial_record(path: Path, data_offset: int, itemsize: int) -> None:
+    size = path.stat().st_size
+    excess = (size - data_offset) % itemsize
+    if excess:
+        os.truncate(path, size - excess)
+
+
+def open_journal(path: str | Path) -> tuple[dict, np.ndarray]:
+    """Günlüğü bellek eşlemeli (salt okunur) olarak aç; yarım son kayıt atlanır."""
+
+    path = Path(path)
+    header, data_offset = _read_header(path)
+    dtype = record_dtype(header["feature_dim"])
+    count = (path.stat().st_size - data_offset) // dtype.itemsize
+    if count == 0:
+        return header, np.empty(0, dtype=dtype)
+    return header, np.memmap(path, dtype=dtype, mode="r", offset=data_offset, shape=(count,))
+
+
+def read_journal(path: str | Path) -> np.ndarray:
+    """Tüm kayıtları belleğe oku."""
+
+    _, records = open_journal(path)
+    return np.array(records)
+
+
+def iter_journal_chunks(path: str | Path, chunk_rows: int = 65536) -> Iterator[np.ndarray]:
+    """Kayıtları sınırlı bellekle, ``chunk_rows`` satırlık parçalar halinde dolaş."""
+
+    _, records = open_journal(path)
+    for start in range(0, len(records), chunk_rows):
+        yield np.array(records[start : start + chunk_rows])
@@ -0,0 +1,184 @@
+"""Geçmiş barlar üzerinde senkron, raporlamasız pipeline tekrarı.
+
+``run_pipeline`` içindeki karar/öğrenme döngüsünü asyncio, log ve raporlama
+olmadan yeniden üretir. Özellik matrisi tüm seri için tek seferde hesaplanır.
+Faktörler nedensel olduğundan sabit pencereli olanlar (getiriler, hareketli
+ortalama/std, Bollinger) canlı döngünün kayan penceresinden hesaplanan
+değerlerle birebir aynıdır. Özyinelemeli olanlar (EMA tabanlı RSI/ATR/MACD,
+OBV) ise tüm geçmişle başlatıldığından kayan pencere sonucundan yalnızca
+yaklaşık olarak (200 barlık pencerede ölçeğin ~1e-6'sı kadar) farklıdır; bu
+sınır ``tests/test_walk_forward.py`` içinde doğrulanır. ``feature_store.enabled``
+açıksa aynı veri ve özellik tanımları için matris diskteki depodan eşlenir,
+yeniden hesaplanmaz.
+
+Örnek:
+    from src.evaluation.replay import ReplayRunner, bars_to_array
+
+    runner = ReplayRunner(bars_to_array(bars))
+    runner.advance(500, record=False)  # ısınma
+    runner.reset_account()
+    runner.advance(runner.remaining)
+    summary = runner.summary()
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import Settings, get_settings
+from src.data.feature_store import cached_feature_matrix
+from src.evaluation.metrics import MetricsSummary, compute_summary
+from src.execution.risk import RiskManager
+from src.execution.simulator import PaperTrader
+from src.policy.bandit import ConstraintAwareBandit
+from src.policy.constraints import ConstraintEvaluator
+from src.utils.types import BarData
+
+OHLCV_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+WARMUP_BARS = 30
+
+
+def bars_to_array(bars: Iterable[BarData] | pd.DataFrame) -> np.ndarray:
+    """Bar dizisini (N, 6) ``timestamp, open, high, low, close, volume`` matrisine çevir."""
+
+    if isinstance(bars, pd.DataFrame):
+        missing = set(OHLCV_COLUMNS).difference(bars.columns)
+        if missing:
+            raise ValueError(f"Eksik sütunlar: {sorted(missing)}")
+        return bars[OHLCV_COLUMNS].to_numpy(dtype=np.float64)
+    rows = [(b.timestamp, b.open, b.high, b.low, b.close, b.volume) for b in bars]
+    return np.array(rows, dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS))
+
+
+class ReplayRunner:
+    """Bir bar serisini adım adım ilerleten, durumunu koruyan tekrar motoru.
+
+    ``settings`` verilirse kurulan bileşenler global ayarlar yerine onu kullanır
+    (ör. parametre taramasında her konfigürasyon kendi kopyasıyla).
+    """
+
+    def __init__(
+        self,
+        ohlcv: np.ndarray,
+        *,
+        trader: Optional[PaperTrader] = None,
+        bandit: Optional[ConstraintAwareBandit] = None,
+        constraints: Optional[ConstraintEvaluator] = None,
+        risk: Optional[RiskManager] = None,
+        features: Optional[np.ndarray] = None,
+        settings: Optional[Settings] = None,
+    ) -> None:
+        self.settings = settings or get_settings()
+        self.ohlcv = np.asarray(ohlcv, dtype=np.float64)
+        if features is None:
+            arrays = {col: self.ohlcv[:, i] for i, col in enumerate(OHLCV_COLUMNS) if i}
+            features = cached_feature_matrix(arrays)
+        if len(features) != len(self.ohlcv):
+            raise ValueError("Özellik matrisi bar sayısıyla eşleşmiyor.")
+        self.features = features
+        self.trader = trader or PaperTrader(settings=self.settings)
+        self.bandit = bandit or ConstraintAwareBandit(settings=self.settings)
+        self.constraints = constraints or ConstraintEvaluator(settings=self.settings)
+        self.risk = risk or RiskManager(settings=self.settings)
+
+        self.cursor = 0
+        self.position_size = self.risk.position_size(sharpe=0.0, max_drawdown=0.0)
+        self.violation_level = 0.0
+        self.kill_status = "NORMAL"
+        self.sharpe_estimate = 0.0
+        self.max_drawdown = 0.0
+        self.roi = 0.0
+        self._pnl_window: Deque[float] = deque(maxlen=self.settings.metrics.windows.winrate)
+        self._equity_window: Deque[float] = deque(maxlen=self.settings.metrics.windows.mdd)
+        self.recorded_pnls: list[float] = []
+        self.recorded_equity: list[float] = []
+
+    @property
+    def remaining(self) -> int:
+        return len(self.ohlcv) - self.cursor
+
+    def reset_account(self) -> None:
+        """Öğrenilmiş model/kısıt durumunu koruyup hesabı sıfırla.
+
+        Equity, pencereler ve kayıtların yanı sıra hesaba bağlı risk durumu
+        (kill-switch, pozisyon boyutu, Sharpe/MDD/ROI tahminleri) da başlangıç
+        değerlerine döner; eğitim kesitinin riski değerlendirme kesitine taşınmaz.
+        """
+
+        self.trader = PaperTrader(settings=self.settings)
+        self.position_size = self.risk.position_size(sharpe=0.0, max_drawdown=0.0)
+        self.kill_status = "NORMAL"
+        self.sharpe_estimate = 0.0
+        self.max_drawdown = 0.0
+        self.roi = 0.0
+        self._pnl_window.clear()
+        self._equity_window.clear()
+        self.recorded_pnls.clear()
+        self.recorded_equity.clear()
+
+    def advance(self, n_bars: int, record: bool = True) -> int:
+        """En fazla ``n_bars`` bar ilerle; işlenen bar sayısını döndür."""
+
+        end = min(len(self.ohlcv), self.cursor + max(0, n_bars))
+        processed = end - self.cursor
+        while self.cursor < end:
+            self._step(self.cursor, record)
+            self.cursor += 1
+        return processed
+
+    def summary(self) -> MetricsSummary:
+        return compute_summary(self.recorded_pnls, self.recorded_equity)
+
+    def _step(self, idx: int, record: bool) -> None:
+        if idx < WARMUP_BARS - 1:
+            return
+        row = self.ohlcv[idx]
+        bar = BarData(
+            timestamp=int(row[0]),
+            open=float(row[1]),
+            high=float(row[2]),
+            low=float(row[3]),
+            close=float(row[4]),
+            volume=float(row[5]),
+        )
+        features = self.features[idx]
+        action = self.bandit.select_action(features, violation_level=self.violation_level)
+        pnl = self.trader.step(bar, action, self.position_size)
+        self._pnl_window.append(pnl)
+        self._equity_window.append(self.trader.equity)
+        if record:
+            self.recorded_pnls.append(pnl)
+            self.recorded_equity.append(self.trader.equity)
+
+        self.sharpe_estimate = _sharpe_estimate(self._pnl_window)
+        self.max_drawdown, self.roi = _drawdown_and_roi(self._equity_window)
+
+        result = self.constraints.update(pnl, self.trader.equity)
+        self.bandit.update_feedback(features, action, result.reward)
+        self.kill_status, self.position_size = self.risk.evaluate(self.max_drawdown, self.sharpe_estimate, self.roi)
+        self.violation_level = result.violation_level
+
+
+def _sharpe_estimate(pnls: Sequence[float]) -> float:
+    if len(pnls) < 2:
+        return 0.0
+    arr = np.fromiter(pnls, dtype=float, count=len(pnls))
+    std = arr.std(ddof=1)
+    if std <= 0:
+        return 0.0
+    return float(np.sqrt(252) * arr.mean() / std)
+
+
+def _drawdown_and_roi(equity: Sequence[float]) -> tuple[float, float]:
+    if not equity:
+        return 0.0, 0.0
+    peak = max(equity)
+    current = equity[-1]
+    max_drawdown = (peak - current) / peak if peak > 0 else 0.0
+    start = equity[0]
+    roi = (current / start - 1) if start > 0 else 0.0
+    return max_drawdown, roi
@@ -0,0 +1,430 @@
+"""Tamamlanmış çalışmalar için parça parça (chunked) rapor üretici.
+
+``RunJournal`` ile kaydedilmiş bir çalışmayı bellek eşlemeli olarak parça
+parça okur ve her parçayı vektörel geçişlerle işler; bellekte yalnızca küçük
+bir taşıma durumu (son zirve, rolling Sharpe kuyruğu, açık düşüş dönemi) ve
+``max_points`` kovaya indirgenmiş zaman serileri tutulur. Böylece milyonlarca
+barlık çalışmalar birkaç saniyede özetlenir.
+
+Üretilenler: equity eğrisi, düşüş (drawdown) eğrisi ve en derin düşüş
+dönemleri, rolling Sharpe, eylem/karar dağılımı ve zaman içindeki eylem
+payları, kısıt ihlali ve kill-switch zaman çizelgesi. Çıktı statik HTML
+(satır içi SVG) veya Parquet (kova serileri; özet şema meta verisinde) olabilir.
+
+Örnek:
+    python -m src.evaluation.run_report runs/journal.bin --html runs/report.html --parquet runs/report.parquet
+
+    from src.evaluation.run_report import build_run_report, write_html
+
+    report = build_run_report("runs/journal.bin")
+    write_html(report, "runs/report.html")
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.evaluation.journal import open_journal
+from src.execution.risk import KILL_STATES
+from src.utils.types import DECISIONS
+
+SERIES_COLUMNS = (
+    "timestamp",
+    "equity",
+    "drawdown",
+    "rolling_sharpe",
+    "violation_max",
+    "violation_mean",
+    "penalty_mean",
+    "kill_state",
+    "long_share",
+    "short_share",
+    "flat_share",
+)
+
+
+@dataclass
+class DrawdownPeriod:
+    """Zirveden toparlanmaya kadar süren bir düşüş dönemi."""
+
+    start_ts: int
+    trough_ts: int
+    end_ts: Optional[int]
+    depth: float
+    bars: int
+
+
+@dataclass
+class RunReport:
+    """Çalışma özeti, kova serileri ve dağılımlar."""
+
+    summary: Dict[str, float] = field(default_factory=dict)
+    series: Dict[str, np.ndarray] = field(default_factory=dict)
+    drawdowns: List[DrawdownPeriod] = field(default_factory=list)
+    action_counts: Dict[str, int] = field(default_factory=dict)
+    decision_counts: Dict[str, int] = field(default_factory=dict)
+    kill_state_counts: Dict[str, int] = field(default_factory=dict)
+
+
+class RunReportBuilder:
+    """Günlük parçalarını sırayla tüketip raporu artımlı olarak kurar.
+
+    ``stride`` kova uzunluğudur; parçaların ``stride``'ın katı olması kovaların
+    parça sınırlarını aşmamasını sağlar (son parça hariç).
+    """
+
+    def __init__(self, stride: int = 1, rolling_window: int = 1000, top_drawdowns: int = 10) -> None:
+        self.stride = max(1, int(stride))
+        self.window = max(2, int(rolling_window))
+        self.top_drawdowns = top_drawdowns
+        self.rows = 0
+        self._peak = -math.inf
+        self._first_equity: Optional[float] = None
+        self._last_equity = 0.0
+        self._first_ts: Optional[int] = None
+        self._last_ts = 0
+        self._max_drawdown = 0.0
+        self._pnl_sum = 0.0
+        self._pnl_sq = 0.0
+        self._wins = 0
+        self._tail = np.empty(0, dtype=np.float64)
+        self._violating = False
+        self._violation_episodes = 0
+        self._violation_bars = 0
+        self._actions = np.zeros(len(DECISIONS), dtype=np.int64)
+        self._decisions = np.zeros(len(DECISIONS), dtype=np.int64)
+        self._kill_states = np.zeros(len(KILL_STATES), dtype=np.int64)
+        self._series: Dict[str, List[np.ndarray]] = {name: [] for name in SERIES_COLUMNS}
+        # Açık düşüş dönemi: [start_ts, trough_ts, depth, start_row]
+        self._open_period: Optional[list] = None
+        self._periods = np.empty((0, 5), dtype=np.float64)  # start_ts, trough_ts, end_ts, depth, bars
+
+    def update(self, chunk: np.ndarray) -> None:
+        n = len(chunk)
+        if n == 0:
+            return
+        ts = chunk["timestamp"]
+        equity = chunk["equity"].astype(np.float64, copy=False)
+        pnl = chunk["pnl"].astype(np.float64, copy=False)
+        violation = chunk["violation_level"]
+        if self._first_equity is None:
+            self._first_equity = float(equity[0])
+            self._first_ts = int(ts[0])
+        self._last_equity = float(equity[-1])
+        self._last_ts = int(ts[-1])
+
+        peak = np.maximum.accumulate(equity)
+        np.maximum(peak, self._peak, out=peak)
+        self._peak = float(peak[-1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown = np.where(peak > 0, (peak - equity) / peak, 0.0)
+        self._max_drawdown = max(self._max_drawdown, float(drawdown.max()))
+        self._update_drawdown_periods(ts, drawdown)
+
+        self._pnl_sum += float(pnl.sum())
+        self._pnl_sq += float(np.dot(pnl, pnl))
+        self._wins += int(np.count_nonzero(pnl > 0))
+
+        violating = violation > 0
+        self._violation_bars += int(np.count_nonzero(violating))
+        rising = np.count_nonzero(violating[1:] & ~violating[:-1]) + int(violating[0] and not self._violating)
+        self._violation_episodes += int(rising)
+        self._violating = bool(violating[-1])
+
+        self._actions += np.bincount(chunk["action"], minlength=len(DECISIONS))[: len(DECISIONS)]
+        self._decisions += np.bincount(chunk["decision"], minlength=len(DECISIONS))[: len(DECISIONS)]
+        self._kill_states += np.bincount(chunk["kill_state"], minlength=len(KILL_STATES))[: len(KILL_STATES)]
+
+        # Kova indirgemeleri: her kovanın son satırı örnek noktasıdır.
+        starts = np.arange(0, n, self.stride)
+        last = np.minimum(starts + self.stride, n) - 1
+        sizes = (last - starts + 1).astype(np.float64)
+        series = self._series
+        series["timestamp"].append(ts[last])
+        series["equity"].append(equity[last])
+        series["drawdown"].append(np.maximum.reduceat(drawdown, starts))
+        series["rolling_sharpe"].append(self._rolling_sharpe(pnl, last))
+        series["violation_max"].append(np.maximum.reduceat(violation, starts))
+        series["violation_mean"].append(np.add.reduceat(violation, starts) / sizes)
+        series["penalty_mean"].append(np.add.reduceat(chunk["penalty"], starts) / sizes)
+        series["kill_state"].append(np.maximum.reduceat(chunk["kill_state"], starts))
+        actions = chunk["action"]
+        for code, name in enumerate(("long_share", "short_share", "flat_share")):
+            series[name].append(np.add.reduceat((actions == code).astype(np.float64), starts) / sizes)
+        self.rows += n
+
+    def result(self) -> RunReport:
+        rows = self.rows
+        mean = self._pnl_sum / rows if rows else 0.0
+        var = (self._pnl_sq - rows * mean * mean) / (rows - 1) if rows > 1 else 0.0
+        std = math.sqrt(var) if var > 0 else 0.0
+        first = self._first_equity or 0.0
+        summary = {
+            "bars": float(rows),
+            "start_ts": float(self._first_ts or 0),
+            "end_ts": float(self._last_ts),
+            "start_equity": first,
+            "final_equity": self._last_equity,
+            "roi": self._last_equity / first - 1 if first > 0 else 0.0,
+            "max_drawdown": self._max_drawdown,
+            "sharpe": math.sqrt(252) * mean / std if std > 0 else 0.0,
+            "bar_winrate": self._wins / rows if rows else 0.0,
+            "total_pnl": self._pnl_sum,
+            "violation_share": self._violation_bars / rows if rows else 0.0,
+            "violation_episodes": float(self._violation_episodes),
+        }
+        periods = self._periods
+        if self._open_period is not None:
+            start_ts, trough_ts, depth, start_row = self._open_period
+            current = np.array([[start_ts, trough_ts, np.nan, depth, rows - start_row]])
+            periods = np.vstack([periods, current])
+        order = np.argsort(-periods[:, 3], kind="stable")[: self.top_drawdowns]
+        drawdowns = [
+            DrawdownPeriod(
+                start_ts=int(row[0]),
+                trough_ts=int(row[1]),
+                end_ts=None if np.isnan(row[2]) else int(row[2]),
+                depth=float(row[3]),
+                bars=int(row[4]),
+            )
+            for row in periods[order]
+        ]
+        series = {
+            name: np.concatenate(parts) if parts else np.empty(0)
+            for name, parts in self._series.items()
+        }
+        return RunReport(
+            summary=summary,
+            series=series,
+            drawdowns=drawdowns,
+            action_counts=dict(zip(DECISIONS, self._actions.tolist(), strict=True)),
+            decision_counts=dict(zip(DECISIONS, self._decisions.tolist(), strict=True)),
+            kill_state_counts=dict(zip(KILL_STATES, self._kill_states.tolist(), strict=True)),
+        )
+
+    def _rolling_sharpe(self, pnl: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """Yalnızca örnek noktalarında, önceki parçanın kuyruğuyla birlikte rolling Sharpe."""
+
+        w = self.window
+        values = np.concatenate([self._tail, pnl])
+        offset = len(self._tail)
+        csum = np.concatenate([[0.0], np.cumsum(values)])
+        csq = np.concatenate([[0.0], np.cumsum(values * values)])
+        end = points + offset + 1
+        begin = end - w
+        valid = begin >= 0
+        begin = np.maximum(begin, 0)
+        s = csum[end] - csum[begin]
+        s2 = csq[end] - csq[begin]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = (s2 - s * s / w) / (w - 1)
+            sharpe = np.where((var > 1e-18) & valid, math.sqrt(252) * (s / w) / np.sqrt(var), np.nan)
+        self._tail = values[-(w - 1) :].copy()
+        return sharpe
+
+    def _update_drawdown_periods(self, ts: np.ndarray, drawdown: np.ndarray) -> None:
+        n = len(drawdown)
+        under = drawdown > 0
+        change = np.flatnonzero(under[1:] != under[:-1]) + 1
+        seg_starts = np.concatenate([[0], change])
+        seg_ends = np.concatenate([change, [n]])
+        depth = np.maximum.reduceat(drawdown, seg_starts)
+        lengths = seg_ends - seg_starts
+        hits = np.flatnonzero(drawdown == np.repeat(depth, lengths))
+        trough = hits[np.searchsorted(hits, seg_starts)]
+        is_under = under[seg_starts]
+
+        rows = self.rows
+        new_periods = []
+        first_under = bool(is_under[0])
+        if self._open_period is not None:
+            start_ts, trough_ts, open_depth, start_row = self._open_period
+            if first_under:
+                if depth[0] > open_depth:
+                    trough_ts, open_depth = int(ts[trough[0]]), float(depth[0])
+                if seg_ends[0] < n:
+                    end = seg_ends[0]
+                    new_periods.append([start_ts, trough_ts, ts[end], open_depth, rows + end - start_row])
+                    self._open_period = None
+                else:
+                    self._open_period = [start_ts, trough_ts, open_depth, start_row]
+            else:
+                new_periods.append([start_ts, trough_ts, ts[0], open_depth, rows - start_row])
+                self._open_period = None
+        skip_first = first_under and bool(new_periods or self._open_period is not None)
+        mask = is_under.copy()
+        if skip_first:
+            mask[0] = False
+        idx = np.flatnonzero(mask)
+        if idx.size:
+            closed = seg_ends[idx] < n
+            c = idx[closed]
+            block = np.column_stack(
+                [ts[seg_starts[c]], ts[trough[c]], ts[seg_ends[c]], depth[c], lengths[c]]
+            ).astype(np.float64)
+            if new_periods:
+                block = np.vstack([np.array(new_periods, dtype=np.float64), block])
+            new_periods = block
+            if not closed[-1]:
+                last = idx[-1]
+                self._open_period = [int(ts[seg_starts[last]]), int(ts[trough[last]]), float(depth[last]), rows + seg_starts[last]]
+        if len(new_periods):
+            merged = np.vstack([self._periods, np.asarray(new_periods, dtype=np.float64)])
+            if len(merged) > self.top_drawdowns:
+                keep = np.argpartition(-merged[:, 3], self.top_drawdowns - 1)[: self.top_drawdowns]
+                merged = merged[np.sort(keep)]
+            self._periods = merged
+
+
+def build_run_report(
+    path: str | Path,
+    *,
+    max_points: int = 2000,
+    rolling_window: int = 1000,
+    chunk_rows: int = 1 << 20,
+    top_drawdowns: int = 10,
+) -> RunReport:
+    """Günlüğü parça parça okuyup raporu üret; seriler en çok ~``max_points`` noktaya indirgenir."""
+
+    _, records = open_journal(path)
+    total = len(records)
+    stride = max(1, math.ceil(total / max(1, max_points)))
+    chunk = max(stride, (chunk_rows // stride) * stride)
+    builder = RunReportBuilder(stride=stride, rolling_window=rolling_window, top_drawdowns=top_drawdowns)
+    for start in range(0, total, chunk):
+        builder.update(records[start : start + chunk])
+    return builder.result()
+
+
+def write_parquet(report: RunReport, path: str | Path) -> Path:
+    """Kova serilerini Parquet'e yaz; özet ve dağılımlar şema meta verisine eklenir."""
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.table({name: report.series[name] for name in SERIES_COLUMNS})
+    metadata = {
+        "summary": report.summary,
+        "action_counts": report.action_counts,
+        "decision_counts": report.decision_counts,
+        "kill_state_counts": report.kill_state_counts,
+        "drawdowns": [period.__dict__ for period in report.drawdowns],
+    }
+    table = table.replace_schema_metadata({b"maybelong.report": json.dumps(metadata).encode("utf-8")})
+    pq.write_table(table, path)
+    return path
+
+
+def write_html(report: RunReport, path: str | Path, title: str = "Çalışma Raporu") -> Path:
+    """Tek dosyalık, dış bağımlılıksız statik HTML rapor yaz."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    s = report.summary
+    summary_rows = [
+        ("Bar", f"{int(s.get('bars', 0)):,}"),
+        ("Başlangıç / bitiş equity", f"{s.get('start_equity', 0):.4f} → {s.get('final_equity', 0):.4f}"),
+        ("ROI", f"{s.get('roi', 0):.2%}"),
+        ("Maks. düşüş", f"{s.get('max_drawdown', 0):.2%}"),
+        ("Sharpe", f"{s.get('sharpe', 0):.2f}"),
+        ("Bar winrate", f"{s.get('bar_winrate', 0):.2%}"),
+        ("İhlalli bar payı", f"{s.get('violation_share', 0):.2%}"),
+        ("İhlal epizodu", f"{int(s.get('violation_episodes', 0))}"),
+    ]
+    series = report.series
+    charts = [
+        ("Equity", series["equity"], "#1f77b4"),
+        ("Düşüş", -series["drawdown"], "#d62728"),
+        ("Rolling Sharpe", series["rolling_sharpe"], "#2ca02c"),
+        ("Kısıt ihlali (kova maks.)", series["violation_max"], "#ff7f0e"),
+        ("Kill-switch durumu (0=NORMAL)", series["kill_state"].astype(np.float64), "#9467bd"),
+        ("LONG payı", series["long_share"], "#17becf"),
+        ("SHORT payı", series["short_share"], "#8c564b"),
+    ]
+    drawdown_rows = "".join(
+        f"<tr><td>{p.start_ts}</td><td>{p.trough_ts}</td><td>{'açık' if p.end_ts is None else p.end_ts}</td>"
+        f"<td>{p.depth:.2%}</td><td>{p.bars:,}</td></tr>"
+        for p in report.drawdowns
+    )
+    body = [
+        f"<h1>{html.escape(title)}</h1>",
+        _html_table(["Metrik", "Değer"], summary_rows),
+        "<h2>Zaman serileri</h2>",
+        *(f"<h3>{html.escape(name)}</h3>{_svg_line(values, color)}" for name, values, color in charts),
+        "<h2>Dağılımlar</h2>",
+        _html_table(["Eylem", "Bar"], [(k, f"{v:,}") for k, v in report.action_counts.items()]),
+        _html_table(["Karar", "Bar"], [(k, f"{v:,}") for k, v in report.decision_counts.items()]),
+        _html_table(["Kill-switch", "Bar"], [(k, f"{v:,}") for k, v in report.kill_state_counts.items()]),
+        "<h2>En derin düşüş dönemleri</h2>",
+        "<table><tr><th>Başlangıç</th><th>Dip</th><th>Toparlanma</th><th>Derinlik</th><th>Bar</th></tr>"
+        f"{drawdown_rows}</table>",
+    ]
+    document = (
+        "<!DOCTYPE html><html lang=\"tr\"><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(title)}</title><style>"
+        "body{font-family:sans-serif;margin:2em;max-width:1000px}"
+        "table{border-collapse:collapse;margin:1em 0}td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}"
+        "svg{background:#fafafa;border:1px solid #eee}"
+        "</style></head><body>" + "".join(body) + "</body></html>"
+    )
+    path.write_text(document, encoding="utf-8")
+    return path
+
+
+def _html_table(headers: List[str], rows: List[tuple]) -> str:
+    head = "".join(f"<th>{html.escape(str(h))}</th>" for h in headers)
+    cells = "".join("<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in row) + "</tr>" for row in rows)
+    return f"<table><tr>{head}</tr>{cells}</table>"
+
+
+def _svg_line(values: np.ndarray, color: str = "#1f77b4", width: int = 960, height: int = 160) -> str:
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values)
+    if values.size < 2 or not finite.any():
+        return "<p>Veri yok.</p>"
+    lo, hi = float(values[finite].min()), float(values[finite].max())
+    span = hi - lo or 1.0
+    x = np.linspace(0, width, values.size)
+    y = height - (np.where(finite, values, lo) - lo) / span * height
+    points = " ".join(f"{a:.1f},{b:.1f}" for a, b in zip(x, y, strict=True))
+    return (
+        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        f'<polyline fill="none" stroke="{color}" stroke-width="1" points="{points}"/></svg>'
+        f"<div><small>min {lo:.6g}, maks {hi:.6g}</small></div>"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Çalışma günlüğünden çevrimdışı rapor üret.")
+    parser.add_argument("journal", help="RunJournal dosyası (ör. runs/journal.bin)")
+    parser.add_argument("--html", help="HTML rapor çıktısı")
+    parser.add_argument("--parquet", help="Parquet seri çıktısı")
+    parser.add_argument("--max-points", type=int, default=2000)
+    parser.add_argument("--rolling-window", type=int, default=1000)
+    parser.add_argument("--chunk-rows", type=int, default=1 << 20)
+    args = parser.parse_args(argv)
+    report = build_run_report(
+        args.journal,
+        max_points=args.max_points,
+        rolling_window=args.rolling_window,
+        chunk_rows=args.chunk_rows,
+    )
+    html_path = args.html or (None if args.parquet else str(Path(args.journal).with_suffix(".html")))
+    if html_path:
+        print(f"HTML rapor: {write_html(report, html_path)}")
+    if args.parquet:
+        print(f"Parquet seriler: {write_parquet(report, args.parquet)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Successive-halving ile erken sonlandırmalı parametre taraması.
+
+Boyutlandırma/ceza ayarları taranırken konfigürasyonların çoğu erkenden
+``safety.drawdown_hard`` eşiğini aşar ya da ``sharpe_floor`` altında kalır;
+yine de tam bir tekrar koşturur. ``successive_halving`` her konfigürasyon için
+kendi ``ReplayRunner``'ını (``override_settings`` ile üretilmiş ayar kopyasıyla)
+kurar ve geçmişin büyüyen öneklerinde ilerletir: ``min_bars``,
+``min_bars * eta``, ... ve son olarak tüm seri. Her kontrol noktasında
+
+* kill-switch ``FLAT`` önerdiyse (sert düşüş) konfigürasyon hemen elenir,
+* kalanlar ``MetricsSummary`` üzerinden ``score`` ile sıralanır ve yalnızca en
+  iyi ``1/eta``'lık kısım sonraki kontrol noktasına devam eder.
+
+Koşucular durumlarını koruduğundan önekler yeniden oynatılmaz; her
+konfigürasyon yalnızca ulaştığı yere kadar bar tüketir. Bandit keşfi global
+NumPy rastgele durumunu kullandığı için her konfigürasyonun durumu ayrı
+saklanır; sonuçlar konfigürasyonu tek başına tam çalıştırmakla aynıdır.
+
+Örnek:
+    from src.evaluation.sweep import successive_halving
+
+    grid = [{"sizing.beta_sharpe": b, "metrics.penalties.alpha_cap": c} for b in (0.1, 0.3) for c in (2, 5)]
+    result = successive_halving(ohlcv, grid, min_bars=500, eta=2)
+    print(result.best.overrides, result.best.summary, result.bars_processed)
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from src.config.settings import Settings, get_settings, override_settings
+from src.data.feature_store import cached_feature_matrix
+from src.evaluation.metrics import MetricsSummary
+from src.evaluation.replay import OHLCV_COLUMNS, ReplayRunner
+
+Score = Callable[[MetricsSummary], float]
+
+
+def sharpe_score(summary: MetricsSummary) -> float:
+    """Varsayılan sıralama ölçütü: Sharpe (NaN en kötü sayılır)."""
+
+    return summary.sharpe if math.isfinite(summary.sharpe) else float("-inf")
+
+
+@dataclass
+class TrialResult:
+    """Tek konfigürasyonun sonucu; ``pruned_at`` elendiği önek uzunluğudur (bitirdiyse ``None``)."""
+
+    index: int
+    overrides: Dict[str, Any]
+    bars: int
+    summary: MetricsSummary
+    score: float
+    kill_status: str
+    pruned_at: Optional[int] = None
+    reason: str = ""
+
+
+@dataclass
+class SweepResult:
+    trials: List[TrialResult]
+    checkpoints: List[int]
+
+    @property
+    def finished(self) -> List[TrialResult]:
+        return [trial for trial in self.trials if trial.pruned_at is None]
+
+    @property
+    def best(self) -> TrialResult:
+        """Tüm seriyi bitirenlerin en iyisi; hiçbiri bitiremediyse en uzun süre dayanıp en iyi skoru alan."""
+
+        pool = self.finished or self.trials
+        return max(pool, key=lambda trial: (trial.bars, trial.score))
+
+    @property
+    def bars_processed(self) -> int:
+        return sum(trial.bars for trial in self.trials)
+
+
+def checkpoints(n_bars: int, min_bars: int, eta: int) -> List[int]:
+    """``min_bars * eta**k`` önek uzunlukları; son kontrol noktası her zaman ``n_bars``."""
+
+    if min_bars <= 0 or eta < 2:
+        raise ValueError("min_bars pozitif, eta en az 2 olmalıdır.")
+    points: List[int] = []
+    budget = min_bars
+    while budget < n_bars:
+        points.append(budget)
+        budget *= eta
+    points.append(n_bars)
+    return points
+
+
+class _Trial:
+    def __init__(self, index: int, overrides: Mapping[str, Any], runner: ReplayRunner, seed: int) -> None:
+        self.index = index
+        self.overrides = dict(overrides)
+        self.runner = runner
+        self.rng_state = np.random.RandomState(seed).get_state()
+        self.result: Optional[TrialResult] = None
+
+    def advance_to(self, bars: int, score: Score) -> TrialResult:
+        np.random.set_state(self.rng_state)
+        self.runner.advance(bars - self.runner.cursor)
+        self.rng_state = np.random.get_state()
+        summary = self.runner.summary()
+        self.result = TrialResult(
+            index=self.index,
+            overrides=self.overrides,
+            bars=self.runner.cursor,
+            summary=summary,
+            score=score(summary),
+            kill_status=self.runner.kill_status,
+        )
+        return self.result
+
+
+def successive_halving(
+    ohlcv: np.ndarray,
+    configs: Sequence[Mapping[str, Any]],
+    *,
+    min_bars: Optional[int] = None,
+    eta: Optional[int] = None,
+    score: Score = sharpe_score,
+    seed: int = 0,
+    settings: Optional[Settings] = None,
+    features: Optional[np.ndarray] = None,
+) -> SweepResult:
+    """Konfigürasyonları büyüyen öneklerde değerlendir, umutsuzları erkenden ele.
+
+    ``configs`` her biri noktalı ayar yollarından (``"safety.drawdown_hard"``)
+    değerlere eşleme olan override sözlükleridir. Özellik matrisi tüm
+    konfigürasyonlar için bir kez hesaplanır; bu yüzden ``features.*``
+    override'ları desteklenmez.
+    """
+
+    base = settings or get_settings()
+    min_bars = min_bars or base.sweep.min_bars
+    eta = eta or base.sweep.eta
+    ohlcv = np.asarray(ohlcv, dtype=np.float64)
+    if not configs:
+        raise ValueError("En az bir konfigürasyon verilmelidir.")
+    for overrides in configs:
+        if any(path.split(".")[0] == "features" for path in overrides):
+            raise ValueError("features.* override'ları taramada desteklenmez (özellik matrisi paylaşılır).")
+    if features is None:
+        arrays = {col: ohlcv[:, i] for i, col in enumerate(OHLCV_COLUMNS) if i}
+        features = cached_feature_matrix(arrays)
+    points = checkpoints(len(ohlcv), min_bars, eta)
+
+    trials = []
+    for i, overrides in enumerate(configs):
+        runner = ReplayRunner(ohlcv, features=features, settings=override_settings(base, overrides))
+        trials.append(_Trial(i, overrides, runner, seed + i))
+    outer_state = np.random.get_state()
+    try:
+        alive = trials
+        for budget in points[:-1]:
+            alive = _prune(alive, [trial.advance_to(budget, score) for trial in alive], budget, eta)
+            if not alive:
+                break
+        else:
+            for trial in alive:
+                trial.advance_to(points[-1], score)
+    finally:
+        np.random.set_state(outer_state)
+    return SweepResult(trials=[trial.result for trial in trials], checkpoints=points)
+
+
+def _prune(alive: List[_Trial], results: List[TrialResult], budget: int, eta: int) -> List[_Trial]:
+    """Kill-switch ``FLAT`` olanları ele, kalanların en iyi ``ceil(n/eta)`` tanesini tut."""
+
+    survivors = []
+    for trial, result in zip(alive, results, strict=True):
+        if result.kill_status == "FLAT":
+            result.pruned_at, result.reason = budget, "kill_switch"
+        else:
+            survivors.append(trial)
+    survivors.sort(key=lambda trial: trial.result.score, reverse=True)
+    keep = math.ceil(len(alive) / eta)
+    for trial in survivors[keep:]:
+        trial.result.pruned_at, trial.result.reason = budget, "rank"
+    return survivors[:keep]
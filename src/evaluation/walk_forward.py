@@ -0,0 +1,149 @@
+"""Walk-forward ve anchored çapraz doğrulama motoru.
+
+Tarihsel bar serisini eğitim/test katlarına böler. Her katta bandit ve kısıt
+değerleyicisi eğitim barlarında ısıtılır, test barlarında değerlendirilir;
+katlar süreç havuzunda eşzamanlı koşar ve her kat ile tümü için
+``MetricsSummary`` üretilir.
+
+Örnek:
+    from src.data.live_feed import HistoricalCSVFeed, HistoricalCSVFeedConfig
+    from src.evaluation.walk_forward import walk_forward
+
+    feed = HistoricalCSVFeed(HistoricalCSVFeedConfig(path="data/btcusdt_1m_2023-01-01.csv"))
+    result = walk_forward(feed.bars, train_size=400, test_size=200, max_workers=4)
+    print(result.overall)
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.evaluation.metrics import MetricsSummary, compute_summary
+from src.evaluation.replay import ReplayRunner, bars_to_array
+from src.utils.types import BarData
+
+
+@dataclass(frozen=True)
+class Fold:
+    """Tek bir eğitim/test bölümünün yarı açık ``[start, end)`` indeksleri."""
+
+    index: int
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+@dataclass
+class FoldResult:
+    fold: Fold
+    summary: MetricsSummary
+    pnls: np.ndarray
+    equity: np.ndarray
+
+
+@dataclass
+class WalkForwardResult:
+    folds: List[FoldResult]
+    overall: MetricsSummary
+
+    def fold_summaries(self) -> List[MetricsSummary]:
+        return [fold.summary for fold in self.folds]
+
+
+def make_folds(
+    n_bars: int,
+    train_size: int,
+    test_size: int,
+    step: Optional[int] = None,
+    anchored: bool = False,
+) -> List[Fold]:
+    """Bar sayısına göre katları üret.
+
+    Kayan (rolling) modda eğitim penceresi sabit uzunlukta ilerler; anchored
+    modda eğitim her zaman serinin başından başlar ve büyür. ``step``
+    verilmezse test uzunluğu kadar kaydırılır.
+    """
+
+    if train_size <= 0 or test_size <= 0:
+        raise ValueError("train_size ve test_size pozitif olmalıdır.")
+    step = test_size if step is None else step
+    if step <= 0:
+        raise ValueError("step pozitif olmalıdır.")
+
+    folds: List[Fold] = []
+    offset = 0
+    while True:
+        train_start = 0 if anchored else offset
+        train_end = offset + train_size
+        test_end = train_end + test_size
+        if test_end > n_bars:
+            break
+        folds.append(Fold(len(folds), train_start, train_end, train_end, test_end))
+        offset += step
+    return folds
+
+
+def walk_forward(
+    bars: Iterable[BarData] | pd.DataFrame | np.ndarray,
+    train_size: int,
+    test_size: int,
+    *,
+    step: Optional[int] = None,
+    anchored: bool = False,
+    max_workers: Optional[int] = None,
+    seed: int = 0,
+) -> WalkForwardResult:
+    """Katları (gerekirse paralel) değerlendir ve sonuçları birleştir.
+
+    ``max_workers=1`` katları aynı süreçte sırayla çalıştırır.
+    """
+
+    ohlcv = bars if isinstance(bars, np.ndarray) else bars_to_array(bars)
+    folds = make_folds(len(ohlcv), train_size, test_size, step=step, anchored=anchored)
+    if not folds:
+        raise ValueError("Bar serisi en az bir eğitim/test katı için yeterince uzun değil.")
+
+    jobs = [(ohlcv[f.train_start : f.test_end], f, seed) for f in folds]
+    if max_workers == 1:
+        results = [_run_fold(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_run_fold, *zip(*jobs, strict=True)))
+
+    return WalkForwardResult(folds=results, overall=_aggregate(results))
+
+
+def _run_fold(ohlcv: np.ndarray, fold: Fold, seed: int) -> FoldResult:
+    # Bandit keşfi global NumPy durumunu kullandığı için her kat kendi tohumunu alır.
+    np.random.seed(seed + fold.index)
+    runner = ReplayRunner(ohlcv)
+    runner.advance(fold.train_end - fold.train_start, record=False)
+    runner.reset_account()
+    runner.advance(fold.test_end - fold.test_start, record=True)
+    return FoldResult(
+        fold=fold,
+        summary=runner.summary(),
+        pnls=np.asarray(runner.recorded_pnls, dtype=float),
+        equity=np.asarray(runner.recorded_equity, dtype=float),
+    )
+
+
+def _aggregate(results: List[FoldResult]) -> MetricsSummary:
+    """Test PnL'lerini uç uca ekle; equity eğrilerini toplamsal olarak zincirle."""
+
+    pnls = np.concatenate([r.pnls for r in results])
+    segments = []
+    level = 1.0
+    for result in results:
+        if result.equity.size == 0:
+            continue
+        segments.append(result.equity - 1.0 + level)
+        level = segments[-1][-1]
+    equity = np.concatenate(segments) if segments else np.empty(0)
+    return compute_summary(pnls.tolist(), equity.tolist())
@@ -0,0 +1,111 @@
+"""Bar içi (tick) hızlı durdurma yolu.
+
+``RiskManager.kill_switch`` yalnızca kapanmış barlarda çalışır. ``IntrabarGuard``
+ise her fiyat güncellemesinde açık pozisyonun piyasa değerine göre düşüşünü
+O(1) işlemle hesaplar ve ``safety.drawdown_hard`` aşıldığında pozisyonu
+beklemeden kapatır. Ağır özellik/model yolunun dışında, ayrı bir asyncio
+görevinde koşar. Gecikme nanosaniye cinsinden, tick'in akışa ulaştığı anın
+damgasından (``(timestamp, price, received_ns)`` tick'lerinde akışın koyduğu
+``received_ns``) değerlendirmenin ve varsa kapatma aksiyonunun bitişine kadar
+ölçülür; kuyrukta bekleme süresi de dahildir. Damgasız ``(timestamp, price)``
+tick'lerde damga tüketim anında alınır ve yalnızca işleme süresi ölçülür.
+
+Örnek:
+    from src.execution.intrabar import IntrabarGuard
+
+    guard = IntrabarGuard(trader)
+    task = asyncio.create_task(guard.run(feed.stream_ticks()))
+    ...
+    print(guard.latency_stats())
+"""
+
+from __future__ import annotations
+
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.config.settings import get_settings
+from src.execution.simulator import PaperTrader
+from src.utils.time import Clock, get_clock
+
+
+class IntrabarGuard:
+    """Tick başına piyasa değeri düşüşünü izleyip sert limitte pozisyonu kapatır."""
+
+    def __init__(
+        self,
+        trader: PaperTrader,
+        clock: Optional[Clock] = None,
+        latency_samples: int = 4096,
+    ) -> None:
+        safety = get_settings().safety
+        self.trader = trader
+        self.drawdown_hard = safety.drawdown_hard
+        self.cooldown_seconds = safety.cooldown_after_stop_minutes * 60
+        self._clock = clock
+        self.peak_equity = trader.equity
+        self.tripped_until = float("-inf")
+        self.trips = 0
+        self.ticks = 0
+        self.action_latencies_ns: List[int] = []
+        self._tick_latencies = np.zeros(max(1, latency_samples), dtype=np.int64)
+
+    @property
+    def active(self) -> bool:
+        """Sert limit tetiklendikten sonra soğuma süresi dolana kadar ``True``."""
+
+        return (self._clock or get_clock()).now() < self.tripped_until
+
+    def on_price(self, price: float, received_ns: Optional[int] = None) -> bool:
+        """Yeni fiyatı değerlendir; pozisyon kapatıldıysa ``True`` döndür."""
+
+        started = received_ns if received_ns is not None else time.perf_counter_ns()
+        position = self.trader.position
+        flattened = False
+        if position is not None:
+            diff = price - position.entry_price
+            if position.side == "SHORT":
+                diff = -diff
+            equity = self.trader.equity + diff * position.size
+            if equity > self.peak_equity:
+                self.peak_equity = equity
+            elif self.peak_equity > 0 and self.peak_equity - equity > self.drawdown_hard * self.peak_equity:
+                self.trader.force_flatten(price)
+                self.peak_equity = self.trader.equity
+                self.tripped_until = (self._clock or get_clock()).now() + self.cooldown_seconds
+                self.trips += 1
+                flattened = True
+        elapsed = time.perf_counter_ns() - started
+        self._tick_latencies[self.ticks % len(self._tick_latencies)] = elapsed
+        self.ticks += 1
+        if flattened:
+            self.action_latencies_ns.append(elapsed)
+        return flattened
+
+    def on_bar(self, equity: float) -> None:
+        """Bar kapanışındaki gerçekleşmiş equity ile zirveyi güncelle."""
+
+        if equity > self.peak_equity:
+            self.peak_equity = equity
+
+    async def run(self, ticks: AsyncIterator[Tuple[float, ...]]) -> None:
+        """``(timestamp, price[, received_ns])`` tick akışını tüket."""
+
+        async for tick in ticks:
+            received_ns = tick[2] if len(tick) > 2 else time.perf_counter_ns()
+            self.on_price(tick[1], received_ns)
+
+    def latency_stats(self) -> Dict[str, float]:
+        """Tick değerlendirme ve tick'ten aksiyona gecikme istatistikleri (mikrosaniye)."""
+
+        count = min(self.ticks, len(self._tick_latencies))
+        samples = self._tick_latencies[:count]
+        stats = {"ticks": float(self.ticks), "trips": float(self.trips)}
+        if count:
+            p50, p99 = np.percentile(samples, [50, 99]) / 1000.0
+            stats.update(tick_p50_us=float(p50), tick_p99_us=float(p99), tick_max_us=float(samples.max() / 1000.0))
+        if self.action_latencies_ns:
+            stats["action_max_us"] = max(self.action_latencies_ns) / 1000.0
+        return stats
@@ -0,0 +1,128 @@
+"""Bar başı yürütme çekirdeği (sıcak yol).
+
+``PaperTrader.step``, ``RiskManager.position_size`` ve
+``RiskManager.kill_switch`` her barda ayar ağacını (``settings.runtime``,
+``settings.sizing``, ``settings.safety``) gezip aynı bölmeleri yeniden
+yapıyordu. ``HotConfig`` gereken tüm değerleri nesne kurulurken bir kez düz
+skalerlere indirger; ``trade_step`` ve ``risk_step`` yalnızca float/int
+argümanlarla çalışan, bar başına dataclass ya da sözlük ayırmayan
+fonksiyonlardır. ``risk_step`` ``kill_code`` ile ``sizing``'i tek çağrıda
+birleştirir. Sınıf API'leri değişmez; çekirdek onların arkasında çalışır.
+
+Örnek:
+    from src.execution.kernel import HotConfig, risk_step
+
+    hot = HotConfig.from_settings(get_settings())
+    kill_code, size = risk_step(hot, max_drawdown=0.05, sharpe=1.2, roi=0.01)
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Tuple
+
+# Pozisyon/karar yönü kodları (``ledger.SIDE_CODES`` ile aynı).
+SIDE_FLAT, SIDE_LONG, SIDE_SHORT = 0, 1, -1
+DECISION_SIDES = {"FLAT": SIDE_FLAT, "LONG": SIDE_LONG, "SHORT": SIDE_SHORT}
+
+# ``trade_step`` olayları.
+EVENT_NONE, EVENT_HOLD, EVENT_OPEN, EVENT_CLOSE = range(4)
+
+# ``risk.KILL_STATES`` sırasındaki kill-switch kodları.
+KILL_NORMAL, KILL_REDUCE, KILL_DECREASE_MODEL, KILL_FLAT = range(4)
+
+
+class HotConfig(NamedTuple):
+    """Sıcak yolda kullanılan, önceden hesaplanmış ayar skalerleri."""
+
+    fee: float
+    slippage: float
+    entry_factor: float
+    min_hold: int
+    size_base: float
+    beta0: float
+    beta_sharpe: float
+    beta_mdd: float
+    kappa_max: float
+    drawdown_soft: float
+    drawdown_hard: float
+    sharpe_floor: float
+    roi_floor: float
+
+    @classmethod
+    def from_settings(cls, settings) -> "HotConfig":
+        runtime, sizing, safety = settings.runtime, settings.sizing, settings.safety
+        slippage = runtime.slippage_bps / 10000
+        return cls(
+            fee=runtime.fee_bps / 10000,
+            slippage=slippage,
+            entry_factor=1 + slippage,
+            min_hold=int(runtime.min_hold_bars),
+            size_base=float(sizing.base),
+            beta0=float(sizing.beta0),
+            beta_sharpe=float(sizing.beta_sharpe),
+            beta_mdd=float(sizing.beta_mdd),
+            kappa_max=float(sizing.kappa_max),
+            drawdown_soft=float(safety.drawdown_soft),
+            drawdown_hard=float(safety.drawdown_hard),
+            sharpe_floor=float(safety.sharpe_floor),
+            roi_floor=float(safety.roi_floor),
+        )
+
+
+def trade_step(
+    hot: HotConfig,
+    side: int,
+    entry: float,
+    size: float,
+    bars_held: int,
+    close: float,
+    decision: int,
+    order_size: float,
+) -> Tuple[int, float]:
+    """Tek barlık işlem adımı; ``(olay, pnl)`` döndürür.
+
+    ``bars_held`` bu bar dahil tutulan bar sayısıdır. Açık pozisyon varsa
+    kapanışa göre değerlenir ve ``min_hold`` dolmuş, karar yön değiştirmişse
+    maliyetler düşülerek kapatılır; yoksa ``decision`` FLAT değilse ve
+    ``order_size`` pozitifse açılış bildirilir (giriş fiyatı
+    ``close * hot.entry_factor``).
+    """
+
+    if side:
+        diff = close - entry
+        if side == SIDE_SHORT:
+            diff = -diff
+        pnl = diff * size
+        if bars_held >= hot.min_hold and decision != side:
+            return EVENT_CLOSE, pnl - hot.fee - hot.slippage
+        return EVENT_HOLD, pnl
+    if decision and order_size > 0:
+        return EVENT_OPEN, 0.0
+    return EVENT_NONE, 0.0
+
+
+def kill_code(hot: HotConfig, max_drawdown: float, sharpe: float, roi: float) -> int:
+    """``risk.KILL_STATES`` sırasındaki kill-switch kodu."""
+
+    if max_drawdown > hot.drawdown_hard:
+        return KILL_FLAT
+    if max_drawdown > hot.drawdown_soft:
+        return KILL_REDUCE
+    if sharpe < hot.sharpe_floor:
+        return KILL_DECREASE_MODEL
+    if roi < hot.roi_floor:
+        return KILL_REDUCE
+    return KILL_NORMAL
+
+
+def sizing(hot: HotConfig, sharpe: float, max_drawdown: float) -> float:
+    """Sharpe ve düşüşe göre ``kappa_max`` ile sınırlanmış pozisyon boyutu."""
+
+    raw = hot.beta0 + hot.beta_sharpe * (sharpe - 0.5) - hot.beta_mdd * max(0.0, max_drawdown - 0.15)
+    return hot.size_base * max(0.0, min(hot.kappa_max, 0.5 + raw))
+
+
+def risk_step(hot: HotConfig, max_drawdown: float, sharpe: float, roi: float) -> Tuple[int, float]:
+    """Kill-switch kodu ve sonraki bar için pozisyon boyutu (tek çağrı)."""
+
+    return kill_code(hot, max_drawdown, sharpe, roi), sizing(hot, sharpe, max_drawdown)
@@ -0,0 +1,239 @@
+"""Sütunsal işlem defteri (trade ledger).
+
+``PaperTrader`` bar başına piyasa değerinden PnL üretir; ``TradeLedger`` ise
+gerçek gidiş-dönüşleri (giriş → çıkış) kaydeder. Her alan önceden ayrılmış ve
+gerektiğinde iki katına büyüyen ayrı bir NumPy dizisinde tutulur; kayıt başına
+maliyet birkaç skaler atamadır. İşlem istatistikleri milyonlarca işlemde de
+tek geçişlik vektörel işlemlerle hesaplanır. ``max_trades`` verilirse defter
+sınırlıdır: dolduğunda en eski işlemlerin yarısı atılır (``evicted``) ve
+istatistikler son işlemler üzerinden hesaplanır.
+
+Örnek:
+    from src.execution.ledger import TradeLedger
+    from src.execution.simulator import PaperTrader
+
+    ledger = TradeLedger()
+    trader = PaperTrader(ledger=ledger)
+    ...
+    stats = ledger.stats()
+    print(stats.winrate, stats.expectancy, stats.holding_percentiles)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.utils.types import Decision
+
+SIDE_CODES: Dict[str, int] = {"LONG": 1, "SHORT": -1}
+
+LEDGER_COLUMNS: Dict[str, np.dtype] = {
+    "entry_ts": np.dtype(np.int64),
+    "exit_ts": np.dtype(np.int64),
+    "side": np.dtype(np.int8),
+    "entry_price": np.dtype(np.float64),
+    "exit_price": np.dtype(np.float64),
+    "size": np.dtype(np.float64),
+    "bars_held": np.dtype(np.int32),
+    "fees": np.dtype(np.float64),
+    "slippage": np.dtype(np.float64),
+    "pnl": np.dtype(np.float64),
+    "mae": np.dtype(np.float64),
+    "mfe": np.dtype(np.float64),
+}
+
+HOLDING_QUANTILES = (0.5, 0.9, 0.99)
+
+
+@dataclass
+class TradeStats:
+    """Gidiş-dönüş işlemlerinden türetilen özet istatistikler."""
+
+    trades: int = 0
+    winrate: float = 0.0
+    profit_factor: float = 0.0
+    expectancy: float = 0.0
+    avg_win: float = 0.0
+    avg_loss: float = 0.0
+    total_pnl: float = 0.0
+    total_fees: float = 0.0
+    total_slippage: float = 0.0
+    avg_bars_held: float = 0.0
+    holding_percentiles: Dict[float, float] = field(default_factory=dict)
+    avg_mae: float = 0.0
+    avg_mfe: float = 0.0
+    long_share: float = 0.0
+
+
+class TradeLedger:
+    """Açık işlemi izleyip kapanan işlemleri sütunlara ekler."""
+
+    def __init__(self, capacity: int = 1024, max_trades: Optional[int] = None) -> None:
+        self.max_trades = max(2, int(max_trades)) if max_trades is not None else None
+        self._capacity = max(1, int(capacity))
+        if self.max_trades is not None:
+            self._capacity = min(self._capacity, self.max_trades)
+        self.evicted = 0
+        self._columns = {name: np.zeros(self._capacity, dtype=dtype) for name, dtype in LEDGER_COLUMNS.items()}
+        self._size = 0
+        self._open: list | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def is_open(self) -> bool:
+        return self._open is not None
+
+    def column(self, name: str) -> np.ndarray:
+        """Kapanmış işlemlerin tek bir sütununu (kopyasız görünüm) döndür."""
+
+        return self._columns[name][: self._size]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {name: values[: self._size] for name, values in self._columns.items()}
+
+    def open(
+        self,
+        timestamp: int,
+        side: Decision,
+        price: float,
+        size: float,
+        fee: float = 0.0,
+        slippage: float = 0.0,
+    ) -> None:
+        """Yeni işlemin girişini kaydet."""
+
+        # [entry_ts, side, entry_price, size, fees, slippage, mae, mfe]
+        self._open = [timestamp, SIDE_CODES[side], price, size, fee, slippage, 0.0, 0.0]
+
+    def mark(self, high: float, low: float) -> None:
+        """Bar aralığına göre açık işlemin en kötü/en iyi sapmasını (MAE/MFE) güncelle."""
+
+        trade = self._open
+        if trade is None:
+            return
+        entry, size = trade[2], trade[3]
+        if trade[1] > 0:
+            adverse, favorable = (low - entry) * size, (high - entry) * size
+        else:
+            adverse, favorable = (entry - high) * size, (entry - low) * size
+        if adverse < trade[6]:
+            trade[6] = adverse
+        if favorable > trade[7]:
+            trade[7] = favorable
+
+    def close(
+        self,
+        timestamp: int,
+        price: float,
+        bars_held: int,
+        pnl: float,
+        fee: float = 0.0,
+        slippage: float = 0.0,
+    ) -> None:
+        """Açık işlemi kapatıp sütunlara ekle; ``pnl`` giriş ücreti dahil net sonuçtur."""
+
+        trade = self._open
+        if trade is None:
+            return
+        if self._size == self._capacity:
+            if self.max_trades is not None and self._size >= self.max_trades:
+                self._evict()
+            else:
+                self._grow()
+        i = self._size
+        cols = self._columns
+        cols["entry_ts"][i] = trade[0]
+        cols["exit_ts"][i] = timestamp
+        cols["side"][i] = trade[1]
+        cols["entry_price"][i] = trade[2]
+        cols["exit_price"][i] = price
+        cols["size"][i] = trade[3]
+        cols["bars_held"][i] = bars_held
+        cols["fees"][i] = trade[4] + fee
+        cols["slippage"][i] = trade[5] + slippage
+        cols["pnl"][i] = pnl
+        cols["mae"][i] = trade[6]
+        cols["mfe"][i] = trade[7]
+        self._size = i + 1
+        self._open = None
+
+    def extend(self, **columns: np.ndarray) -> None:
+        """Hazır sütunlardan toplu ekleme (replay/test verisi için)."""
+
+        n = len(next(iter(columns.values())))
+        limit = self.max_trades
+        if limit is not None and n >= limit:
+            self.evicted += self._size + n - limit
+            columns = {name: np.asarray(values)[n - limit :] for name, values in columns.items()}
+            n, self._size = limit, 0
+        while limit is not None and self._size + n > limit:
+            self._evict()
+        while self._size + n > self._capacity:
+            self._grow()
+        for name, values in columns.items():
+            self._columns[name][self._size : self._size + n] = values
+        self._size += n
+
+    def stats(self) -> TradeStats:
+        return trade_stats(self.columns())
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        if self.max_trades is not None:
+            self._capacity = min(self._capacity, self.max_trades)
+        for name, values in self._columns.items():
+            grown = np.zeros(self._capacity, dtype=values.dtype)
+            grown[: self._size] = values[: self._size]
+            self._columns[name] = grown
+
+    def _evict(self) -> None:
+        drop = self._size // 2
+        keep = self._size - drop
+        for values in self._columns.values():
+            values[:keep] = values[drop : self._size]
+        self._size = keep
+        self.evicted += drop
+
+
+def trade_stats(columns: Dict[str, np.ndarray]) -> TradeStats:
+    """Sütunsal işlem kayıtlarından vektörel istatistik üret."""
+
+    pnl = np.asarray(columns["pnl"], dtype=np.float64)
+    n = pnl.size
+    if n == 0:
+        return TradeStats()
+    wins = pnl > 0
+    losses = pnl < 0
+    win_count = int(np.count_nonzero(wins))
+    loss_count = int(np.count_nonzero(losses))
+    gains = float(pnl[wins].sum())
+    loss_sum = float(-pnl[losses].sum())
+    bars_held = np.asarray(columns["bars_held"])
+    quantiles = np.quantile(bars_held, HOLDING_QUANTILES)
+    return TradeStats(
+        trades=n,
+        winrate=win_count / n,
+        profit_factor=gains / loss_sum if loss_sum > 0 else float("inf"),
+        expectancy=float(pnl.mean()),
+        avg_win=gains / win_count if win_count else 0.0,
+        avg_loss=-loss_sum / loss_count if loss_count else 0.0,
+        total_pnl=float(pnl.sum()),
+        total_fees=float(np.sum(columns["fees"])),
+        total_slippage=float(np.sum(columns["slippage"])),
+        avg_bars_held=float(bars_held.mean()),
+        holding_percentiles={q: float(v) for q, v in zip(HOLDING_QUANTILES, quantiles, strict=True)},
+        avg_mae=float(np.mean(columns["mae"])),
+        avg_mfe=float(np.mean(columns["mfe"])),
+        long_share=float(np.count_nonzero(np.asarray(columns["side"]) > 0) / n),
+    )
+
+
+def holding_histogram(columns: Dict[str, np.ndarray], bins: int = 20) -> tuple[np.ndarray, np.ndarray]:
+    """Tutma süresi (bar) dağılımının histogramı: ``(counts, edges)``."""
+
+    return np.histogram(np.asarray(columns["bars_held"]), bins=bins)
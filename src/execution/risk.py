@@ -10,8 +10,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
-from src.config.settings import get_settings
+from src.config.settings import Settings, get_settings
+from src.execution.kernel import HotConfig, kill_code, risk_step, sizing
+
+KILL_STATES = ("NORMAL", "REDUCE", "DECREASE_MODEL", "FLAT")
 
 
 @dataclass
@@ -23,33 +27,28 @@ class RiskState:
 
 
 class RiskManager:
-    """Kill-switch ve boyutlandırma mantığı."""
+    """Kill-switch ve boyutlandırma mantığı.
+
+    Eşikler kurulumda ``HotConfig``'e indirgenir; ``evaluate`` kill-switch ve
+    boyutlandırmayı ``RiskState`` kurmadan tek çağrıda hesaplar.
+    """
 
-    def __init__(self) -> None:
-        self.settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None) -> None:
+        self.settings = settings or get_settings()
+        self.hot = HotConfig.from_settings(self.settings)
 
     def position_size(self, sharpe: float, max_drawdown: float) -> float:
         """Dinamik boyutlandırmayı uygula."""
 
-        cfg = self.settings.sizing
-        base = cfg.base
-        beta0 = cfg.beta0
-        beta_sharpe = cfg.beta_sharpe
-        beta_mdd = cfg.beta_mdd
-        raw = beta0 + beta_sharpe * (sharpe - 0.5) - beta_mdd * max(0.0, max_drawdown - 0.15)
-        scaled = base * max(0.0, min(cfg.kappa_max, 0.5 + raw))
-        return scaled
+        return sizing(self.hot, sharpe, max_drawdown)
 
     def kill_switch(self, state: RiskState) -> str:
         """Risk metriklerine göre eylem öner."""
 
-        safety = self.settings.safety
-        if state.max_drawdown > safety.drawdown_hard:
-            return "FLAT"
-        if state.max_drawdown > safety.drawdown_soft:
-            return "REDUCE"
-        if state.sharpe < safety.sharpe_floor:
-            return "DECREASE_MODEL"
-        if state.roi < safety.roi_floor:
-            return "REDUCE"
-        return "NORMAL"
+        return KILL_STATES[kill_code(self.hot, state.max_drawdown, state.sharpe, state.roi)]
+
+    def evaluate(self, max_drawdown: float, sharpe: float, roi: float) -> tuple[str, float]:
+        """``(kill_switch durumu, sonraki pozisyon boyutu)``; bar başı sıcak yol."""
+
+        code, size = risk_step(self.hot, max_drawdown, sharpe, roi)
+        return KILL_STATES[code], size
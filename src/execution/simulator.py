@@ -13,7 +13,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
-from src.config.settings import get_settings
+from src.config.settings import Settings, get_settings
+from src.execution.kernel import DECISION_SIDES, EVENT_CLOSE, HotConfig, trade_step
+from src.execution.ledger import TradeLedger
+from src.utils.time import get_clock
 from src.utils.types import BarData, Decision
 
 
@@ -26,40 +29,82 @@ class Position:
 
 
 class PaperTrader:
-    """Basit PnL simülatörü."""
+    """Basit PnL simülatörü.
 
-    def __init__(self) -> None:
-        self.settings = get_settings()
+    ``ledger`` verilirse her gidiş-dönüş işlem giriş/çıkış ayrıntılarıyla
+    ``TradeLedger``'a kaydedilir; deftere trader'ın fiilen uyguladığı kayma
+    yazılır (girişte fiyata eklenen ``close * slippage * size``, çıkışta PnL'den
+    düşülen ``slippage``). Ücret/kayma/``min_hold`` kurulumda
+    ``HotConfig``'e indirgenir; bar adımı ``kernel.trade_step`` ile yapılır.
+    """
+
+    def __init__(self, ledger: Optional[TradeLedger] = None, settings: Optional[Settings] = None) -> None:
+        self.settings = settings or get_settings()
+        self.hot = HotConfig.from_settings(self.settings)
         self.position: Optional[Position] = None
         self.equity = 1.0
+        self.ledger = ledger
 
     def step(self, bar: BarData, decision: Decision, size: float) -> float:
         """Yeni barda pozisyonu güncelle ve PnL döndür."""
 
-        fee = self.settings.runtime.fee_bps / 10000
-        slippage = self.settings.runtime.slippage_bps / 10000
-        min_hold = self.settings.runtime.min_hold_bars
-
-        if self.position:
-            self.position.bars_held += 1
-            pnl = self._mark_to_market(bar)
-            if self.position.bars_held >= min_hold and decision != self.position.side:
-                exit_pnl = pnl - fee - slippage
-                self.equity += exit_pnl
+        hot = self.hot
+        position = self.position
+        if position is not None:
+            position.bars_held += 1
+            event, pnl = trade_step(
+                hot,
+                DECISION_SIDES[position.side],
+                position.entry_price,
+                position.size,
+                position.bars_held,
+                bar.close,
+                DECISION_SIDES[decision],
+                size,
+            )
+            if self.ledger is not None:
+                self.ledger.mark(bar.high, bar.low)
+            if event == EVENT_CLOSE:
+                self.equity += pnl
+                if self.ledger is not None:
+                    self.ledger.close(
+                        bar.timestamp, bar.close, position.bars_held, pnl - hot.fee, hot.fee, hot.slippage
+                    )
                 self.position = None
-                return exit_pnl
             return pnl
 
         if decision != "FLAT" and size > 0:
-            self.position = Position(side=decision, entry_price=bar.close * (1 + slippage), size=size)
-            self.position.bars_held = 0
-            self.equity -= fee
+            self.position = Position(side=decision, entry_price=bar.close * hot.entry_factor, size=size)
+            self.equity -= hot.fee
+            if self.ledger is not None:
+                self.ledger.open(
+                    bar.timestamp, decision, self.position.entry_price, size, hot.fee, bar.close * hot.slippage * size
+                )
         return 0.0
 
-    def _mark_to_market(self, bar: BarData) -> float:
+    def force_flatten(self, price: float) -> float:
+        """Açık pozisyonu bar kapanışını beklemeden verilen fiyattan kapat."""
+
+        if not self.position:
+            return 0.0
+        fee = self.hot.fee
+        slippage = self.hot.slippage
+        exit_pnl = self.unrealized_pnl(price) - fee - slippage
+        self.equity += exit_pnl
+        if self.ledger is not None:
+            self.ledger.mark(price, price)
+            self.ledger.close(
+                int(get_clock().now()), price, self.position.bars_held, exit_pnl - fee, fee, slippage
+            )
+        self.position = None
+        return exit_pnl
+
+    def unrealized_pnl(self, price: float) -> float:
+        """Açık pozisyonun verilen fiyattaki gerçekleşmemiş PnL'i."""
+
         if not self.position:
             return 0.0
-        price_diff = (bar.close - self.position.entry_price)
+        price_diff = price - self.position.entry_price
         if self.position.side == "SHORT":
             price_diff = -price_diff
         return price_diff * self.position.size
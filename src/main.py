@@ -8,23 +8,46 @@ from __future__ import annotations
 
 import asyncio
 import signal
+import time
 from collections import deque
-from typing import Any, Deque, Optional
+from typing import Any, Deque, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from src.config.settings import get_settings
-from src.data.feature_engineering import compute_features
-from src.data.live_feed import BinanceLiveFeed, HistoricalCSVFeed, HistoricalCSVFeedConfig
+from src.data.catalog import CatalogFeed, DataCatalog
+from src.data.feature_engineering import BASE_COLUMNS, compute_feature_matrix, compute_features
+from src.data.live_feed import BinanceLiveFeed, HistoricalCSVFeed, HistoricalCSVFeedConfig, TailCSVFeed
+from src.data.resample import MultiTimeframeAggregator, ResampledFeed
+from src.evaluation.exporter import (
+    STAGE_CONSTRAINTS,
+    STAGE_DECIDE,
+    STAGE_FEATURES,
+    STAGE_LEARN,
+    STAGE_STEP,
+    STAGE_TOTAL,
+    PipelineMetrics,
+    PrometheusExporter,
+)
+from src.evaluation.history import EquityHistory
+from src.evaluation.journal import RunJournal
 from src.evaluation.metrics import compute_summary
 from src.evaluation.reporting import LiveReporter
-from src.execution.risk import RiskManager, RiskState
+from src.execution.intrabar import IntrabarGuard
+from src.execution.ledger import TradeLedger
+from src.execution.risk import RiskManager
 from src.execution.simulator import PaperTrader
 from src.policy.bandit import ConstraintAwareBandit
 from src.policy.constraints import ConstraintEvaluator
 from src.signals.decision import BlendInput, DecisionBlender
+from src.signals.lazy import EVALUATE, LazyDecisionGate
+from src.utils.buffers import BarWindow, FloatRing
+from src.utils.deadline import DecisionDeadline
 from src.utils.logging import setup_logger
+from src.utils.memory import MemoryProfiler
+from src.utils.sampler import StackSampler, install_signal_toggle
+from src.utils.time import Clock, build_clock, set_clock
 
 LOGGER = setup_logger()
 
@@ -38,45 +61,229 @@ async def run_pipeline(
     blender: Optional[DecisionBlender] = None,
     reporter: Optional[LiveReporter] = None,
     risk: Optional[RiskManager] = None,
+    journal: Optional[RunJournal] = None,
+    clock: Optional[Clock] = None,
+    aggregator: Optional[MultiTimeframeAggregator] = None,
+    intrabar: Optional[IntrabarGuard] = None,
+    metrics: Optional[PipelineMetrics] = None,
+    exporter: Optional[PrometheusExporter] = None,
+    memory_profiler: Optional[MemoryProfiler] = None,
+    history: Optional[EquityHistory] = None,
+    deadline: Optional[DecisionDeadline] = None,
+    lazy: Optional[LazyDecisionGate] = None,
     max_steps: Optional[int] = None,
 ) -> None:
-    """Canlı akışı başlat."""
+    """Canlı akışı başlat.
+
+    ``clock`` verilmezse ``runtime.clock`` ayarından kurulur; pipeline
+    süresince süreç genelinde etkin saat yapılır, çıkışta önceki saat geri
+    yüklenir. ``runtime.higher_timeframes`` doluysa (ya da
+    ``aggregator`` verilirse) akış üst zaman dilimi birleştiricisinden geçirilir
+    ve onun özellikleri temel özellik vektörüne eklenir. Akış ``stream_ticks``
+    sağlıyorsa bar içi fiyatlar ayrı bir görevde ``IntrabarGuard`` ile izlenir.
+    ``ledger.enabled`` açıksa varsayılan ``PaperTrader``'a ``ledger.max_trades``
+    ile sınırlı bir ``TradeLedger`` bağlanır.
+    ``monitoring.enabled`` açıksa (ya da ``exporter`` verilirse) ``metrics``
+    sayaçları aynı döngüde çalışan Prometheus uç noktasından yayınlanır. Aşama
+    süreleri ve sayaçlar yalnızca okuyan biri varsa (exporter, izleme ayarı ya da
+    ``metrics``'i veren gözetmen) güncellenir; aksi halde bar başına ölçüm yapılmaz.
+    ``memory_profiling.enabled`` açıksa (ya da ``memory_profiler`` verilirse)
+    bar başı bellek ayırmaları ölçülür ve çıkışta raporlanır. ``history``
+    tüm oturumun equity geçmişini sınırlı bellekle tutar (verilmezse kurulur).
+    ``compact.enabled`` açıksa bar penceresi, PnL/equity pencereleri ve equity
+    geçmişi önceden ayrılmış ``float32`` dizilerde tutulur ve özellikler
+    ``float32`` hesaplanır. ``deadline.enabled`` açıksa (ya da ``deadline``
+    verilirse) özellik hesabı ve eylem seçimi bar başı süre sınırıyla çalışır;
+    süre aşılırsa yedek eylem kullanılır ve öğrenme ertelenir. ``lazy.enabled``
+    açıksa (ya da ``lazy`` verilirse) sakin ya da ``min_hold`` ile kilitli
+    barlarda önbellekteki karar yeniden kullanılır.
+    """
 
     settings = get_settings()
     feed = feed or _build_feed(settings)
-    trader = trader or PaperTrader()
+    if trader is None:
+        ledger = TradeLedger(max_trades=settings.ledger.max_trades) if settings.ledger.enabled else None
+        trader = PaperTrader(ledger=ledger)
     bandit = bandit or ConstraintAwareBandit()
     constraints = constraints or ConstraintEvaluator()
     blender = blender or DecisionBlender()
     reporter = reporter or LiveReporter()
     risk = risk or RiskManager()
+    tick_source = getattr(feed, "stream_ticks", None)
+    if not getattr(feed, "ticks_enabled", True):
+        tick_source = None
+    if intrabar is None and tick_source is not None:
+        intrabar = IntrabarGuard(trader)
+    if aggregator is None and settings.runtime.higher_timeframes:
+        aggregator = MultiTimeframeAggregator(settings.runtime.higher_timeframes)
+    source_feed = feed
+    if aggregator is not None:
+        feed = ResampledFeed(feed, aggregator)
+    if journal is None and settings.journal.enabled:
+        journal = RunJournal.from_config(settings.journal)
+    if journal is not None:
+        await journal.start()
+    monitored = metrics is not None or exporter is not None or settings.monitoring.enabled
+    metrics = metrics or (exporter.metrics if exporter is not None else PipelineMetrics())
+    if exporter is None and settings.monitoring.enabled:
+        exporter = PrometheusExporter.from_config(
+            settings.monitoring, metrics, constraints=constraints, bandit=bandit, feed=source_feed
+        )
+    if exporter is not None:
+        await exporter.start()
+    if memory_profiler is None and settings.memory_profiling.enabled:
+        memory_profiler = MemoryProfiler.from_config(settings.memory_profiling)
+    if memory_profiler is not None:
+        memory_profiler.start()
+    if deadline is None and settings.deadline.enabled:
+        deadline = DecisionDeadline.from_settings(settings)
+    if lazy is None and settings.lazy.enabled:
+        lazy = LazyDecisionGate.from_settings(settings)
+    # Saat yalnızca bu pipeline süresince etkindir; çıkışta önceki saat geri yüklenir.
+    previous_clock = set_clock(clock or build_clock(settings.runtime.clock.mode, settings.runtime.clock.speed))
+    tick_task = None
+    if intrabar is not None and tick_source is not None:
+        tick_task = asyncio.create_task(intrabar.run(tick_source()))
+    try:
+        await _run_loop(
+            settings,
+            feed=feed,
+            trader=trader,
+            bandit=bandit,
+            constraints=constraints,
+            blender=blender,
+            reporter=reporter,
+            risk=risk,
+            journal=journal,
+            aggregator=aggregator,
+            intrabar=intrabar,
+            metrics=metrics,
+            monitored=monitored,
+            memory_profiler=memory_profiler,
+            history=history if history is not None else EquityHistory(
+                dtype=np.float32 if settings.compact.enabled else None
+            ),
+            deadline=deadline,
+            lazy=lazy,
+            max_steps=max_steps,
+        )
+    finally:
+        if tick_task is not None:
+            tick_task.cancel()
+            try:
+                await tick_task
+            except asyncio.CancelledError:
+                pass
+        if deadline is not None:
+            deadline.close()
+        if journal is not None:
+            await journal.close()
+        if exporter is not None:
+            await exporter.close()
+        if memory_profiler is not None:
+            LOGGER.info(f"Bellek raporu:\n{memory_profiler.stop().format()}\n")
+        set_clock(previous_clock)
+
 
-    bars: Deque[dict[str, float]] = deque(maxlen=200)
-    pnls: Deque[float] = deque(maxlen=settings.metrics.windows.winrate)
-    equity: Deque[float] = deque(maxlen=settings.metrics.windows.mdd)
+async def _run_loop(
+    settings,
+    *,
+    feed: Any,
+    trader: PaperTrader,
+    bandit: ConstraintAwareBandit,
+    constraints: ConstraintEvaluator,
+    blender: DecisionBlender,
+    reporter: LiveReporter,
+    risk: RiskManager,
+    journal: Optional[RunJournal],
+    aggregator: Optional[MultiTimeframeAggregator],
+    intrabar: Optional[IntrabarGuard],
+    metrics: PipelineMetrics,
+    monitored: bool,
+    memory_profiler: Optional[MemoryProfiler],
+    history: EquityHistory,
+    deadline: Optional[DecisionDeadline],
+    lazy: Optional[LazyDecisionGate],
+    max_steps: Optional[int],
+) -> None:
+    """Bar akışını tüket ve her bar için karar/öğrenme adımını işle."""
+
+    def learn(features: np.ndarray, action: str, reward: float) -> None:
+        bandit.update_feedback(features.astype(np.float64), action, reward)
+
+    compact = settings.compact.enabled
+    if compact:
+        window = BarWindow(settings.compact.bar_window, dtype=np.float32)
+        pnls: Any = FloatRing(settings.metrics.windows.winrate, dtype=np.float32)
+        equity: Any = FloatRing(settings.metrics.windows.mdd, dtype=np.float32)
+    else:
+        bars: Deque[dict[str, float]] = deque(maxlen=200)
+        pnls = deque(maxlen=settings.metrics.windows.winrate)
+        equity = deque(maxlen=settings.metrics.windows.mdd)
 
     step_count = 0
     position_size = risk.position_size(sharpe=0.0, max_drawdown=0.0)
     violation_level = 0.0
+    kill_status = "NORMAL"
+    features: Optional[np.ndarray] = None
+    chosen = decision = "FLAT"
     async for bar in feed.stream_klines():
-        bars.append({
-            "open": bar.open,
-            "high": bar.high,
-            "low": bar.low,
-            "close": bar.close,
-            "volume": bar.volume,
-        })
+        if memory_profiler is not None:
+            memory_profiler.on_bar()
+        if compact:
+            window.append(bar)
+        else:
+            bars.append({
+                "open": bar.open,
+                "high": bar.high,
+                "low": bar.low,
+                "close": bar.close,
+                "volume": bar.volume,
+            })
         step_count += 1
-        if len(bars) < 30:
+        if len(window if compact else bars) < 30:
             if max_steps is not None and step_count >= max_steps:
                 break
             continue
-        df = pd.DataFrame(list(bars))
-        features = compute_features(df).iloc[-1].to_numpy()
-        action = bandit.select_action(features.astype(np.float64), violation_level=violation_level)
+        if monitored:
+            started = time.perf_counter()
+        gate = lazy.check(bar, trader.position) if lazy is not None else EVALUATE
+        outcome = None
+        if gate == EVALUATE:
+            # Karar iş parçacığında çalışabileceği için pencerenin ve toplayıcının
+            # (tamponunu yeniden kullanan) özellik vektörünün kopyası verilir.
+            snapshot = window.matrix().copy() if compact else list(bars)
+            extra = aggregator.feature_vector().copy() if aggregator is not None else None
+            if deadline is None:
+                outcome = _decide(bandit, snapshot, extra, violation_level, monitored)
+            else:
+                outcome = await deadline.run(_decide, bandit, snapshot, extra, violation_level, monitored)
+            if outcome is not None:
+                features, chosen, feature_seconds = outcome
+                if monitored:
+                    metrics.observe(STAGE_FEATURES, feature_seconds)
+                    metrics.observe(STAGE_DECIDE, time.perf_counter() - started - feature_seconds)
+            else:
+                # Süre aşıldı: pozisyonu koru, kill-switch NORMAL değilse düzleş.
+                if kill_status != "NORMAL" or trader.position is None:
+                    chosen = "FLAT"
+                else:
+                    chosen = trader.position.side
+                if features is None:
+                    features = np.zeros(len(settings.features.names) + (len(extra) if extra is not None else 0))
+                if monitored:
+                    metrics.observe(STAGE_DECIDE, time.perf_counter() - started)
+        elif monitored:
+            metrics.decisions_skipped += 1
+        action = "FLAT" if intrabar is not None and intrabar.active else chosen
+        if monitored:
+            mark = time.perf_counter()
         pnl = trader.step(bar, action, position_size)
+        if intrabar is not None:
+            intrabar.on_bar(trader.equity)
         pnls.append(pnl)
         equity.append(trader.equity)
+        history.append(bar.timestamp, trader.equity)
 
         sharpe_estimate = 0.0
         if len(pnls) > 1:
@@ -98,29 +305,69 @@ async def run_pipeline(
         else:
             max_drawdown = 0.0
             roi_value = 0.0
+        if monitored:
+            now = time.perf_counter()
+            metrics.observe(STAGE_STEP, now - mark)
+            mark = now
 
         result = constraints.update(pnl, trader.equity)
-        bandit.update_feedback(features.astype(np.float64), action, result.reward)
-        blend_input = BlendInput(
-            model_scores={"LONG": 0.4, "SHORT": 0.3, "FLAT": 0.3},
-            rule_bias={"LONG": 0.33, "SHORT": 0.33, "FLAT": 0.34},
-            violation_level=result.violation_level,
-        )
-        decision = blender.blend(blend_input)
-        kill_status = risk.kill_switch(
-            RiskState(
-                equity=trader.equity,
-                max_drawdown=max_drawdown,
-                sharpe=sharpe_estimate,
-                roi=roi_value,
+        if monitored:
+            now = time.perf_counter()
+            metrics.observe(STAGE_CONSTRAINTS, now - mark)
+            mark = now
+        # Atlanan barda yeni eylem seçilmediği için öğrenilecek gözlem yoktur;
+        # boşta kalan süre ertelenmiş güncellemeleri uygulamak için kullanılır.
+        if deadline is None:
+            if gate == EVALUATE:
+                learn(features, action, result.reward)
+        else:
+            if gate == EVALUATE:
+                deadline.defer(features if outcome is not None else deadline.timed_out, action, result.reward)
+            deadline.drain(learn)
+            if monitored:
+                metrics.deadline_misses = deadline.misses
+                metrics.deferred_updates = len(deadline.deferred)
+        if monitored:
+            metrics.observe(STAGE_LEARN, time.perf_counter() - mark)
+        if gate == EVALUATE:
+            blend_input = BlendInput(
+                model_scores={"LONG": 0.4, "SHORT": 0.3, "FLAT": 0.3},
+                rule_bias={"LONG": 0.33, "SHORT": 0.33, "FLAT": 0.34},
+                violation_level=result.violation_level,
+            )
+            decision = blender.blend(blend_input)
+        # Rolling pencereler atlanan barlarda da kayar; kill-switch her barda değerlendirilir.
+        kill_status, next_position_size = risk.evaluate(max_drawdown, sharpe_estimate, roi_value)
+        if journal is not None:
+            journal.record(
+                bar,
+                features,
+                action,
+                decision,
+                pnl,
+                trader.equity,
+                result.penalty,
+                result.violation_level,
+                kill_status,
+                position_size,
             )
-        )
         LOGGER.info(
             f"Karar: {decision}, Bandit eylemi: {action}, Kill-switch: {kill_status}, "
             f"Sharpe≈{sharpe_estimate:.2f}, MDD≈{max_drawdown:.2%}, ROI≈{roi_value:.2%}\n"
         )
-        position_size = risk.position_size(sharpe=sharpe_estimate, max_drawdown=max_drawdown)
+        position_size = next_position_size
         violation_level = result.violation_level
+        if monitored:
+            metrics.bars_processed += 1
+            metrics.equity = trader.equity
+            metrics.sharpe = sharpe_estimate
+            metrics.mdd = max_drawdown
+            metrics.roi = roi_value
+            metrics.kill_state = kill_status
+            metrics.peak_equity = history.peak
+            metrics.all_time_mdd = history.max_drawdown
+            metrics.all_time_roi = history.roi
+            metrics.observe(STAGE_TOTAL, time.perf_counter() - started)
         if len(pnls) > 10:
             summary = compute_summary(pnls, equity)
             reporter.render(summary)
@@ -129,6 +376,32 @@ async def run_pipeline(
             break
 
 
+def _decide(
+    bandit: ConstraintAwareBandit,
+    window: Union[np.ndarray, list],
+    extra: Optional[np.ndarray],
+    violation_level: float,
+    timed: bool = True,
+) -> Tuple[np.ndarray, str, float]:
+    """Özellikleri hesapla ve eylemi seç; ``(özellikler, eylem, özellik süresi)`` döndürür.
+
+    ``window`` kompakt modda ``(5, N)`` float32 OHLCV matrisi, aksi halde bar
+    sözlükleri listesidir. ``timed`` kapalıysa süre ölçülmez (``0.0``).
+    """
+
+    started = time.perf_counter() if timed else 0.0
+    if isinstance(window, np.ndarray):
+        matrix = compute_feature_matrix(dict(zip(BASE_COLUMNS, window, strict=True)), dtype=window.dtype)
+        features = matrix[-1].copy()
+    else:
+        features = compute_features(pd.DataFrame(window)).iloc[-1].to_numpy()
+    if extra is not None:
+        features = np.concatenate([features, extra])
+    feature_seconds = time.perf_counter() - started if timed else 0.0
+    action = bandit.select_action(features.astype(np.float64), violation_level=violation_level)
+    return features, action, feature_seconds
+
+
 def _build_feed(settings):
     data_cfg = settings.runtime.data_source
     if data_cfg is None:
@@ -141,8 +414,27 @@ def _build_feed(settings):
         csv_config = HistoricalCSVFeedConfig(
             path=data_cfg.path,
             delay_seconds=float(data_cfg.delay_seconds),
+            follow=data_cfg.follow,
+            poll_min_seconds=float(data_cfg.poll_min_seconds),
+            poll_max_seconds=float(data_cfg.poll_max_seconds),
+            idle_timeout_seconds=data_cfg.idle_timeout_seconds,
+            ticks_path=data_cfg.ticks_path,
         )
+        if data_cfg.follow:
+            return TailCSVFeed(csv_config)
         return HistoricalCSVFeed(csv_config)
+    if data_type == "catalog":
+        if not data_cfg.root:
+            raise ValueError("Katalog veri kaynağı için root belirtilmelidir.")
+        return CatalogFeed(
+            DataCatalog(data_cfg.root),
+            symbol=data_cfg.symbol or settings.runtime.symbol,
+            start=data_cfg.start,
+            end=data_cfg.end,
+            timeframe=data_cfg.timeframe or settings.runtime.timeframe,
+            prefetch=data_cfg.prefetch,
+            delay_seconds=float(data_cfg.delay_seconds),
+        )
 
     raise ValueError(f"Desteklenmeyen veri kaynağı türü: {data_cfg.type}")
 
@@ -156,11 +448,18 @@ def main() -> None:
     loop = asyncio.get_event_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, lambda s=sig: shutdown(loop))
+    sampler = None
+    profiler_cfg = get_settings().sampling_profiler
+    if profiler_cfg.enabled:
+        sampler = StackSampler.from_config(profiler_cfg)
+        install_signal_toggle(loop, sampler, profiler_cfg.signal)
     try:
         loop.run_until_complete(run_pipeline())
     except asyncio.CancelledError:
         LOGGER.info("Kapatma isteği alındı, çıkılıyor...\n")
     finally:
+        if sampler is not None and sampler.running:
+            LOGGER.info(f"Profil yazıldı: {sampler.stop()}\n")
         loop.close()
 
 
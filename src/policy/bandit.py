@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 import numpy as np
 from sklearn.linear_model import SGDClassifier
 
-from src.config.settings import get_settings
+from src.config.settings import Settings, get_settings
 from src.utils.types import Decision
 
 ACTIONS = np.array(["LONG", "SHORT", "FLAT"], dtype=str)
@@ -14,11 +16,23 @@ ACTIONS = np.array(["LONG", "SHORT", "FLAT"], dtype=str)
 class ConstraintAwareBandit:
     """Basit bir SGD tabanlı sınıflandırıcı ile eylem seçer."""
 
-    def __init__(self) -> None:
-        self.settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None) -> None:
+        self.settings = settings or get_settings()
         self.model = SGDClassifier(loss="log_loss")
         self._is_initialized = False
-        self._exploration = self.settings.bandit.base_exploration
+        cfg = self.settings.bandit
+        self._exploration = cfg.base_exploration
+        # Bar başına ayar ağacını gezmemek için keşif sınırları bir kez hesaplanır.
+        self._severe_exploration = max(cfg.min_exploration, cfg.severe_penalty)
+        self._mild_exploration = max(cfg.min_exploration, cfg.mild_penalty)
+        self._max_exploration = cfg.max_exploration
+        self._recovery_rate = cfg.recovery_rate
+
+    @property
+    def exploration(self) -> float:
+        """Son seçimde kullanılan keşif oranı."""
+
+        return self._exploration
 
     def update_feedback(self, features: np.ndarray, action: Decision, reward: float) -> None:
         """Gözleme göre modeli güncelle."""
@@ -48,12 +62,9 @@ class ConstraintAwareBandit:
         """Kısıt ihlali şiddetine göre keşif oranını güncelle."""
 
         if violation_level >= 1.0:
-            self._exploration = max(self.settings.bandit.min_exploration, self.settings.bandit.severe_penalty)
+            self._exploration = self._severe_exploration
         elif violation_level > 0.0:
-            self._exploration = max(self.settings.bandit.min_exploration, self.settings.bandit.mild_penalty)
+            self._exploration = self._mild_exploration
         else:
-            self._exploration = min(
-                self.settings.bandit.max_exploration,
-                self._exploration + self.settings.bandit.recovery_rate,
-            )
+            self._exploration = min(self._max_exploration, self._exploration + self._recovery_rate)
         return self._exploration
@@ -1,10 +1,19 @@
 """Ödül ve kısıt yönetimi.
 
+``update`` bar başına akış halinde çalışır. ``update_batch`` kaydedilmiş bir
+çalışmanın tüm PnL/equity dizilerini işler: rolling metrikler kayan pencere
+görünümleriyle parça parça vektörel hesaplanır, yalnızca Lagrange
+çarpanlarının ardışık güncellemesi sıkı bir döngüde yürür. Sonuçlar aynı
+girdilerle art arda ``update`` çağrılarının verdiği değerlerle aynıdır ve
+değerlendirici durumu (pencereler, ``alphas``) akışa devam edilebilecek
+şekilde güncellenir.
+
 Örnek:
     from src.policy.constraints import ConstraintEvaluator
 
     evaluator = ConstraintEvaluator()
     result = evaluator.update(pnl=0.01, equity=1.02)
+    batch = ConstraintEvaluator().update_batch(pnls, equity_curve)
 """
 
 from __future__ import annotations
@@ -12,11 +21,12 @@ from __future__ import annotations
 import collections
 import math
 from dataclasses import dataclass
-from typing import Deque, Dict
+from typing import Callable, Deque, Dict, Optional
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-from src.config.settings import get_settings
+from src.config.settings import Settings, get_settings
 
 
 @dataclass
@@ -27,11 +37,27 @@ class ConstraintResult:
     violation_level: float
 
 
+@dataclass
+class ConstraintBatchResult:
+    """``update_batch`` çıktısı; ``alphas`` sütunları ``keys`` sırasındadır."""
+
+    reward: np.ndarray
+    penalty: np.ndarray
+    violation_level: np.ndarray
+    alphas: np.ndarray
+    keys: tuple[str, ...]
+    metrics: Dict[str, np.ndarray]
+
+
+# Parça başına (satır x pencere) geçici dizi boyutu üst sınırı.
+_BATCH_ELEMENTS = 1 << 22
+
+
 class ConstraintEvaluator:
     """Rolling metrikleri günceller ve cezaları hesaplar."""
 
-    def __init__(self) -> None:
-        self.settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None) -> None:
+        self.settings = settings or get_settings()
         win_window = self.settings.metrics.windows.winrate
         mdd_window = self.settings.metrics.windows.mdd
         self.pnl_window: Deque[float] = collections.deque(maxlen=win_window)
@@ -79,9 +105,7 @@ class ConstraintEvaluator:
         wins = sum(self.trade_outcomes)
         total = len(self.trade_outcomes)
         winrate = wins / total if total else 0.0
-        gains = sum(x for x in self.pnl_window if x > 0)
-        losses = -sum(x for x in self.pnl_window if x < 0)
-        profit_factor = gains / losses if losses > 0 else float("inf")
+        profit_factor = self._profit_factor(np.array(self.pnl_window))
         sharpe = self._rolling_sharpe(list(self.returns))
         roi = self._rolling_roi(list(self.equity_curve))
         mdd = self._max_drawdown(list(self.equity_curve))
@@ -113,30 +137,160 @@ class ConstraintEvaluator:
                 self.alphas[key] = max(penalties.alpha_floor, alpha * penalties.decrease_factor)
         return total_penalty, violation_level
 
+    def update_batch(self, pnls: np.ndarray, equity: np.ndarray) -> ConstraintBatchResult:
+        """Tüm PnL/equity dizisini tek seferde işle; ``update`` döngüsüyle aynı sonuçları üretir."""
+
+        pnls = np.asarray(pnls, dtype=np.float64)
+        equity = np.asarray(equity, dtype=np.float64)
+        if pnls.shape != equity.shape or pnls.ndim != 1:
+            raise ValueError("pnls ve equity aynı uzunlukta tek boyutlu diziler olmalıdır.")
+        windows = self.settings.metrics.windows
+        reward_cfg = self.settings.metrics.reward
+        # Pencereler aynı PnL dizisinin sonekleridir; uzun olan kısa olanı kapsar.
+        pnl_prefix = self.returns if len(self.returns) >= len(self.pnl_window) else self.pnl_window
+        pnl_all = np.concatenate([np.array(pnl_prefix, dtype=np.float64), pnls])
+        eq_all = np.concatenate([np.array(self.equity_curve, dtype=np.float64), equity])
+        pnl_offset, eq_offset = len(pnl_prefix), len(self.equity_curve)
+
+        win_window = windows.winrate
+        vola_window = min(reward_cfg.vola_window, win_window)
+        wins = _rolling_apply(pnl_all, pnl_offset, win_window, lambda w: np.count_nonzero(w > 0, axis=-1))
+        counts = np.minimum(np.arange(pnl_offset + 1, len(pnl_all) + 1), win_window)
+        metrics = {
+            "winrate": wins / counts,
+            "profit_factor": _rolling_apply(pnl_all, pnl_offset, win_window, self._profit_factor),
+            "sharpe": _rolling_apply(pnl_all, pnl_offset, windows.sharpe, self._rolling_sharpe),
+            "roi": _rolling_apply(eq_all, eq_offset, windows.mdd, self._rolling_roi),
+            "mdd": _rolling_apply(eq_all, eq_offset, windows.mdd, self._max_drawdown),
+        }
+        vola = _rolling_apply(pnl_all, pnl_offset, vola_window, _sample_std)
+        reward = reward_cfg.pnl_scale * pnls - reward_cfg.vola_lambda * vola
+
+        targets = self.settings.metrics.targets
+        penalties = self.settings.metrics.penalties
+        keys = tuple(self.alphas)
+        n = len(pnls)
+        alphas = np.empty((n, len(keys)), dtype=np.float64)
+        penalty = np.zeros(n, dtype=np.float64)
+        violation_level = np.zeros(n, dtype=np.float64)
+        for j, key in enumerate(keys):
+            target = getattr(targets, key)
+            if key == "mdd":
+                violation = np.maximum(0.0, metrics[key] - target)
+            else:
+                violation = np.maximum(0.0, target - metrics[key])
+            violated = violation > 0
+            alphas[:, j] = self._alpha_path(self.alphas[key], violated.tolist(), penalties)
+            self.alphas[key] = float(alphas[-1, j]) if n else self.alphas[key]
+            violation_level = np.where(
+                violated, np.maximum(violation_level, violation / (target + 1e-9)), violation_level
+            )
+            penalty = np.where(violated, penalty + alphas[:, j] * violation, penalty)
+
+        self.pnl_window.extend(pnls.tolist())
+        self.trade_outcomes.extend(np.where(pnls > 0, 1.0, 0.0).tolist())
+        self.returns.extend(pnls.tolist())
+        self.equity_curve.extend(equity.tolist())
+        return ConstraintBatchResult(
+            reward=reward - penalty,
+            penalty=penalty,
+            violation_level=violation_level,
+            alphas=alphas,
+            keys=keys,
+            metrics=metrics,
+        )
+
     @staticmethod
-    def _rolling_sharpe(returns: list[float]) -> float:
-        if len(returns) < 2:
-            return 0.0
-        arr = np.array(returns)
-        mean = arr.mean()
-        std = arr.std(ddof=1)
-        if std == 0:
-            return 0.0
-        return math.sqrt(252) * mean / std
+    def _alpha_path(alpha: float, violated: list, penalties) -> list:
+        """Çarpımsal çarpan güncellemesini ardışık uygula (akıştaki işlem sırasıyla)."""
+
+        cap, floor = penalties.alpha_cap, penalties.alpha_floor
+        up, down = penalties.increase_factor, penalties.decrease_factor
+        path = []
+        append = path.append
+        for hit in violated:
+            if hit:
+                alpha = min(cap, alpha * up)
+            else:
+                alpha = max(floor, alpha * down)
+            append(alpha)
+        return path
+
+    @staticmethod
+    def _profit_factor(pnl: np.ndarray) -> np.ndarray | float:
+        gains = np.where(pnl > 0, pnl, 0.0).sum(axis=-1)
+        losses = -np.where(pnl < 0, pnl, 0.0).sum(axis=-1)
+        if np.ndim(gains) == 0:
+            return float(gains / losses) if losses > 0 else float("inf")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(losses > 0, gains / losses, np.inf)
 
     @staticmethod
-    def _rolling_roi(equity: list[float]) -> float:
-        if len(equity) < 2:
-            return 0.0
-        start = equity[0]
-        if start <= 0:
-            return 0.0
-        return equity[-1] / start - 1
+    def _rolling_sharpe(returns) -> np.ndarray | float:
+        arr = np.asarray(returns, dtype=np.float64)
+        if arr.shape[-1] < 2:
+            return np.zeros(arr.shape[:-1]) if arr.ndim > 1 else 0.0
+        mean = arr.mean(axis=-1)
+        std = arr.std(ddof=1, axis=-1)
+        if arr.ndim == 1:
+            return 0.0 if std == 0 else math.sqrt(252) * mean / std
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(std == 0, 0.0, math.sqrt(252) * mean / std)
 
     @staticmethod
-    def _max_drawdown(equity: list[float]) -> float:
-        if not equity:
-            return 0.0
-        peaks = np.maximum.accumulate(equity)
-        drawdowns = (np.array(equity) - peaks) / peaks
-        return float(abs(drawdowns.min()))
+    def _rolling_roi(equity) -> np.ndarray | float:
+        arr = np.asarray(equity, dtype=np.float64)
+        if arr.shape[-1] < 2:
+            return np.zeros(arr.shape[:-1]) if arr.ndim > 1 else 0.0
+        start, end = arr[..., 0], arr[..., -1]
+        if arr.ndim == 1:
+            return 0.0 if start <= 0 else end / start - 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(start <= 0, 0.0, end / start - 1)
+
+    @staticmethod
+    def _max_drawdown(equity) -> np.ndarray | float:
+        arr = np.asarray(equity, dtype=np.float64)
+        if arr.shape[-1] == 0:
+            return np.zeros(arr.shape[:-1]) if arr.ndim > 1 else 0.0
+        peaks = np.maximum.accumulate(arr, axis=-1)
+        drawdowns = (arr - peaks) / peaks
+        result = np.abs(drawdowns.min(axis=-1))
+        return float(result) if arr.ndim == 1 else result
+
+
+def _sample_std(window: np.ndarray) -> np.ndarray | float:
+    """Ödüldeki oynaklık terimi: en az iki gözlemde ``ddof=1`` std, aksi halde 0."""
+
+    if window.shape[-1] < 2:
+        return np.zeros(window.shape[:-1]) if window.ndim > 1 else 0.0
+    return np.std(window, ddof=1, axis=-1)
+
+
+def _rolling_apply(
+    values: np.ndarray,
+    offset: int,
+    window: int,
+    func: Callable[[np.ndarray], np.ndarray | float],
+    chunk_elements: Optional[int] = None,
+) -> np.ndarray:
+    """``values[offset:]`` her konumu için son ``window`` elemana ``func`` uygula.
+
+    Pencere henüz dolmamış ilk konumlar akıştaki deque gibi kısmi pencereyle
+    tek tek, dolu pencereler ise ``sliding_window_view`` parçalarıyla
+    vektörel hesaplanır.
+    """
+
+    n = len(values) - offset
+    out = np.empty(n, dtype=np.float64)
+    window = max(1, int(window))
+    full_from = max(0, window - 1 - offset)
+    for k in range(min(full_from, n)):
+        out[k] = func(values[: offset + k + 1])
+    if full_from >= n:
+        return out
+    view = sliding_window_view(values, window)[offset + full_from - (window - 1) :]
+    step = max(1, (chunk_elements or _BATCH_ELEMENTS) // window)
+    for start in range(0, len(view), step):
+        out[full_from + start : full_from + start + step] = func(view[start : start + step])
+    return out
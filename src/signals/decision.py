@@ -5,15 +5,22 @@
 
     blender = DecisionBlender()
     decision = blender.blend(BlendInput({"LONG": 0.6}, {"FLAT": 0.8}, violation_level=0.0))
+
+    # Toplu (offline replay) kullanım: skorlar (N, 3) sırası LONG, SHORT, FLAT.
+    decisions = DecisionBlender(seed=7).blend_batch(scores, violations, rule_bias=[0.33, 0.33, 0.34])
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 import numpy as np
 
-from src.utils.types import Decision
+from src.utils.types import DECISIONS, Decision
+
+_DECISION_LABELS = np.array(DECISIONS, dtype=str)
+_FLAT_INDEX = DECISIONS.index("FLAT")
 
 
 @dataclass
@@ -26,21 +33,71 @@ class BlendInput:
 class DecisionBlender:
     """Model çıktısı ile kural tabanlı bias'ı harmanlar."""
 
-    def __init__(self, base_weight: float = 0.5) -> None:
+    def __init__(self, base_weight: float = 0.5, seed: Optional[int] = None) -> None:
         self.model_weight = base_weight
         self.rule_weight = 1 - base_weight
+        self._rng = np.random.default_rng(seed)
 
     def blend(self, data: BlendInput) -> Decision:
         """Ağırlıklı toplamdan karar üret."""
 
         model_weight = max(0.0, min(1.0, self.model_weight - 0.2 * data.violation_level))
         rule_weight = 1.0 - model_weight
-        combined = {}
-        for action in {"LONG", "SHORT", "FLAT"}:
-            combined[action] = model_weight * data.model_scores.get(action, 0.0) + rule_weight * data.rule_bias.get(action, 0.0)
-        probs = np.array(list(combined.values()), dtype=float)
-        if probs.sum() <= 0:
+        probs = np.array(
+            [
+                model_weight * data.model_scores.get(action, 0.0) + rule_weight * data.rule_bias.get(action, 0.0)
+                for action in DECISIONS
+            ],
+            dtype=float,
+        )
+        total = probs.sum()
+        if total <= 0:
             return "FLAT"
-        probs = probs / probs.sum()
-        choice = np.random.choice(list(combined.keys()), p=probs)
-        return str(choice)
+        idx = int(np.searchsorted(np.cumsum(probs / total), self._rng.random(), side="right"))
+        return DECISIONS[min(idx, len(DECISIONS) - 1)]
+
+    def blend_batch(
+        self,
+        model_scores: np.ndarray,
+        violation_levels: np.ndarray,
+        rule_bias: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """N bar için kararları tek vektörel hesapla üret.
+
+        ``model_scores`` ve ``rule_bias`` sütunları ``DECISIONS`` sırasını izler
+        (LONG, SHORT, FLAT). ``rule_bias`` (3,) ya da (N, 3) olabilir; verilmezse
+        sıfır kabul edilir. Olasılık toplamı sıfır olan satırlar FLAT döner.
+        Sonuç, ``Decision`` etiketlerinden oluşan (N,) dizisidir.
+        """
+
+        indices = self.blend_batch_indices(model_scores, violation_levels, rule_bias)
+        return _DECISION_LABELS[indices]
+
+    def blend_batch_indices(
+        self,
+        model_scores: np.ndarray,
+        violation_levels: np.ndarray,
+        rule_bias: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """``blend_batch`` ile aynı hesap; etiket yerine ``DECISIONS`` indekslerini döndürür."""
+
+        scores = np.asarray(model_scores, dtype=float)
+        if scores.ndim != 2 or scores.shape[1] != len(DECISIONS):
+            raise ValueError(f"model_scores (N, {len(DECISIONS)}) boyutunda olmalı: {scores.shape}")
+        violations = np.asarray(violation_levels, dtype=float).reshape(-1)
+        if violations.shape[0] != scores.shape[0]:
+            raise ValueError("violation_levels uzunluğu model_scores satır sayısıyla eşleşmeli.")
+        bias = np.zeros(len(DECISIONS)) if rule_bias is None else np.asarray(rule_bias, dtype=float)
+        if bias.shape not in {(len(DECISIONS),), scores.shape}:
+            raise ValueError(f"rule_bias boyutu geçersiz: {bias.shape}")
+
+        model_weight = np.clip(self.model_weight - 0.2 * violations, 0.0, 1.0)[:, None]
+        combined = model_weight * scores + (1.0 - model_weight) * bias
+        totals = combined.sum(axis=1)
+        valid = totals > 0
+        cdf = np.cumsum(combined, axis=1)
+        draws = self._rng.random(scores.shape[0]) * np.where(valid, totals, 1.0)
+        indices = (draws[:, None] >= cdf).sum(axis=1)
+        np.minimum(indices, len(DECISIONS) - 1, out=indices)
+        indices[~valid] = _FLAT_INDEX
+        return indices
@@ -0,0 +1,101 @@
+"""Sakin barlarda kararı yeniden hesaplamayan tembel (olay güdümlü) değerlendirme.
+
+``run_pipeline`` her barda tüm özellikleri hesaplar, bandit'i sorgular,
+``DecisionBlender.blend`` ve kill-switch'i çalıştırır; fiyat ve hacim
+neredeyse hiç değişmese de. Ayrıca açık pozisyon ``min_hold_bars`` dolmadan
+kapatılamadığından bu barlarda ``PaperTrader.step`` kararı zaten yok sayar.
+``LazyDecisionGate`` her bar için kararın yeniden değerlendirilmesi gerekip
+gerekmediğini söyler:
+
+* ``HOLD_LOCKED``: açık pozisyon bu barda ``min_hold`` dolmadan kapanamaz;
+  karar pozisyonu etkileyemez.
+* ``QUIET``: kapanış son değerlendirilen bara göre en çok ``price_threshold``
+  (göreli), hacim en çok ``volume_threshold`` (göreli) değişti. Referans son
+  değerlendirilen bar olduğundan küçük adımların birikimi de yakalanır.
+* ``EVALUATE``: diğer her durumda ve art arda ``max_skip_bars`` atlamadan sonra.
+
+Atlanan barlarda çağıran önbellekteki eylemi/kararı yeniden kullanır; özellik
+hesabı, model çağrısı ve harmanlama yapılmaz. Kill-switch her barda
+değerlendirilir.
+
+Örnek:
+    from src.signals.lazy import EVALUATE, LazyDecisionGate
+
+    gate = LazyDecisionGate.from_settings(get_settings())
+    if gate.check(bar, trader.position) == EVALUATE:
+        action = bandit.select_action(features)
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from src.config.settings import Settings
+from src.utils.types import BarData
+
+EVALUATE, QUIET, HOLD_LOCKED = range(3)
+
+
+class LazyDecisionGate:
+    """Girdiler eşiklerin altında kaldıkça önbellekteki kararın yeterli olduğunu bildirir."""
+
+    def __init__(
+        self,
+        price_threshold: float = 5e-4,
+        volume_threshold: float = 0.5,
+        max_skip_bars: int = 10,
+        min_hold: int = 0,
+    ) -> None:
+        self.price_threshold = float(price_threshold)
+        self.volume_threshold = float(volume_threshold)
+        self.max_skip_bars = int(max_skip_bars)
+        self.min_hold = int(min_hold)
+        self.reference_close: Optional[float] = None
+        self.reference_volume = 0.0
+        self.run_length = 0
+        self.evaluated = 0
+        self.skipped_quiet = 0
+        self.skipped_hold = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "LazyDecisionGate":
+        cfg = settings.lazy
+        return cls(
+            price_threshold=cfg.price_threshold,
+            volume_threshold=cfg.volume_threshold,
+            max_skip_bars=cfg.max_skip_bars,
+            min_hold=settings.runtime.min_hold_bars,
+        )
+
+    @property
+    def skipped(self) -> int:
+        return self.skipped_quiet + self.skipped_hold
+
+    def check(self, bar: BarData, position=None) -> int:
+        """Bu bar için ``EVALUATE``, ``QUIET`` ya da ``HOLD_LOCKED`` döndür.
+
+        ``position`` ``PaperTrader.position``'dır; ``bars_held`` bu bardan önceki
+        tutma süresidir (adımda bir artırılır).
+        """
+
+        reference = self.reference_close
+        if reference is None or self.run_length >= self.max_skip_bars:
+            return self._evaluate(bar)
+        if position is not None and position.bars_held + 1 < self.min_hold:
+            self.run_length += 1
+            self.skipped_hold += 1
+            return HOLD_LOCKED
+        if reference > 0 and abs(bar.close - reference) <= self.price_threshold * reference:
+            ref_volume = self.reference_volume
+            if abs(bar.volume - ref_volume) <= self.volume_threshold * max(ref_volume, 1e-12):
+                self.run_length += 1
+                self.skipped_quiet += 1
+                return QUIET
+        return self._evaluate(bar)
+
+    def _evaluate(self, bar: BarData) -> int:
+        self.reference_close = bar.close
+        self.reference_volume = bar.volume
+        self.run_length = 0
+        self.evaluated += 1
+        return EVALUATE
@@ -0,0 +1,385 @@
+"""Çok süreçli sembol paylaştırma (sharding) gözetmeni.
+
+Tek Python süreci pandas/sklearn yükü için tek çekirdeğe sıkışır.
+``ShardSupervisor`` sembolleri işçi süreçlere dağıtır:
+
+* Tek bir ingest süreci her sembolün barlarını kendi ``BarRing``'ine
+  (``multiprocessing.shared_memory``) yazar; işçiler halkaları pickle
+  etmeden, kopyasız okur.
+* Her işçi kendi sembolleri için ``run_pipeline``'ı ``ShmRingFeed`` ile
+  çalıştırır ve ``PipelineMetrics`` anlık görüntülerini bir kuyrukla
+  gözetmene gönderir.
+* ``journal.enabled`` / ``monitoring.enabled`` açıksa her pipeline kendi
+  günlüğünü (``runs/journal.bin`` → ``runs/journal.BTCUSDT.bin``) yazar ve
+  kendi portunu (``monitoring.port`` + sembolün ``symbols`` içindeki sırası)
+  dinler; aynı dosyaya yazan ya da aynı portu isteyen pipeline olmaz.
+* Çöken işçi (sıfırdan farklı çıkış kodu) ``max_restarts`` kez yeniden
+  başlatılır; okuma sırası paylaşımlı bellekte tutulduğundan yeni süreç
+  halkada kaldığı yerden devam eder (model ve hesap durumu sıfırdan kurulur).
+
+İşçiler yalnızca kendi halkalarını okur; tüm işçilerin ortak girdisi ingest
+sürecidir.
+
+Örnek:
+    python -m src.supervisor
+
+    from src.supervisor import CatalogSource, ShardSupervisor
+
+    supervisor = ShardSupervisor(["BTCUSDT", "ETHUSDT"], CatalogSource("data/catalog"), workers=2)
+    result = supervisor.run()
+    print(result.bars_per_second, result.restarts)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing as mp
+import os
+import queue as queue_module
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.config.settings import get_settings
+from src.data.catalog import DataCatalog, TimeBound, read_partition, to_epoch
+from src.data.shm_ring import BarRing, ShmRingFeed
+from src.evaluation.exporter import STAGE_TOTAL, PipelineMetrics, PrometheusExporter
+from src.evaluation.journal import RunJournal
+from src.policy.bandit import ConstraintAwareBandit
+from src.policy.constraints import ConstraintEvaluator
+from src.utils.logging import setup_logger
+from src.utils.types import BarData
+
+LOGGER = setup_logger()
+
+BarSource = Callable[[str], Iterable[BarData]]
+
+
+@dataclass
+class SupervisorResult:
+    """Gözetim çalışmasının özeti; ``reports`` sembol başına son metrik anlık görüntüsüdür."""
+
+    reports: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    restarts: Dict[int, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def bars_consumed(self) -> int:
+        return sum(int(report.get("bars_consumed", 0)) for report in self.reports.values())
+
+    @property
+    def bars_per_second(self) -> float:
+        return self.bars_consumed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class CatalogSource:
+    """Sembol başına katalog bölümlerini sırayla okuyan, pickle edilebilir bar kaynağı."""
+
+    def __init__(
+        self,
+        root: str,
+        timeframe: str = "1m",
+        start: TimeBound = None,
+        end: TimeBound = None,
+    ) -> None:
+        self.root = root
+        self.timeframe = timeframe
+        self.start = to_epoch(start)
+        self.end = to_epoch(end)
+
+    def __call__(self, symbol: str) -> Iterator[BarData]:
+        catalog = DataCatalog(self.root)
+        for partition in catalog.query(symbol, self.start, self.end, self.timeframe):
+            yield from read_partition(partition, self.start, self.end)
+
+
+def shard_symbols(symbols: List[str], workers: int) -> List[List[str]]:
+    """Sembolleri işçilere sırayla (round-robin) dağıt; boş paylar atılır."""
+
+    shards: List[List[str]] = [[] for _ in range(max(1, workers))]
+    for i, symbol in enumerate(symbols):
+        shards[i % len(shards)].append(symbol)
+    return [shard for shard in shards if shard]
+
+
+def pipeline_journal_path(path: str, symbol: str) -> str:
+    """Sembole özgü günlük yolu: ``runs/journal.bin`` → ``runs/journal.BTCUSDT.bin``."""
+
+    base = Path(path)
+    return str(base.with_name(f"{base.stem}.{symbol}{base.suffix}"))
+
+
+class ShardSupervisor:
+    """Ingest ve işçi süreçlerini başlatır, metrikleri toplar, çökenleri yeniden başlatır."""
+
+    def __init__(
+        self,
+        symbols: List[str],
+        source: BarSource,
+        *,
+        workers: Optional[int] = None,
+        ring_capacity: int = 4096,
+        max_restarts: int = 3,
+        report_interval_seconds: float = 1.0,
+        worker_target: Optional[Callable[..., None]] = None,
+        context: Optional[Any] = None,
+    ) -> None:
+        if not symbols:
+            raise ValueError("En az bir sembol verilmelidir.")
+        self.symbols = list(symbols)
+        self.source = source
+        self.workers = workers or os.cpu_count() or 1
+        self.ring_capacity = ring_capacity
+        self.max_restarts = max_restarts
+        self.report_interval_seconds = report_interval_seconds
+        self.worker_target = worker_target or worker_main
+        self._ctx = context or mp.get_context()
+
+    @classmethod
+    def from_settings(cls, source: BarSource, **overrides: Any) -> "ShardSupervisor":
+        settings = get_settings()
+        cfg = settings.sharding
+        options: Dict[str, Any] = dict(
+            workers=cfg.workers or None,
+            ring_capacity=cfg.ring_capacity,
+            max_restarts=cfg.max_restarts,
+            report_interval_seconds=cfg.report_interval_seconds,
+        )
+        options.update(overrides)
+        return cls(cfg.symbols or [settings.runtime.symbol], source, **options)
+
+    def run(self) -> SupervisorResult:
+        shards = shard_symbols(self.symbols, self.workers)
+        rings = {symbol: BarRing.create(self.ring_capacity) for symbol in self.symbols}
+        ring_names = {symbol: ring.name for symbol, ring in rings.items()}
+        reports: Dict[str, Dict[str, Any]] = {}
+        restarts = {index: 0 for index in range(len(shards))}
+        metrics_queue = self._ctx.Queue()
+        ingest = self._ctx.Process(
+            target=ingest_main, args=(self.source, ring_names), name="shard-ingest", daemon=True
+        )
+        processes: Dict[int, Any] = {}
+        started = time.perf_counter()
+        try:
+            ingest.start()
+            for index in range(len(shards)):
+                processes[index] = self._spawn(index, shards[index], ring_names, metrics_queue)
+            while processes:
+                self._drain(metrics_queue, reports, timeout=0.05)
+                for index, process in list(processes.items()):
+                    if process.is_alive():
+                        continue
+                    process.join()
+                    if process.exitcode == 0:
+                        del processes[index]
+                        continue
+                    if restarts[index] >= self.max_restarts:
+                        raise RuntimeError(
+                            f"İşçi {index} {restarts[index]} yeniden başlatmadan sonra yine çöktü "
+                            f"(çıkış kodu {process.exitcode})."
+                        )
+                    restarts[index] += 1
+                    LOGGER.warning(
+                        f"İşçi {index} çöktü (çıkış kodu {process.exitcode}), yeniden başlatılıyor "
+                        f"({restarts[index]}/{self.max_restarts}).\n"
+                    )
+                    processes[index] = self._spawn(index, shards[index], ring_names, metrics_queue)
+                if not ingest.is_alive() and ingest.exitcode not in (0, None):
+                    raise RuntimeError(f"Ingest süreci çöktü (çıkış kodu {ingest.exitcode}).")
+            ingest.join()
+            self._drain(metrics_queue, reports, timeout=0.0)
+        finally:
+            for process in [*processes.values(), ingest]:
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            metrics_queue.close()
+            for ring in rings.values():
+                ring.close()
+                ring.unlink()
+        return SupervisorResult(reports, restarts, time.perf_counter() - started)
+
+    def _spawn(self, index: int, symbols: List[str], ring_names: Dict[str, str], metrics_queue: Any) -> Any:
+        process = self._ctx.Process(
+            target=self.worker_target,
+            args=(index, symbols, {s: ring_names[s] for s in symbols}, metrics_queue, self.report_interval_seconds),
+            kwargs={"pipeline_offsets": {s: self.symbols.index(s) for s in symbols}},
+            name=f"shard-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        return process
+
+    @staticmethod
+    def _drain(metrics_queue: Any, reports: Dict[str, Dict[str, Any]], timeout: float) -> None:
+        try:
+            report = metrics_queue.get(timeout=timeout) if timeout else metrics_queue.get_nowait()
+            while True:
+                reports[report["symbol"]] = report
+                report = metrics_queue.get_nowait()
+        except queue_module.Empty:
+            return
+
+
+def ingest_main(source: BarSource, ring_names: Dict[str, str], poll_seconds: float = 0.0005) -> None:
+    """Her sembolün kaynağını sırayla okuyup halkasında yer oldukça yaz."""
+
+    rings = {symbol: BarRing.attach(name) for symbol, name in ring_names.items()}
+    iterators = {symbol: iter(source(symbol)) for symbol in rings}
+    try:
+        while iterators:
+            progressed = False
+            for symbol in list(iterators):
+                ring = rings[symbol]
+                while ring.free() > 0:
+                    bar = next(iterators[symbol], None)
+                    if bar is None:
+                        ring.close_writer()
+                        del iterators[symbol]
+                        break
+                    ring.write(bar, block=False)
+                    progressed = True
+            if not progressed:
+                time.sleep(poll_seconds)
+    finally:
+        for ring in rings.values():
+            ring.close()
+
+
+def worker_main(
+    worker_id: int,
+    symbols: List[str],
+    ring_names: Dict[str, str],
+    metrics_queue: Any,
+    report_interval_seconds: float = 1.0,
+    pipeline_offsets: Optional[Dict[str, int]] = None,
+) -> None:
+    """İşçi süreç girişi: sembol başına bir pipeline'ı aynı döngüde çalıştır.
+
+    ``pipeline_offsets`` sembolün tüm çalışmadaki sırasıdır; exporter portu bu
+    kadar kaydırılır (verilmezse işçi içindeki sıra).
+    """
+
+    offsets = pipeline_offsets or {symbol: i for i, symbol in enumerate(symbols)}
+    asyncio.run(_run_worker(worker_id, symbols, ring_names, metrics_queue, report_interval_seconds, offsets))
+
+
+class _QuietReporter:
+    def render(self, summary: Any) -> None:
+        pass
+
+
+def _pipeline_outputs(
+    settings: Any, symbol: str, offset: int, metrics: PipelineMetrics, **sources: Any
+) -> Tuple[Optional[RunJournal], Optional[PrometheusExporter]]:
+    """Pipeline'a özgü günlük yolu ve exporter portu (ayarda kapalıysa ``None``)."""
+
+    journal = exporter = None
+    if settings.journal.enabled:
+        journal = RunJournal.from_config(
+            replace(settings.journal, path=pipeline_journal_path(settings.journal.path, symbol))
+        )
+    if settings.monitoring.enabled:
+        port = settings.monitoring.port
+        # ``port: 0`` her pipeline için zaten ayrı bir rastgele port seçer.
+        config = replace(settings.monitoring, port=port + offset if port else 0)
+        exporter = PrometheusExporter.from_config(config, metrics, **sources)
+    return journal, exporter
+
+
+async def _run_worker(
+    worker_id: int,
+    symbols: List[str],
+    ring_names: Dict[str, str],
+    metrics_queue: Any,
+    report_interval_seconds: float,
+    pipeline_offsets: Dict[str, int],
+) -> None:
+    from src.main import run_pipeline
+
+    settings = get_settings()
+    rings = {symbol: BarRing.attach(ring_names[symbol]) for symbol in symbols}
+    metrics = {symbol: PipelineMetrics() for symbol in symbols}
+
+    def pipeline(symbol: str) -> Any:
+        # Günlük ve exporter ayardan kurulmasın diye açıkça verilir; yoksa her
+        # pipeline aynı dosyaya yazıp aynı portu dinlemeye çalışırdı.
+        feed, bandit, constraints = ShmRingFeed(rings[symbol]), ConstraintAwareBandit(), ConstraintEvaluator()
+        journal, exporter = _pipeline_outputs(
+            settings, symbol, pipeline_offsets[symbol], metrics[symbol], constraints=constraints, bandit=bandit, feed=feed
+        )
+        return run_pipeline(
+            feed=feed,
+            reporter=_QuietReporter(),
+            bandit=bandit,
+            constraints=constraints,
+            journal=journal,
+            exporter=exporter,
+            metrics=metrics[symbol],
+        )
+
+    def publish(done: bool) -> None:
+        for symbol in symbols:
+            m = metrics[symbol]
+            metrics_queue.put(
+                {
+                    "symbol": symbol,
+                    "worker": worker_id,
+                    "pid": os.getpid(),
+                    "bars_processed": m.bars_processed,
+                    "bars_consumed": rings[symbol].read_seq,
+                    "equity": m.equity,
+                    "sharpe": m.sharpe,
+                    "mdd": m.mdd,
+                    "roi": m.roi,
+                    "kill_state": m.kill_state,
+                    "busy_seconds": m.stage_seconds[STAGE_TOTAL],
+                    "done": done,
+                }
+            )
+
+    async def report_loop() -> None:
+        while True:
+            await asyncio.sleep(report_interval_seconds)
+            publish(done=False)
+
+    reporter_task = asyncio.create_task(report_loop())
+    try:
+        await asyncio.gather(*(pipeline(symbol) for symbol in symbols))
+    finally:
+        reporter_task.cancel()
+        try:
+            await reporter_task
+        except asyncio.CancelledError:
+            pass
+    publish(done=True)
+    for ring in rings.values():
+        ring.close()
+
+
+def main() -> None:
+    settings = get_settings()
+    data_cfg = settings.runtime.data_source
+    if data_cfg is None or data_cfg.type.lower() != "catalog" or not data_cfg.root:
+        raise ValueError("Sharding için runtime.data_source.type 'catalog' ve root belirtilmelidir.")
+    source = CatalogSource(
+        data_cfg.root,
+        timeframe=data_cfg.timeframe or settings.runtime.timeframe,
+        start=data_cfg.start,
+        end=data_cfg.end,
+    )
+    result = ShardSupervisor.from_settings(source).run()
+    for symbol, report in sorted(result.reports.items()):
+        LOGGER.info(
+            f"{symbol}: {report['bars_consumed']} bar, equity={report['equity']:.4f}, "
+            f"Sharpe≈{report['sharpe']:.2f}, kill-switch={report['kill_state']}\n"
+        )
+    LOGGER.info(
+        f"Toplam {result.bars_consumed} bar, {result.bars_per_second:.1f} bar/sn, "
+        f"yeniden başlatmalar: {result.restarts}\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Kompakt mod için önceden ayrılmış, sabit boyutlu NumPy halka tamponları.
+
+Varsayılan boru hattı her barı bir sözlüğe sarar, pencereleri Python
+float'larından oluşan deque'larda tutar ve özellikleri float64 ile hesaplar;
+float başına 24+ bayt nesne ve sözlük/DataFrame kurulumu, çok sembollü ve uzun
+pencereli dağıtımlarda çalışma kümesini şişirir. ``compact.enabled`` açıkken
+``run_pipeline`` bunların yerine buradaki tamponları (varsayılan ``float32``)
+kullanır:
+
+* ``BarWindow``: son ``capacity`` barın OHLCV sütunları. Her değer halkada iki
+  kez (``i`` ve ``i + capacity``) yazılır; böylece pencere her zaman bitişik bir
+  görünüm olarak, kopyasız okunur.
+* ``FloatRing``: aynı düzende tek sütunlu pencere (PnL, equity). ``deque``
+  yerine doğrudan kullanılabilmesi için ``append``, ``len``, yineleme ve
+  ``np.asarray`` desteği vardır.
+
+Döndürülen görünümler bir sonraki ``append``'e kadar geçerlidir.
+
+Örnek:
+    from src.utils.buffers import BarWindow, FloatRing
+
+    window = BarWindow(200)
+    window.append(bar)
+    matrix = compute_feature_matrix(window.arrays(), dtype=window.dtype)
+
+    pnls = FloatRing(50)
+    pnls.append(0.001)
+    summary = compute_summary(pnls, equity)
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+from src.utils.types import BarData
+
+_BAR_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class FloatRing:
+    """Son ``capacity`` değeri bitişik görünüm olarak veren sabit boyutlu halka."""
+
+    __slots__ = ("capacity", "dtype", "_data", "_pos", "_size")
+
+    def __init__(self, capacity: int, dtype: np.dtype = np.float32) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity pozitif olmalıdır.")
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros(2 * self.capacity, dtype=self.dtype)
+        self._pos = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: float) -> None:
+        pos = self._pos
+        self._data[pos] = self._data[pos + self.capacity] = value
+        self._pos = pos + 1 if pos + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+
+    def values(self) -> np.ndarray:
+        """Eskiden yeniye pencere (kopyasız görünüm)."""
+
+        end = self._pos + self.capacity if self._size == self.capacity else self._pos
+        return self._data[end - self._size : end]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.values()
+        return values.astype(dtype) if dtype is not None else values.copy()
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values().tolist())
+
+    def tolist(self) -> List[float]:
+        return self.values().tolist()
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+
+class BarWindow:
+    """Son ``capacity`` barın OHLCV sütunlarını tutan sabit boyutlu pencere."""
+
+    __slots__ = ("capacity", "dtype", "_data", "_pos", "_size")
+
+    def __init__(self, capacity: int = 200, dtype: np.dtype = np.float32) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity pozitif olmalıdır.")
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        # Sütun başına bitişik satır: (5, 2 * capacity).
+        self._data = np.zeros((len(_BAR_COLUMNS), 2 * self.capacity), dtype=self.dtype)
+        self._pos = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, bar: BarData) -> None:
+        pos = self._pos
+        row = (bar.open, bar.high, bar.low, bar.close, bar.volume)
+        self._data[:, pos] = row
+        self._data[:, pos + self.capacity] = row
+        self._pos = pos + 1 if pos + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+
+    def matrix(self) -> np.ndarray:
+        """Eskiden yeniye ``(5, len)`` görünüm; satırlar ``open, high, low, close, volume``."""
+
+        end = self._pos + self.capacity if self._size == self.capacity else self._pos
+        return self._data[:, end - self._size : end]
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """``compute_feature_matrix``'e doğrudan verilebilen sütun görünümleri."""
+
+        matrix = self.matrix()
+        return {col: matrix[i] for i, col in enumerate(_BAR_COLUMNS)}
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
@@ -0,0 +1,128 @@
+"""Bar başı karar süresi sınırı (deadline) ve ertelenmiş öğrenme kuyruğu.
+
+Özellik hesabı ve ``bandit.select_action`` eşzamanlı (senkron) çalışır; biri
+takılırsa asyncio döngüsü de takılır ve akış geride kalır. ``DecisionDeadline``
+karar adımını tek işçili bir iş parçacığı havuzunda çalıştırır ve sonucu en çok
+``budget_seconds`` bekler. Süre aşılırsa ``run`` ``None`` döndürür (çağıran
+ucuz bir yedek eylem kullanır) ve geç kalan görev arka planda bitirilir; o
+bitene kadar yeni karar görevi başlatılmaz, sonraki barlar doğrudan yedek
+eyleme düşer. Her iki durum da ``misses`` sayacına yazılır.
+
+Geç kalan görev modeli okurken ``partial_fit`` çağrılmaması ve sıcak yolun
+hafif kalması için öğrenme güncellemeleri ``defer`` ile kuyruğa alınır.
+``drain`` iş parçacığı boşta iken kuyruğu FIFO sırayla uygular; normal barda
+bu barın güncellemesine ek olarak en çok ``catchup_updates`` birikmiş
+güncelleme işlenir. Zaman aşımına uğramış barın güncellemesi, özellikleri geç
+görevin sonucundan alınarak uygulanır. Kuyruk ``max_deferred`` ile sınırlıdır;
+taşan en eski güncellemeler ``dropped`` sayacına yazılıp atılır.
+
+Örnek:
+    from src.utils.deadline import DecisionDeadline
+
+    deadline = DecisionDeadline(budget_seconds=0.5)
+    outcome = await deadline.run(decide, snapshot)
+    if outcome is None:
+        action = fallback
+    deadline.defer(outcome[0] if outcome else deadline.timed_out, action, reward)
+    deadline.drain(bandit.update_feedback)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Optional, Tuple, Union
+
+import numpy as np
+
+from src.config.settings import Settings
+
+FeatureSource = Union[np.ndarray, "asyncio.Future[Any]"]
+
+
+class DecisionDeadline:
+    """Karar adımını süre sınırıyla çalıştırır, öğrenmeyi boşta kalınca uygular."""
+
+    def __init__(
+        self,
+        budget_seconds: float,
+        *,
+        catchup_updates: int = 4,
+        max_deferred: int = 1024,
+    ) -> None:
+        if budget_seconds <= 0:
+            raise ValueError("budget_seconds pozitif olmalıdır.")
+        self.budget_seconds = float(budget_seconds)
+        self.catchup_updates = max(0, int(catchup_updates))
+        self.deferred: Deque[Tuple[FeatureSource, str, float]] = deque(maxlen=max(1, int(max_deferred)))
+        self.misses = 0
+        self.dropped = 0
+        # ``late``: hâlâ çalışabilecek son geç görev; ``timed_out``: son ``run``
+        # çağrısının geç kalan görevi (görev hiç başlatılmadıysa ``None``).
+        self.late: Optional[asyncio.Future[Any]] = None
+        self.timed_out: Optional[asyncio.Future[Any]] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="decide")
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "DecisionDeadline":
+        cfg = settings.deadline
+        budget = cfg.budget_seconds if cfg.budget_seconds is not None else settings.runtime.max_latency_seconds
+        return cls(budget, catchup_updates=cfg.catchup_updates, max_deferred=cfg.max_deferred)
+
+    @property
+    def busy(self) -> bool:
+        """Süresi aşılmış bir karar görevi hâlâ çalışıyor mu."""
+
+        return self.late is not None and not self.late.done()
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Optional[Any]:
+        """``func(*args)``'ı süre sınırıyla çalıştır; aşılırsa ya da önceki görev sürüyorsa ``None``."""
+
+        self.timed_out = None
+        if self.busy:
+            self.misses += 1
+            return None
+        future = asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.budget_seconds)
+        except asyncio.TimeoutError:
+            self.misses += 1
+            self.late = self.timed_out = future
+            # Görev sonunda hata verirse "Future exception was never retrieved" uyarısını önle.
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            return None
+
+    def defer(self, features: Optional[FeatureSource], action: str, reward: float) -> None:
+        """Öğrenme güncellemesini kuyruğa al; özellik yoksa (görev hiç başlamadıysa) at."""
+
+        if features is None:
+            self.dropped += 1
+            return
+        if len(self.deferred) == self.deferred.maxlen:
+            self.dropped += 1
+        self.deferred.append((features, action, reward))
+
+    def drain(self, update: Callable[[np.ndarray, str, float], None]) -> int:
+        """Karar iş parçacığı boştaysa bekleyen güncellemeleri uygula; uygulanan sayıyı döndür."""
+
+        if self.busy:
+            return 0
+        applied = 0
+        limit = 1 + self.catchup_updates
+        while self.deferred and applied < limit:
+            source, action, reward = self.deferred.popleft()
+            if isinstance(source, np.ndarray):
+                features = source
+            else:
+                if source.cancelled() or source.exception() is not None:
+                    self.dropped += 1
+                    continue
+                features = source.result()[0]
+            update(features, action, reward)
+            applied += 1
+        self.late = None
+        return applied
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,302 @@
+"""İsteğe bağlı bellek ve GC duraklama ölçümü.
+
+``MemoryProfiler`` uzun süren oturumlarda RSS sürünmesini ve GC duraklamalarını
+görünür kılar. ``tracemalloc`` açıkken her barda ``on_bar`` çağrısı iki O(1)
+işlemle o barın geçici bellek tepesini (bar içinde ayrılıp serbest bırakılan
+dahil) kaydeder. Her ``snapshot_interval_bars`` barda bir anlık görüntü alınır
+ve bir öncekiyle karşılaştırılarak modül başına bar başı net ayırma (bayt ve
+blok) hesaplanır; örnekleme anında ``gc.collect()`` çağrılarak ölçüm çöp
+toplama zamanlamasından bağımsız hale getirilir. GC duraklamaları
+``gc.callbacks`` üzerinden nesil bazında ölçülür (örneklemedeki toplamalar
+hariç).
+
+``warmup_bars`` verilirse ölçüm (tracemalloc dahil) o kadar bar sonra başlar;
+pencerelerin dolması, tembel önbellekler ve ilk model ayırmaları eğime girmez
+ve ısınma izlenmeden tam hızda geçer. ``trace=False`` tracemalloc'u hiç
+açmaz: yalnızca örnekleme anlarında RSS kaydedilir (``rss_samples``). Bar
+başına izleme yükü olmadığından 10^5+ barlık soak koşuları için uygundur.
+
+Örnek:
+    from src.utils.memory import MemoryProfiler
+
+    profiler = MemoryProfiler(snapshot_interval_bars=500)
+    profiler.start()
+    for bar in bars:
+        profiler.on_bar()
+        ...
+    report = profiler.stop()
+    print(report.format())
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.config.settings import MemoryProfilingConfig
+
+_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class ModuleAllocation:
+    """Bir modülün iki anlık görüntü arasındaki bar başı net ayırması."""
+
+    module: str
+    bytes_per_bar: float
+    blocks_per_bar: float
+
+
+@dataclass
+class MemoryReport:
+    """``MemoryProfiler`` ölçüm özeti."""
+
+    bars: int = 0
+    traced_current: int = 0
+    traced_peak: int = 0
+    rss_bytes: int = 0
+    bar_peak_mean: float = 0.0
+    bar_peak_max: int = 0
+    traced_samples: List[Tuple[int, int]] = field(default_factory=list)
+    rss_samples: List[Tuple[int, int]] = field(default_factory=list)
+    modules: List[ModuleAllocation] = field(default_factory=list)
+    gc_collections: Dict[int, int] = field(default_factory=dict)
+    gc_pause_total: float = 0.0
+    gc_pause_max: float = 0.0
+
+    def growth_per_bar(self, after_bar: int = 0) -> float:
+        """``after_bar`` sonrasındaki örneklerde izlenen belleğin bar başı eğimi (bayt, en küçük kareler)."""
+
+        return _slope(self.traced_samples, after_bar)
+
+    def rss_growth_per_bar(self, after_bar: int = 0) -> float:
+        """``after_bar`` sonrasındaki örneklerde RSS'in bar başı eğimi (bayt, en küçük kareler)."""
+
+        return _slope(self.rss_samples, after_bar)
+
+    def format(self, top: int = 10) -> str:
+        lines = [
+            f"Bar: {self.bars}, izlenen bellek: {self.traced_current / 1024:.1f} KiB "
+            f"(tepe {self.traced_peak / 1024:.1f} KiB), RSS: {self.rss_bytes / 1048576:.1f} MiB",
+            f"Bar başı geçici tepe: ort. {self.bar_peak_mean / 1024:.1f} KiB, en çok {self.bar_peak_max / 1024:.1f} KiB",
+            f"GC: {self.gc_collections}, toplam duraklama {self.gc_pause_total * 1000:.1f} ms, "
+            f"en uzun {self.gc_pause_max * 1000:.2f} ms",
+        ]
+        if len(self.rss_samples) >= 2:
+            lines.append(f"RSS eğimi: {self.rss_growth_per_bar():+.1f} B/bar ({len(self.rss_samples)} örnek)")
+        for item in self.modules[:top]:
+            lines.append(f"  {item.module}: {item.bytes_per_bar:+.1f} B/bar, {item.blocks_per_bar:+.3f} blok/bar")
+        return "\n".join(lines)
+
+
+class MemoryProfiler:
+    """tracemalloc anlık görüntüleri ve GC zamanlamasıyla bellek bütçesi izleyicisi."""
+
+    def __init__(
+        self,
+        snapshot_interval_bars: int = 1000,
+        top_modules: int = 10,
+        frames: int = 1,
+        warmup_bars: int = 0,
+        trace: bool = True,
+    ) -> None:
+        self.snapshot_interval_bars = max(1, int(snapshot_interval_bars))
+        self.top_modules = top_modules
+        self.frames = frames
+        self.warmup_bars = max(0, int(warmup_bars))
+        self.trace = trace
+        self.bars = 0
+        self._warming = False
+        self._started_tracing = False
+        self._last_current = 0
+        self._bar_peak_sum = 0
+        self._bar_peak_max = 0
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._baseline_bar = 0
+        self._module_totals: Dict[str, List[float]] = {}
+        self._module_bars = 0
+        self._traced_samples: List[Tuple[int, int]] = []
+        self._rss_samples: List[Tuple[int, int]] = []
+        self._gc_started = 0.0
+        self._gc_collections: Dict[int, int] = {}
+        self._gc_pause_total = 0.0
+        self._gc_pause_max = 0.0
+        self._final_report: Optional[MemoryReport] = None
+        self._sampling = False
+
+    @classmethod
+    def from_config(cls, config: MemoryProfilingConfig) -> "MemoryProfiler":
+        return cls(
+            snapshot_interval_bars=config.snapshot_interval_bars,
+            top_modules=config.top_modules,
+            frames=config.frames,
+            warmup_bars=config.warmup_bars,
+            trace=config.trace,
+        )
+
+    @property
+    def measured_bars(self) -> int:
+        """Isınmadan sonra ölçülen bar sayısı."""
+
+        return max(0, self.bars - self.warmup_bars)
+
+    def start(self) -> None:
+        self._final_report = None
+        if self.bars < self.warmup_bars:
+            self._warming = True
+            return
+        self._begin()
+
+    def on_bar(self) -> None:
+        """Bar sınırını işaretle; önceki barın geçici bellek tepesini kaydet."""
+
+        if self._warming:
+            self.bars += 1
+            if self.bars >= self.warmup_bars:
+                self._warming = False
+                self._begin()
+            return
+        if self.trace:
+            current, peak = tracemalloc.get_traced_memory()
+            transient = peak - self._last_current
+            self._bar_peak_sum += transient
+            if transient > self._bar_peak_max:
+                self._bar_peak_max = transient
+            tracemalloc.reset_peak()
+            self._last_current = current
+        self.bars += 1
+        if self.measured_bars % self.snapshot_interval_bars == 0:
+            self._sampling = True
+            gc.collect()
+            self._sampling = False
+            self._rss_samples.append((self.bars, current_rss()))
+            if self.trace:
+                self._last_current, _ = tracemalloc.get_traced_memory()
+                self._traced_samples.append((self.bars, self._last_current))
+                self._compare()
+                tracemalloc.reset_peak()
+
+    def stop(self) -> MemoryReport:
+        """Ölçümü bitir; tekrar çağrılırsa ilk durdurmadaki raporu döndürür."""
+
+        if self._final_report is not None:
+            return self._final_report
+        self._warming = False
+        report = self._final_report = self.report()
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return report
+
+    def report(self) -> MemoryReport:
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        bars = max(1, self._module_bars)
+        modules = [
+            ModuleAllocation(module, size / bars, count / bars)
+            for module, (size, count) in self._module_totals.items()
+        ]
+        modules.sort(key=lambda item: abs(item.bytes_per_bar), reverse=True)
+        return MemoryReport(
+            bars=self.bars,
+            traced_current=current,
+            traced_peak=peak,
+            rss_bytes=current_rss(),
+            bar_peak_mean=self._bar_peak_sum / self.measured_bars if self.measured_bars else 0.0,
+            bar_peak_max=self._bar_peak_max,
+            traced_samples=list(self._traced_samples),
+            rss_samples=list(self._rss_samples),
+            modules=modules[: self.top_modules],
+            gc_collections=dict(self._gc_collections),
+            gc_pause_total=self._gc_pause_total,
+            gc_pause_max=self._gc_pause_max,
+        )
+
+    def _begin(self) -> None:
+        gc.collect()
+        gc.callbacks.append(self._on_gc)
+        self._rss_samples.append((self.bars, current_rss()))
+        if not self.trace:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._last_current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self._baseline = self._snapshot()
+        self._baseline_bar = self.bars
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+        )
+
+    def _compare(self) -> None:
+        snapshot = self._snapshot()
+        if self._baseline is not None:
+            for stat in snapshot.compare_to(self._baseline, "filename"):
+                module = _module_name(stat.traceback[0].filename)
+                totals = self._module_totals.setdefault(module, [0.0, 0.0])
+                totals[0] += stat.size_diff
+                totals[1] += stat.count_diff
+            self._module_bars += self.bars - self._baseline_bar
+        self._baseline = snapshot
+        self._baseline_bar = self.bars
+
+    def _on_gc(self, phase: str, info: Dict[str, int]) -> None:
+        if self._sampling:
+            return
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+            return
+        pause = time.perf_counter() - self._gc_started
+        generation = info.get("generation", -1)
+        self._gc_collections[generation] = self._gc_collections.get(generation, 0) + 1
+        self._gc_pause_total += pause
+        if pause > self._gc_pause_max:
+            self._gc_pause_max = pause
+
+
+def _slope(samples: List[Tuple[int, int]], after_bar: int) -> float:
+    points = [(bar, mem) for bar, mem in samples if bar >= after_bar]
+    if len(points) < 2:
+        return 0.0
+    bars = np.array([bar for bar, _ in points], dtype=np.float64)
+    mems = np.array([mem for _, mem in points], dtype=np.float64)
+    return float(np.polyfit(bars, mems, 1)[0])
+
+
+def current_rss() -> int:
+    """Sürecin anlık yerleşik bellek boyutu (bayt); ölçülemezse tepe değer."""
+
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        try:
+            import resource
+        except ImportError:  # pragma: no cover - Windows
+            return 0
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _module_name(filename: str) -> str:
+    if filename.startswith("<"):
+        return filename
+    path = Path(filename)
+    try:
+        relative = path.resolve().relative_to(_ROOT)
+    except ValueError:
+        parts = path.parts
+        if "site-packages" in parts:
+            return parts[parts.index("site-packages") + 1]
+        return path.stem if path.suffix else filename
+    return ".".join(relative.with_suffix("").parts)
@@ -0,0 +1,181 @@
+"""Çalışan süreçte açılıp kapatılabilen örnekleyici profilleyici.
+
+Canlı bot yavaşladığında süreci yeniden başlatmadan profil almak için
+``StackSampler`` ayrı bir daemon iş parçacığından hedef iş parçacığının (varsayılan
+olarak olay döngüsünü çalıştıran iş parçacığı) yığınını ``sys._current_frames``
+ile belirli aralıklarla okur. Çerçeve etiketleri kod nesnesi başına bir kez
+üretilip önbelleğe alınır; hedef iş parçacığı hiç durdurulmaz, ek yük örnekleme
+sıklığıyla sınırlıdır. Durdurulunca sayımlar ``flamegraph.pl``/speedscope'un
+okuduğu "collapsed stack" biçiminde (``kök;...;yaprak sayı``) diske yazılır.
+
+``sampling_profiler.enabled`` açıksa ``main()`` bir sinyal (varsayılan
+``SIGUSR1``) işleyicisi kurar: ilk sinyal örneklemeyi başlatır, ikincisi
+durdurup dosyayı yazar. Örneklenen iş parçacığı sonlanırsa örnekleme kendiliğinden
+durur, o ana kadarki profil yazılır ve sonraki sinyal yeniden başlatır.
+
+Örnek:
+    kill -USR1 <pid>   # başlat
+    kill -USR1 <pid>   # durdur, runs/profiles/profile-<zaman>.folded yaz
+
+    from src.utils.sampler import StackSampler
+
+    sampler = StackSampler(interval_seconds=0.005, output_dir="runs/profiles")
+    sampler.start()
+    ...
+    path = sampler.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Dict, Optional
+
+from src.config.settings import SamplingProfilerConfig
+from src.utils.logging import setup_logger
+
+LOGGER = setup_logger()
+
+
+class StackSampler:
+    """Bir iş parçacığının yığınını periyodik örnekleyip collapsed stack olarak yazar."""
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.005,
+        output_dir: str | Path = "runs/profiles",
+        max_depth: int = 128,
+    ) -> None:
+        self.interval_seconds = max(1e-4, float(interval_seconds))
+        self.output_dir = Path(output_dir)
+        self.max_depth = int(max_depth)
+        self.counts: Counter[str] = Counter()
+        self.samples = 0
+        self.target_lost = False
+        self._labels: Dict[CodeType, str] = {}
+        self._target: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started_at = 0.0
+
+    @classmethod
+    def from_config(cls, config: SamplingProfilerConfig) -> "StackSampler":
+        return cls(
+            interval_seconds=config.interval_ms / 1000,
+            output_dir=config.output_dir,
+            max_depth=config.max_depth,
+        )
+
+    @property
+    def running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def start(self, thread_id: Optional[int] = None) -> None:
+        """``thread_id`` (varsayılan: çağıran iş parçacığı) için örneklemeyi başlat."""
+
+        if self.running:
+            return
+        self._target = thread_id if thread_id is not None else threading.get_ident()
+        self.counts.clear()
+        self.samples = 0
+        self.target_lost = False
+        self._stop.clear()
+        self._started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Optional[Path]:
+        """Örneklemeyi durdur ve collapsed stack dosyasını yaz; çalışmıyorsa ``None``.
+
+        Hedef iş parçacığı sonlandığı için örnekleme kendiliğinden durduysa profil
+        zaten yazılmıştır; ``None`` döner.
+        """
+
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return None
+        self._stop.set()
+        thread.join()
+        return None if self.target_lost else self.write()
+
+    def toggle(self) -> Optional[Path]:
+        """Çalışmıyorsa başlat, çalışıyorsa durdurup yazılan dosyanın yolunu döndür."""
+
+        if self.running:
+            return self.stop()
+        self.start()
+        return None
+
+    def write(self, path: Optional[Path] = None) -> Path:
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started_at))
+            path = self.output_dir / f"profile-{stamp}-{os.getpid()}.folded"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = [f"{stack} {count}\n" for stack, count in self.counts.most_common()]
+        path.write_text("".join(lines), encoding="utf-8")
+        return path
+
+    def _run(self) -> None:
+        interval = self.interval_seconds
+        target = self._target
+        while not self._stop.wait(interval):
+            frame = sys._current_frames().get(target)
+            if frame is None:
+                self.target_lost = True
+                path = self.write()
+                LOGGER.warning(
+                    f"Örneklenen iş parçacığı sonlandı; örnekleme durdu, profil yazıldı: {path} "
+                    f"({self.samples} örnek).\n"
+                )
+                break
+            self.counts[self._collapse(frame)] += 1
+            self.samples += 1
+            del frame
+
+    def _collapse(self, frame: Optional[FrameType]) -> str:
+        labels = self._labels
+        parts = []
+        depth = 0
+        while frame is not None and depth < self.max_depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+            parts.append(label)
+            frame = frame.f_back
+            depth += 1
+        parts.reverse()
+        return ";".join(parts)
+
+
+def install_signal_toggle(
+    loop: asyncio.AbstractEventLoop,
+    sampler: StackSampler,
+    signame: str = "SIGUSR1",
+) -> bool:
+    """Sinyal geldiğinde ``sampler``'ı aç/kapat; platform sinyali desteklemiyorsa ``False``."""
+
+    signum = getattr(signal, signame, None)
+    if signum is None:
+        return False
+
+    def toggle() -> None:
+        path = sampler.toggle()
+        if path is None:
+            LOGGER.info(f"Örnekleyici profilleyici başlatıldı ({1 / sampler.interval_seconds:.0f} Hz).\n")
+        else:
+            LOGGER.info(f"Profil yazıldı: {path} ({sampler.samples} örnek).\n")
+
+    try:
+        loop.add_signal_handler(signum, toggle)
+    except (NotImplementedError, RuntimeError):
+        return False
+    return True
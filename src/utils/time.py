@@ -1,20 +1,146 @@
 """Zaman ve tarih yardımcıları.
 
+Zaman okuma ve bekleme işlemleri değiştirilebilir bir saat (``Clock``)
+üzerinden yapılır. Varsayılan ``WallClock`` gerçek zamanı kullanır;
+``VirtualClock`` tarihsel replay sırasında her barın zaman damgasına anında
+ilerler, ``ScaledClock`` ise simüle zamanı gerçek zamandan ``speed`` kat hızlı
+akıtır (soak testleri için).
+
 Örnek:
-    from src.utils.time import utc_timestamp
+    from src.utils.time import VirtualClock, set_clock, utc_timestamp
 
+    set_clock(VirtualClock(start=1672531200))
     now = utc_timestamp()
 """
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
+import time
+from typing import Optional, Protocol
+
+_TIMEFRAME_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+class Clock(Protocol):
+    """Saniye cinsinden UTC zamanı sağlayan ve beklemeyi soyutlayan saat."""
+
+    def now(self) -> float: ...
+
+    async def sleep(self, seconds: float) -> None: ...
+
+    async def advance_to(self, timestamp: float) -> None: ...
+
+
+class WallClock:
+    """Gerçek (duvar) saati; ``advance_to`` zamanı ileri saramaz, etkisizdir."""
+
+    def now(self) -> float:
+        return time.time()
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+    async def advance_to(self, timestamp: float) -> None:
+        return None
+
+
+class VirtualClock:
+    """Beklemeden ilerleyen sanal saat; tam CPU hızında replay için."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = float(start)
+
+    def now(self) -> float:
+        return self._now
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._now += seconds
+        await asyncio.sleep(0)
+
+    async def advance_to(self, timestamp: float) -> None:
+        if timestamp > self._now:
+            self._now = float(timestamp)
+
+
+class ScaledClock:
+    """Simüle zamanı gerçek zamandan ``speed`` kat hızlı akıtan saat.
+
+    ``start`` verilmezse ilk ``advance_to`` çağrısı saati o zaman damgasına
+    sabitler; böylece tarihsel veri ilk bardan itibaren ölçekli hızda oynatılır.
+    """
+
+    def __init__(self, speed: float, start: Optional[float] = None) -> None:
+        if speed <= 0:
+            raise ValueError("Saat hız çarpanı pozitif olmalıdır.")
+        self.speed = float(speed)
+        self._anchored = start is not None
+        self._origin_virtual = float(start) if start is not None else time.time()
+        self._origin_wall = time.monotonic()
+
+    def now(self) -> float:
+        return self._origin_virtual + (time.monotonic() - self._origin_wall) * self.speed
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            await asyncio.sleep(seconds / self.speed)
+
+    async def advance_to(self, timestamp: float) -> None:
+        if not self._anchored:
+            self._anchored = True
+            self._origin_virtual = float(timestamp)
+            self._origin_wall = time.monotonic()
+            return
+        await self.sleep(timestamp - self.now())
+
+
+_CLOCK: Clock = WallClock()
+
+
+def get_clock() -> Clock:
+    """Etkin saati döndür."""
+
+    return _CLOCK
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Etkin saati değiştir; önceki saati döndür."""
+
+    global _CLOCK
+    previous, _CLOCK = _CLOCK, clock
+    return previous
+
+
+def build_clock(mode: str = "wall", speed: float = 1.0) -> Clock:
+    """Yapılandırma değerlerinden saat üret."""
+
+    mode = mode.lower()
+    if mode == "wall":
+        return WallClock()
+    if mode == "virtual":
+        return VirtualClock()
+    if mode == "scaled":
+        return ScaledClock(speed=speed)
+    raise ValueError(f"Desteklenmeyen saat modu: {mode}")
+
+
+def timeframe_to_seconds(timeframe: str) -> int:
+    """``1m``, ``15m``, ``4h`` gibi zaman dilimlerini saniyeye çevir."""
+
+    value = timeframe.strip().lower()
+    unit = value[-1:]
+    if unit not in _TIMEFRAME_UNITS or not value[:-1].isdigit():
+        raise ValueError(f"Zaman dilimi çözümlenemedi: {timeframe!r}")
+    return int(value[:-1]) * _TIMEFRAME_UNITS[unit]
 
 
 def utc_timestamp() -> int:
-    """Şu anki UTC zaman damgasını saniye cinsinden döndür."""
+    """Etkin saate göre şu anki UTC zaman damgasını saniye cinsinden döndür."""
 
-    return int(dt.datetime.now(tz=dt.timezone.utc).timestamp())
+    return int(get_clock().now())
 
 
 def ensure_utc(ts: dt.datetime) -> dt.datetime:
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from typing import Literal, Optional
 
 Decision = Literal["LONG", "SHORT", "FLAT"]
+DECISIONS: tuple[Decision, ...] = ("LONG", "SHORT", "FLAT")
 
 
 @dataclass(slots=True)
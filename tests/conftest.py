@@ -1,7 +1,58 @@
+import asyncio
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 root_str = str(ROOT)
 if root_str not in sys.path:
     sys.path.insert(0, root_str)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False, help="slow işaretli testleri de çalıştır")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: uzun süren testler; yalnızca --runslow ile çalışır")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="--runslow verilmedi")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+class FiniteFeed:
+    """Verilen barları sırayla yayınlayıp biten akış; ``delay`` barlar arası bekleme (saniye)."""
+
+    def __init__(self, bars, delay=0.0):
+        self._bars = list(bars)
+        self.delay = delay
+
+    async def stream_klines(self):
+        for bar in self._bars:
+            yield bar
+            if self.delay:
+                await asyncio.sleep(self.delay)
+
+
+class SilentReporter:
+    def render(self, summary):
+        pass
+
+
+@pytest.fixture
+def finite_feed():
+    """``FiniteFeed`` sınıfı: ``finite_feed(bars, delay=...)``."""
+
+    return FiniteFeed
+
+
+@pytest.fixture
+def silent_reporter():
+    return SilentReporter()
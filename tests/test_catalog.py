@@ -0,0 +1,56 @@
+import gzip
+
+import pytest
+
+from src.data.catalog import CatalogFeed, DataCatalog, to_epoch
+
+HEADER = "timestamp,open,high,low,close,volume\n"
+
+
+def _write_day(root, symbol, day, start_ts, rows=1440, compress=False):
+    folder = root / symbol / "1m"
+    folder.mkdir(parents=True, exist_ok=True)
+    lines = [HEADER] + [f"{start_ts + 60 * i},1,2,0.5,1.5,{i}\n" for i in range(rows)]
+    if compress:
+        with gzip.open(folder / f"{day}.csv.gz", "wt") as handle:
+            handle.writelines(lines)
+    else:
+        (folder / f"{day}.csv").write_text("".join(lines))
+
+
+@pytest.fixture
+def catalog_root(tmp_path):
+    base = to_epoch("2023-01-01")
+    for offset, compress in enumerate([False, True, True]):
+        _write_day(tmp_path, "BTCUSDT", f"2023-01-0{offset + 1}", base + offset * 86400, compress=compress)
+    _write_day(tmp_path, "ETHUSDT", "2023-01-01", base, rows=10)
+    (tmp_path / "BTCUSDT" / "1m" / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def test_catalog_indexes_and_queries_partitions(catalog_root):
+    catalog = DataCatalog(catalog_root)
+    assert catalog.symbols() == ["BTCUSDT", "ETHUSDT"]
+    assert len(catalog.partitions("BTCUSDT")) == 3
+    parts = catalog.query("BTCUSDT", start="2023-01-02T12:00:00", end="2023-01-03")
+    assert [str(p.day) for p in parts] == ["2023-01-02"]
+    assert catalog.query("BTCUSDT", start="2023-02-01") == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_catalog_feed_streams_range_across_compressed_partitions(catalog_root, prefetch):
+    catalog = DataCatalog(catalog_root)
+    start = to_epoch("2023-01-01T23:00:00")
+    end = to_epoch("2023-01-03T01:00:00")
+    feed = CatalogFeed(catalog, "BTCUSDT", start=start, end=end, prefetch=prefetch)
+    stamps = [bar.timestamp async for bar in feed.stream_klines()]
+    assert len(feed.partitions) == 3
+    assert stamps[0] == start and stamps[-1] == end - 60
+    assert len(stamps) == (end - start) // 60
+    assert stamps == sorted(stamps)
+
+
+def test_catalog_feed_rejects_empty_range(catalog_root):
+    with pytest.raises(ValueError):
+        CatalogFeed(DataCatalog(catalog_root), "BTCUSDT", start="2024-01-01")
@@ -0,0 +1,98 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config.settings import get_settings
+from src.data.feature_engineering import BASE_COLUMNS, available_features, compute_feature_matrix, compute_features
+from src.evaluation.history import EquityHistory
+from src.evaluation.metrics import compute_summary
+from src.main import run_pipeline
+from src.utils.buffers import BarWindow, FloatRing
+from src.utils.types import BarData
+
+# float32 (24 bit mantis) ile float64 arasındaki kabul edilen en büyük sapma,
+# özelliğin örnekteki mutlak büyüklüğüne göre. Ölçülen en kötü değer MACD
+# ailesinde ~1.6e-3'tür (iki yakın EMA'nın farkı); diğerleri <5e-4.
+FEATURE_DRIFT_BUDGET = 5e-3
+SUMMARY_DRIFT_BUDGET = 1e-6
+
+
+@pytest.fixture(scope="module")
+def ohlcv():
+    return pd.read_csv("data/btcusdt_1m_2023-01-01.csv")
+
+
+def test_float32_feature_drift_is_bounded(ohlcv):
+    names = available_features()
+    expected = compute_features(ohlcv, names=names).to_numpy()
+    arrays = {col: ohlcv[col].to_numpy(dtype=np.float32) for col in BASE_COLUMNS}
+    got = compute_feature_matrix(arrays, names, dtype=np.float32)
+
+    assert got.dtype == np.float32
+    assert np.isfinite(got).all()
+    drift = np.abs(got - expected).max(axis=0) / np.maximum(np.abs(expected).max(axis=0), 1e-12)
+    worst = dict(zip(names, drift, strict=True))
+    assert max(worst.values()) < FEATURE_DRIFT_BUDGET, worst
+
+
+def test_float32_summary_drift_is_bounded():
+    rng = np.random.default_rng(3)
+    pnls = rng.normal(2e-4, 3e-3, 5000)
+    equity = 1000.0 * np.cumprod(1.0 + pnls)
+    expected = compute_summary(pnls, equity)
+
+    compact_pnls, compact_equity = FloatRing(len(pnls)), FloatRing(len(equity))
+    for pnl, value in zip(pnls, equity, strict=True):
+        compact_pnls.append(pnl)
+        compact_equity.append(value)
+    got = compute_summary(compact_pnls, compact_equity)
+
+    assert got.winrate == expected.winrate
+    for name in ("profit_factor", "sharpe", "roi", "mdd"):
+        assert getattr(got, name) == pytest.approx(getattr(expected, name), rel=SUMMARY_DRIFT_BUDGET)
+
+
+def test_ring_buffers_match_deque_windows():
+    window, ring, reference = BarWindow(7), FloatRing(5, dtype=np.float64), deque(maxlen=5)
+    bars = [BarData(i, i + 0.5, i + 1.0, i - 1.0, float(i), 10.0 + i) for i in range(23)]
+    for bar in bars:
+        window.append(bar)
+        ring.append(bar.close)
+        reference.append(bar.close)
+        assert list(ring) == list(reference)
+        assert np.array_equal(np.asarray(ring), np.array(reference))
+    arrays = window.arrays()
+    assert len(window) == 7
+    assert arrays["close"].flags["C_CONTIGUOUS"]
+    assert arrays["close"].tolist() == [bar.close for bar in bars[-7:]]
+    assert arrays["volume"].tolist() == [bar.volume for bar in bars[-7:]]
+    # float32 pencere, float64 karşılığının yarısı kadar yer tutar.
+    assert window.nbytes == BarWindow(7, dtype=np.float64).nbytes // 2
+
+
+def test_compact_equity_history_matches_float64():
+    rng = np.random.default_rng(11)
+    equity = np.abs(1.0 + np.cumsum(rng.normal(0.0, 0.01, 20_000))) + 0.1
+    full, compact = EquityHistory(capacity=64), EquityHistory(capacity=64, dtype=np.float32)
+    for ts, value in enumerate(equity):
+        full.append(ts, float(value))
+        compact.append(ts, float(value))
+
+    assert len(compact) == len(full)
+    assert compact.max_drawdown == full.max_drawdown
+    for got, expected in zip(compact.series(), full.series(), strict=True):
+        np.testing.assert_allclose(got, expected, rtol=1e-7)
+    counts = sum(bucket[6] for level in compact.levels for bucket in level)
+    assert counts == len(equity)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_in_compact_mode(monkeypatch, finite_feed, silent_reporter):
+    monkeypatch.setattr(get_settings().compact, "enabled", True)
+    bars = [BarData(i, 100 + i * 0.1, 100.5 + i * 0.1, 99.5 + i * 0.1, 100 + i * 0.1, 1.0) for i in range(80)]
+    history = EquityHistory(capacity=8, fanout=2, dtype=np.float32)
+    await run_pipeline(feed=finite_feed(bars), reporter=silent_reporter, history=history, max_steps=80)
+    assert history.count == 51
+    assert np.isfinite(history.series()[3]).all()
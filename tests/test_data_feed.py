@@ -1,6 +1,20 @@
+import asyncio
+import os
+import time
+
 import pytest
 
-from src.data.live_feed import HistoricalCSVFeed, HistoricalCSVFeedConfig
+from src.data.live_feed import (
+    BinanceLiveFeed,
+    HistoricalCSVFeed,
+    HistoricalCSVFeedConfig,
+    LiveFeedConfig,
+    TailCSVFeed,
+)
+from src.execution.intrabar import IntrabarGuard
+from src.execution.simulator import PaperTrader, Position
+from src.main import run_pipeline
+from src.utils.time import ScaledClock, VirtualClock
 
 
 @pytest.mark.asyncio
@@ -18,3 +32,163 @@ async def test_historical_csv_feed_yields_real_bars():
     assert bars[0].timestamp == 1672531200
     assert bars[0].close == pytest.approx(16543.67)
     assert bars[1].open == pytest.approx(16543.04)
+
+
+@pytest.mark.asyncio
+async def test_virtual_clock_replays_without_waiting():
+    clock = VirtualClock()
+    config = HistoricalCSVFeedConfig(path="data/btcusdt_1m_2023-01-01.csv", delay_seconds=5.0)
+    feed = HistoricalCSVFeed(config, clock=clock)
+
+    started = time.monotonic()
+    seen = []
+    async for bar in feed.stream_klines():
+        assert clock.now() >= bar.timestamp
+        seen.append(bar)
+        if len(seen) >= 50:
+            break
+    assert time.monotonic() - started < 1.0
+    assert clock.now() >= seen[-1].timestamp
+
+
+@pytest.mark.asyncio
+async def test_synthetic_feed_uses_clock_timestamps():
+    clock = VirtualClock(start=1_000)
+    feed = BinanceLiveFeed(LiveFeedConfig(symbol="BTCUSDT", seed=1), clock=clock)
+    stamps = []
+    async for bar in feed.stream_klines():
+        stamps.append(bar.timestamp)
+        if len(stamps) >= 3:
+            break
+    assert stamps == [1_000, 1_060, 1_120]
+
+
+@pytest.mark.asyncio
+async def test_scaled_clock_paces_by_bar_spacing():
+    clock = ScaledClock(speed=1200.0)
+    feed = HistoricalCSVFeed(HistoricalCSVFeedConfig(path="data/btcusdt_1m_2023-01-01.csv"), clock=clock)
+    started = time.monotonic()
+    count = 0
+    async for _ in feed.stream_klines():
+        count += 1
+        if count >= 5:
+            break
+    # 4 aralık x 60 sn / 1200 = 0.2 sn
+    assert 0.15 <= time.monotonic() - started < 1.0
+
+
+HEADER = b"timestamp,open,high,low,close,volume\n"
+
+
+def _row(ts: int) -> bytes:
+    return f"{ts},1.0,2.0,0.5,{ts / 100:.2f},3.0\n".encode()
+
+
+def test_tail_csv_feed_reads_only_appended_complete_rows(tmp_path):
+    path = tmp_path / "live.csv"
+    feed = TailCSVFeed(HistoricalCSVFeedConfig(path=str(path), follow=True))
+    assert feed.poll() == []  # dosya henüz yok
+
+    path.write_bytes(HEADER + _row(60) + _row(120)[:7])
+    assert [bar.timestamp for bar in feed.poll()] == [60]
+    offset = feed.offset
+    with path.open("ab") as handle:
+        handle.write(_row(120)[7:] + _row(180))
+    bars = feed.poll()
+    assert [bar.timestamp for bar in bars] == [120, 180]
+    assert bars[-1].close == pytest.approx(1.8)
+    assert feed.offset > offset
+    assert feed.poll() == []
+
+    # Kısaltma: dosya yeniden yazılır, başlık tekrar okunur.
+    path.write_bytes(HEADER + _row(240))
+    assert [bar.timestamp for bar in feed.poll()] == [240]
+
+    # Döndürme: eski dosyaya son eklenenler kaçırılmadan yeni dosyaya geçilir.
+    with path.open("ab") as handle:
+        handle.write(_row(300))
+    os.replace(path, tmp_path / "live.csv.1")
+    path.write_bytes(HEADER + _row(360))
+    assert [bar.timestamp for bar in feed.poll()] == [300, 360]
+    assert feed.rotations == 2
+    feed.close()
+
+
+@pytest.mark.asyncio
+async def test_tail_csv_feed_follows_live_writer(tmp_path):
+    path = tmp_path / "live.csv"
+    path.write_bytes(HEADER + _row(60))
+    config = HistoricalCSVFeedConfig(
+        path=str(path), follow=True, poll_min_seconds=0.01, poll_max_seconds=0.05, idle_timeout_seconds=0.3
+    )
+    feed = TailCSVFeed(config, clock=VirtualClock())
+
+    async def writer():
+        for ts in range(120, 600, 60):
+            await asyncio.sleep(0.02)
+            with path.open("ab") as handle:
+                handle.write(_row(ts))
+
+    task = asyncio.create_task(writer())
+    stamps = [bar.timestamp async for bar in feed.stream_klines()]
+    await task
+    assert stamps == list(range(60, 600, 60))
+
+
+class TickGatedFeed(TailCSVFeed):
+    """Bar akışını tick akışının tüketici tarafından tamamen işlenmesine kadar bekletir."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ticks_done = asyncio.Event()
+
+    async def stream_ticks(self):
+        async for tick in super().stream_ticks():
+            yield tick
+        self.ticks_done.set()
+
+    async def stream_klines(self):
+        await self.ticks_done.wait()
+        async for bar in super().stream_klines():
+            yield bar
+
+
+@pytest.mark.asyncio
+async def test_tail_csv_feed_streams_stamped_ticks_to_intrabar_guard(tmp_path):
+    bars_path, ticks_path = tmp_path / "live.csv", tmp_path / "trades.csv"
+    bars_path.write_bytes(HEADER + b"".join(_row(ts) for ts in range(60, 60 * 41, 60)))
+    ticks_path.write_bytes(b"timestamp,price\n" + b"".join(f"{ts},100.0\n".encode() for ts in range(5)))
+    config = HistoricalCSVFeedConfig(
+        path=str(bars_path),
+        follow=True,
+        poll_min_seconds=0.01,
+        poll_max_seconds=0.02,
+        idle_timeout_seconds=0.2,
+        ticks_path=str(ticks_path),
+    )
+    feed = TailCSVFeed(config, clock=VirtualClock())
+    ticks = [tick async for tick in feed.stream_ticks()]
+    assert [tick[:2] for tick in ticks] == [(ts, 100.0) for ts in range(5)]
+    assert all(isinstance(tick[2], int) and tick[2] <= time.perf_counter_ns() for tick in ticks)
+
+    # Tick'ten aksiyona gecikme akışın koyduğu varış damgasından ölçülür.
+    trader = PaperTrader()
+    trader.position = Position(side="LONG", entry_price=100.0, size=1.0)
+    guard = IntrabarGuard(trader)
+
+    async def stale_ticks():
+        yield 0, 100.0, time.perf_counter_ns()
+        yield 1, 1.0, time.perf_counter_ns() - 5_000_000
+    await guard.run(stale_ticks())
+    assert guard.trips == 1
+    assert guard.latency_stats()["action_max_us"] >= 5_000
+
+    # Pipeline tick yolu olan akışta korumayı kendiliğinden başlatır. Bar akışı
+    # tick akışı tükenene kadar bekletilir; sonuç zamanlamaya bağlı değildir.
+    guarded = PaperTrader()
+    feed = TickGatedFeed(config, clock=VirtualClock())
+    guard = IntrabarGuard(guarded)
+    await run_pipeline(feed=feed, trader=guarded, intrabar=guard, clock=VirtualClock(), max_steps=40)
+    assert feed.ticks_done.is_set()
+    assert guard.ticks == 5
+    assert not TailCSVFeed(HistoricalCSVFeedConfig(path=str(bars_path), follow=True)).ticks_enabled
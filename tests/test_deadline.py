@@ -0,0 +1,86 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.main import run_pipeline
+from src.policy.bandit import ConstraintAwareBandit
+from src.utils.deadline import DecisionDeadline
+from src.utils.types import BarData
+
+
+@pytest.mark.asyncio
+async def test_deadline_falls_back_and_defers_learning():
+    deadline = DecisionDeadline(budget_seconds=0.05, catchup_updates=0)
+    release = threading.Event()
+
+    def slow(value):
+        release.wait(5.0)
+        return np.array([value]), "LONG", 0.0
+
+    assert await deadline.run(lambda: (np.array([1.0]), "LONG", 0.0)) is not None
+    assert await deadline.run(slow, 2.0) is None
+    late = deadline.timed_out
+    assert deadline.busy and deadline.misses == 1
+    # Geç görev sürerken yeni görev başlatılmaz; öğrenme bekletilir.
+    assert await deadline.run(slow, 3.0) is None
+    assert deadline.timed_out is None and deadline.misses == 2
+
+    applied = []
+    deadline.defer(late, "FLAT", 0.5)
+    deadline.defer(deadline.timed_out, "FLAT", 0.1)
+    assert deadline.dropped == 1
+    assert deadline.drain(lambda *args: applied.append(args)) == 0
+
+    release.set()
+    await late
+    deadline.defer(np.array([4.0]), "SHORT", -0.2)
+    assert deadline.drain(lambda *args: applied.append(args)) == 1
+    assert deadline.drain(lambda *args: applied.append(args)) == 1
+    assert [(float(f[0]), a, r) for f, a, r in applied] == [(2.0, "FLAT", 0.5), (4.0, "SHORT", -0.2)]
+    assert not deadline.busy
+    deadline.close()
+
+
+class StallingBandit(ConstraintAwareBandit):
+    """Belirli çağrılarda takılan (ör. yavaş model) bandit."""
+
+    def __init__(self, stall_calls, stall_seconds):
+        super().__init__()
+        self.stall_calls = set(stall_calls)
+        self.stall_seconds = stall_seconds
+        self.calls = 0
+        self.updates = 0
+
+    def select_action(self, features, violation_level=0.0):
+        self.calls += 1
+        if self.calls in self.stall_calls:
+            time.sleep(self.stall_seconds)
+        return "LONG"
+
+    def update_feedback(self, features, action, reward):
+        self.updates += 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_enforces_decision_deadline(finite_feed, silent_reporter):
+    bars = [BarData(i, 100 + i * 0.1, 100.5 + i * 0.1, 99.5 + i * 0.1, 100 + i * 0.1, 1.0) for i in range(70)]
+    bandit = StallingBandit(stall_calls={5}, stall_seconds=0.3)
+    deadline = DecisionDeadline(budget_seconds=0.1)
+    started = time.perf_counter()
+    await run_pipeline(
+        feed=finite_feed(bars, delay=0.01), reporter=silent_reporter, bandit=bandit, deadline=deadline, max_steps=70
+    )
+    elapsed = time.perf_counter() - started
+
+    decided = 70 - 29
+    assert deadline.misses >= 1
+    # Takılan çağrı dışında her bar bir karar görevi başlatır; geç görev sürerken atlanır.
+    assert bandit.calls == decided - (deadline.misses - 1)
+    # Geç kalan barın güncellemesi görev bitince uygulanır; yalnızca görevi hiç
+    # başlamayan barlarınki atılır.
+    assert bandit.updates == decided - deadline.dropped
+    assert deadline.dropped == deadline.misses - 1
+    assert not deadline.deferred
+    assert elapsed < 5.0
@@ -0,0 +1,38 @@
+import numpy as np
+
+from src.signals.decision import BlendInput, DecisionBlender
+
+
+def test_blend_batch_is_seeded_and_shaped():
+    scores = np.tile([0.4, 0.3, 0.3], (1000, 1))
+    violations = np.zeros(1000)
+    first = DecisionBlender(seed=11).blend_batch(scores, violations, rule_bias=[0.33, 0.33, 0.34])
+    second = DecisionBlender(seed=11).blend_batch(scores, violations, rule_bias=[0.33, 0.33, 0.34])
+    assert first.shape == (1000,)
+    assert set(first.tolist()) <= {"LONG", "SHORT", "FLAT"}
+    assert np.array_equal(first, second)
+
+
+def test_blend_batch_matches_expected_distribution():
+    n = 200_000
+    scores = np.tile([1.0, 0.0, 0.0], (n, 1))
+    violations = np.full(n, 1.0)
+    rule_bias = np.array([0.0, 0.5, 0.5])
+    indices = DecisionBlender(seed=3).blend_batch_indices(scores, violations, rule_bias=rule_bias)
+    freq = np.bincount(indices, minlength=3) / n
+    # Model ağırlığı 0.5 - 0.2 = 0.3 → LONG 0.3, SHORT 0.35, FLAT 0.35
+    assert np.allclose(freq, [0.3, 0.35, 0.35], atol=0.01)
+
+
+def test_blend_batch_zero_rows_are_flat():
+    scores = np.array([[0.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    decisions = DecisionBlender(seed=0).blend_batch(scores, np.zeros(2))
+    assert decisions.tolist() == ["FLAT", "SHORT"]
+
+
+def test_blend_single_uses_dedicated_stream():
+    data = BlendInput({"LONG": 0.6}, {"FLAT": 0.8}, violation_level=0.0)
+    first = [DecisionBlender(seed=5).blend(data) for _ in range(3)]
+    second = [DecisionBlender(seed=5).blend(data) for _ in range(3)]
+    assert first == second
+    assert set(first) <= {"LONG", "FLAT"}
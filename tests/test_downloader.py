@@ -0,0 +1,62 @@
+import httpx
+import pytest
+
+from src.data.catalog import DataCatalog, read_partition
+from src.data.downloader import KlineDownloader, verify_partition
+from src.data.live_feed import HistoricalCSVFeed, HistoricalCSVFeedConfig
+
+
+def make_transport(calls):
+    """Binance ``/fapi/v1/klines`` yerine geçen yerel uç nokta; ilk istek 429 döner."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        params = request.url.params
+        start, end, limit = int(params["startTime"]), int(params["endTime"]), int(params["limit"])
+        base = 100.0 if params["symbol"] == "BTCUSDT" else 10.0
+        rows = []
+        for open_ms in range(start - start % 60000, end + 1, 60000)[:limit]:
+            price = base + (open_ms // 60000) % 100 / 10
+            rows.append([open_ms, f"{price:.2f}", f"{price + 1:.2f}", f"{price - 1:.2f}", f"{price:.2f}", "5.0", open_ms + 59999])
+        return httpx.Response(200, json=rows, headers={"X-MBX-USED-WEIGHT-1M": "10"})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_downloader_writes_catalog_and_resumes(tmp_path):
+    calls = []
+    options = dict(base_url="http://binance.test", concurrency=3, limit=1000, transport=make_transport(calls))
+    async with KlineDownloader(tmp_path, **options) as downloader:
+        report = await downloader.download(["BTCUSDT", "ETHUSDT"], "2023-01-01", "2023-01-03")
+
+    assert sorted(report.downloaded) == [
+        "BTCUSDT/1m/2023-01-01",
+        "BTCUSDT/1m/2023-01-02",
+        "ETHUSDT/1m/2023-01-01",
+        "ETHUSDT/1m/2023-01-02",
+    ]
+    assert report.bars == 4 * 1440 and report.retries == 1
+    assert report.requests == 1 + 4 * 2  # 1440 bar / 1000 limit = gün başına 2 sayfa
+
+    catalog = DataCatalog(tmp_path)
+    assert catalog.symbols() == ["BTCUSDT", "ETHUSDT"]
+    parts = catalog.query("BTCUSDT", "2023-01-01", "2023-01-03")
+    bars = read_partition(parts[0])
+    assert len(bars) == 1440 and bars[0].timestamp == 1672531200
+    assert [b.timestamp for b in bars] == list(range(1672531200, 1672531200 + 86400, 60))
+    feed = HistoricalCSVFeed(HistoricalCSVFeedConfig(path=str(parts[1].path)))
+    assert len(feed.bars) == 1440 and verify_partition(parts[1].path) is True
+
+    # Bozulmuş bölüm yeniden indirilir, diğerleri atlanır.
+    corrupted = parts[0].path
+    corrupted.write_text(corrupted.read_text()[:-20])
+    calls.clear()
+    calls.append(None)  # 429 yanıtını atla
+    async with KlineDownloader(tmp_path, **options) as downloader:
+        report = await downloader.download(["BTCUSDT", "ETHUSDT"], "2023-01-01", "2023-01-03")
+    assert report.repaired == ["BTCUSDT/1m/2023-01-01"]
+    assert len(report.skipped) == 3 and report.requests == 2
+    assert verify_partition(corrupted) is True
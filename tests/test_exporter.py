@@ -0,0 +1,120 @@
+import asyncio
+import types
+
+import pytest
+
+from src.evaluation.exporter import STAGE_TOTAL, PipelineMetrics, PrometheusExporter
+from src.main import run_pipeline
+from src.policy.bandit import ConstraintAwareBandit
+from src.policy.constraints import ConstraintEvaluator
+from src.utils.types import BarData
+
+
+def make_bars(n):
+    return [
+        BarData(timestamp=i, open=100 + i * 0.1, high=100.5 + i * 0.1, low=99.5 + i * 0.1, close=100 + i * 0.1, volume=1.0)
+        for i in range(n)
+    ]
+
+
+async def scrape(port, path="/metrics"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.decode().partition("\r\n\r\n")
+    return head.split("\r\n")[0], body
+
+
+class ScrapingFeed:
+    """Belirli bir bardan sonra çalışan pipeline'ın uç noktasını sorgular."""
+
+    def __init__(self, bars, exporter, scrape_after):
+        self._bars = bars
+        self.exporter = exporter
+        self.scrape_after = scrape_after
+        self.body = None
+
+    async def stream_klines(self):
+        for i, bar in enumerate(self._bars):
+            if i == self.scrape_after:
+                _, self.body = await scrape(self.exporter.bound_port)
+            yield bar
+
+
+@pytest.mark.asyncio
+async def test_exporter_serves_live_pipeline_metrics(silent_reporter):
+    metrics = PipelineMetrics()
+    bandit = ConstraintAwareBandit()
+    constraints = ConstraintEvaluator()
+    exporter = PrometheusExporter(metrics, constraints=constraints, bandit=bandit, port=0)
+    feed = ScrapingFeed(make_bars(60), exporter, scrape_after=50)
+    exporter.feed = feed
+
+    await run_pipeline(
+        feed=feed,
+        bandit=bandit,
+        constraints=constraints,
+        reporter=silent_reporter,
+        metrics=metrics,
+        exporter=exporter,
+        max_steps=60,
+    )
+
+    assert metrics.bars_processed == 31
+    assert metrics.stage_seconds[-1] >= max(metrics.stage_seconds[:-1])
+    assert metrics.stage_counts[STAGE_TOTAL] == 31
+    assert "maybelong_bars_processed_total 21" in feed.body
+    assert 'maybelong_stage_seconds_total{stage="features"}' in feed.body
+    assert 'maybelong_stage_seconds_count{stage="total"} 21' in feed.body
+    assert 'maybelong_lagrange_alpha{constraint="' in feed.body
+    assert "maybelong_exploration_rate " in feed.body
+    states = [line for line in feed.body.splitlines() if line.startswith("maybelong_kill_switch_state{")]
+    assert len(states) == 4
+    assert sum(line.endswith(" 1.0") for line in states) == 1
+    assert "maybelong_queue_depth 0" in feed.body
+
+
+@pytest.mark.asyncio
+async def test_exporter_rejects_unknown_paths():
+    exporter = PrometheusExporter(PipelineMetrics(), port=0)
+    await exporter.start()
+    try:
+        status, _ = await scrape(exporter.bound_port, "/")
+        assert "404" in status
+        status, body = await scrape(exporter.bound_port)
+        assert "200" in status
+        assert body.endswith("\n")
+    finally:
+        await exporter.close()
+
+
+@pytest.mark.asyncio
+async def test_exporter_drops_slow_and_broken_clients():
+    exporter = PrometheusExporter(PipelineMetrics(), port=0, read_timeout=0.1)
+    await exporter.start()
+    try:
+        # Başlıkları hiç bitirmeyen istemci zaman aşımıyla kapatılır.
+        reader, writer = await asyncio.open_connection("127.0.0.1", exporter.bound_port)
+        writer.write(b"GET /metrics HTTP/1.1\r\n")
+        await writer.drain()
+        assert await asyncio.wait_for(reader.read(), 2.0) == b""
+        writer.close()
+
+        # Bağlantıyı sıfırlayan istemci sunucuyu etkilemez.
+        _, writer = await asyncio.open_connection("127.0.0.1", exporter.bound_port)
+        writer.transport.abort()
+        await asyncio.sleep(0.05)
+        status, _ = await scrape(exporter.bound_port)
+        assert "200" in status
+    finally:
+        await exporter.close()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_stage_timing_without_monitoring(monkeypatch, finite_feed, silent_reporter):
+    calls = []
+    monkeypatch.setattr("src.main.time", types.SimpleNamespace(perf_counter=lambda: calls.append(1) or 0.0))
+    await run_pipeline(feed=finite_feed(make_bars(60)), reporter=silent_reporter, max_steps=60)
+    assert calls == []
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.feature_engineering import (
+    DEFAULT_FEATURES,
+    available_features,
+    compute_feature_matrix,
+    compute_features,
+    feature_dependencies,
+)
+from src.data.feature_store import FeatureStore, definition_hash
+
+
+@pytest.fixture(scope="module")
+def ohlcv():
+    return pd.read_csv("data/btcusdt_1m_2023-01-01.csv")
+
+
+def _legacy_features(df):
+    def clean(series, fill=0.0):
+        return series.replace([np.inf, -np.inf], 0.0).fillna(fill)
+
+    out = pd.DataFrame(index=df.index)
+    returns = clean(df["close"].pct_change())
+    out["return_1"] = returns
+    out["return_5"] = clean(df["close"].pct_change(periods=5))
+    out["return_10"] = clean(df["close"].pct_change(periods=10))
+    out["volatility_10"] = clean(returns.rolling(10).std(ddof=1))
+    out["sma_ratio"] = clean(df["close"].rolling(5).mean() / df["close"].rolling(15).mean(), fill=1.0)
+    rolling = df["volume"].rolling(10)
+    out["volume_zscore"] = clean((df["volume"] - rolling.mean()) / rolling.std(ddof=1))
+    return out
+
+
+def test_default_features_match_legacy_pandas(ohlcv):
+    expected = _legacy_features(ohlcv)
+    got = compute_features(ohlcv, names=DEFAULT_FEATURES)
+    assert list(got.columns) == list(DEFAULT_FEATURES)
+    np.testing.assert_allclose(got.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-12)
+
+
+def test_indicators_match_pandas_references(ohlcv):
+    got = compute_features(ohlcv, names=["rsi_14", "atr_14", "macd", "macd_hist", "bb_percent_b", "obv_zscore"])
+    close, high, low = ohlcv["close"], ohlcv["high"], ohlcv["low"]
+
+    diff = close.diff().fillna(0.0)
+    gain = diff.clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+    loss = (-diff).clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+    rsi = 100 - 100 / (1 + gain / loss)
+    np.testing.assert_allclose(got["rsi_14"].iloc[20:], (rsi / 100 - 0.5).iloc[20:], rtol=1e-9)
+
+    prev = close.shift(1).fillna(close.iloc[0])
+    tr = pd.concat([high - low, (high - prev).abs(), (low - prev).abs()], axis=1).max(axis=1)
+    atr = tr.ewm(alpha=1 / 14, adjust=False).mean() / close
+    np.testing.assert_allclose(got["atr_14"], atr, rtol=1e-9)
+
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    np.testing.assert_allclose(got["macd"], macd / close, rtol=1e-7, atol=1e-12)
+    np.testing.assert_allclose(got["macd_hist"], (macd - signal) / close, rtol=1e-7, atol=1e-12)
+
+    mid, std = close.rolling(20).mean(), close.rolling(20).std(ddof=1)
+    percent_b = (close - (mid - 2 * std)) / (4 * std)
+    np.testing.assert_allclose(got["bb_percent_b"].iloc[19:], percent_b.iloc[19:], rtol=1e-6, atol=1e-9)
+    assert np.isfinite(got["obv_zscore"]).all()
+
+
+def test_shared_intermediates_are_resolved_once_in_order():
+    deps = feature_dependencies(["macd", "macd_signal", "macd_hist", "bb_width", "bb_percent_b"])
+    assert len(deps) == len(set(deps))
+    assert deps.index("close_ema_12") < deps.index("macd_line") < deps.index("macd_signal_line")
+    assert set(DEFAULT_FEATURES) <= set(available_features())
+    with pytest.raises(KeyError):
+        feature_dependencies(["does_not_exist"])
+
+
+def test_feature_store_reuses_and_evicts(tmp_path):
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 1, 500))
+    arrays = {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": rng.random(500) + 1}
+    store = FeatureStore(tmp_path, max_bytes=10**9)
+
+    first = store.get_or_compute(arrays, ["return_1", "rsi_14"])
+    second = store.get_or_compute(arrays, ["return_1", "rsi_14"])
+    assert (store.misses, store.hits) == (1, 1)
+    assert isinstance(second, np.memmap)
+    assert np.array_equal(second, compute_feature_matrix(arrays, ["return_1", "rsi_14"]))
+    assert np.array_equal(first, second)
+
+    assert definition_hash(["return_1"]) != definition_hash(["return_1", "rsi_14"])
+    shifted = dict(arrays, close=close * 1.01)
+    assert store.key(shifted, ["return_1"]) != store.key(arrays, ["return_1"])
+
+    store.get_or_compute(arrays, ["return_1"])
+    size = max(s for _, s, _ in store.entries())
+    store.max_bytes = 2 * size
+    store.get_or_compute(shifted, ["return_1"])
+    remaining = {path.name for path, _, _ in store.entries()}
+    assert len(remaining) == 2
+    assert f"{store.key(arrays, ['return_1', 'rsi_14'])}.npy" not in remaining
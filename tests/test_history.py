@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from src.evaluation.history import EquityHistory
+from src.main import run_pipeline
+from src.utils.types import BarData
+
+
+def test_equity_history_matches_full_series_with_bounded_memory():
+    rng = np.random.default_rng(7)
+    equity = 1.0 + np.cumsum(rng.normal(0.0, 0.01, 200_000))
+    equity = np.abs(equity) + 0.1
+    history = EquityHistory(capacity=256, fanout=4)
+    for ts, value in enumerate(equity):
+        history.append(ts, float(value))
+
+    peak = np.maximum.accumulate(equity)
+    assert history.count == len(equity)
+    assert history.peak == pytest.approx(equity.max())
+    assert history.max_drawdown == pytest.approx(((peak - equity) / peak).max())
+    assert history.roi == pytest.approx(equity[-1] / equity[0] - 1)
+    assert history.drawdown == pytest.approx((peak[-1] - equity[-1]) / peak[-1])
+
+    # Her seviye en çok ``capacity`` kova tutar; seviye sayısı logaritmik büyür.
+    assert len(history.levels) <= int(np.ceil(np.log(len(equity) / 256) / np.log(4))) + 1
+    assert len(history) <= 256 * len(history.levels)
+    assert np.array_equal(history.recent(), equity[-256:])
+
+    ts, lows, highs, lasts = history.series()
+    assert np.all(np.diff(ts) > 0)
+    assert ts[-1] == len(equity) - 1
+    assert lows.min() == pytest.approx(equity.min())
+    assert highs.max() == pytest.approx(equity.max())
+    assert lasts[-1] == equity[-1]
+    counts = sum(bucket[6] for level in history.levels for bucket in level)
+    assert counts == len(equity)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_tracks_all_time_history(finite_feed, silent_reporter):
+    bars = [BarData(i, 100 + i * 0.1, 100.5 + i * 0.1, 99.5 + i * 0.1, 100 + i * 0.1, 1.0) for i in range(60)]
+    history = EquityHistory(capacity=8, fanout=2)
+    await run_pipeline(feed=finite_feed(bars), reporter=silent_reporter, history=history, max_steps=60)
+    assert history.count == 31
+    assert len(history.levels) > 1
+    assert history.peak >= history.last
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from src.data.resample import MultiTimeframeAggregator
+from src.evaluation.journal import RunJournal, iter_journal_chunks, read_journal
+from src.main import run_pipeline
+from src.utils.types import BarData
+
+
+def make_bars(n):
+    return [
+        BarData(timestamp=i, open=100 + i * 0.1, high=100.5 + i * 0.1, low=99.5 + i * 0.1, close=100 + i * 0.1, volume=1.0)
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_writes_journal(tmp_path, finite_feed, silent_reporter):
+    path = tmp_path / "journal.bin"
+    journal = RunJournal(path, batch_size=8, flush_interval_seconds=0.01)
+    await run_pipeline(feed=finite_feed(make_bars(60)), reporter=silent_reporter, journal=journal, max_steps=60)
+
+    records = read_journal(path)
+    assert len(records) == 60 - 29
+    assert records["timestamp"][0] == 29
+    assert records["features"].shape == (31, 6)
+    assert set(np.unique(records["action"])) <= {0, 1, 2}
+    assert np.all(np.isfinite(records["equity"]))
+    chunks = list(iter_journal_chunks(path, chunk_rows=10))
+    assert [len(c) for c in chunks] == [10, 10, 10, 1]
+
+
+@pytest.mark.asyncio
+async def test_journal_survives_partial_trailing_record(tmp_path):
+    path = tmp_path / "journal.bin"
+    bar = make_bars(1)[0]
+    journal = RunJournal(path, fsync="never")
+    await journal.start()
+    for _ in range(3):
+        journal.record(bar, np.zeros(4), "LONG", "FLAT", 0.1, 1.1, 0.0, 0.0, "NORMAL", 1.0)
+    await journal.close()
+
+    with path.open("ab") as handle:
+        handle.write(b"\x00" * 7)
+    assert len(read_journal(path)) == 3
+
+    reopened = RunJournal(path)
+    reopened.record(bar, np.ones(4), "SHORT", "SHORT", -0.1, 1.0, 0.2, 0.5, "REDUCE", 0.5)
+    await reopened.close()
+    records = read_journal(path)
+    assert len(records) == 4
+    assert records["kill_state"][-1] == 1
+    assert records["features"][-1].tolist() == [1.0, 1.0, 1.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_appends_higher_timeframe_features(tmp_path, finite_feed, silent_reporter):
+    path = tmp_path / "journal.bin"
+    aggregator = MultiTimeframeAggregator(("5m", "15m"), base_interval_seconds=1)
+    await run_pipeline(
+        feed=finite_feed(make_bars(40)),
+        reporter=silent_reporter,
+        journal=RunJournal(path),
+        aggregator=aggregator,
+        max_steps=40,
+    )
+    assert read_journal(path)["features"].shape == (11, 12)
@@ -0,0 +1,79 @@
+import pytest
+
+from src.execution.risk import RiskManager
+from src.execution.simulator import Position
+from src.main import run_pipeline
+from src.policy.bandit import ConstraintAwareBandit
+from src.signals.lazy import EVALUATE, HOLD_LOCKED, QUIET, LazyDecisionGate
+from src.utils.types import BarData
+
+
+def _bar(ts, close, volume=1.0):
+    return BarData(ts, close, close, close, close, volume)
+
+
+def test_gate_skips_quiet_and_hold_locked_bars():
+    gate = LazyDecisionGate(price_threshold=1e-3, volume_threshold=0.5, max_skip_bars=3, min_hold=3)
+    assert gate.check(_bar(0, 100.0)) == EVALUATE
+    assert gate.check(_bar(1, 100.05)) == QUIET
+    # Küçük adımlar son değerlendirilen bara göre birikir.
+    assert gate.check(_bar(2, 100.09)) == QUIET
+    assert gate.check(_bar(3, 100.11)) == EVALUATE
+    assert gate.check(_bar(4, 100.11, volume=2.0)) == EVALUATE
+
+    # ``min_hold`` dolmadan kapanamayan pozisyonda fiyat ne olursa olsun atlanır.
+    position = Position(side="LONG", entry_price=100.0, size=1.0, bars_held=0)
+    assert gate.check(_bar(5, 120.0, volume=2.0), position) == HOLD_LOCKED
+    position.bars_held = 1
+    assert gate.check(_bar(6, 130.0, volume=2.0), position) == HOLD_LOCKED
+    position.bars_held = 2
+    assert gate.check(_bar(7, 130.0, volume=2.0), position) == EVALUATE
+
+    # Art arda ``max_skip_bars`` atlamadan sonra değerlendirme zorlanır.
+    states = [gate.check(_bar(8 + i, 130.0, volume=2.0)) for i in range(4)]
+    assert states == [QUIET, QUIET, QUIET, EVALUATE]
+    assert gate.evaluated == 5 and gate.skipped_quiet == 5 and gate.skipped_hold == 2
+
+
+class CountingBandit(ConstraintAwareBandit):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.updates = 0
+
+    def select_action(self, features, violation_level=0.0):
+        self.calls += 1
+        return super().select_action(features, violation_level)
+
+    def update_feedback(self, features, action, reward):
+        self.updates += 1
+        super().update_feedback(features, action, reward)
+
+
+class CountingRisk(RiskManager):
+    def __init__(self):
+        super().__init__()
+        self.evaluations = 0
+
+    def evaluate(self, max_drawdown, sharpe, roi):
+        self.evaluations += 1
+        return super().evaluate(max_drawdown, sharpe, roi)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_reuses_cached_decision_on_quiet_bars(finite_feed, silent_reporter):
+    bars = [_bar(i, 100.0 + (i % 2) * 0.01) for i in range(80)]
+    bandit = CountingBandit()
+    gate = LazyDecisionGate(price_threshold=1e-3, volume_threshold=0.5, max_skip_bars=10, min_hold=5)
+    risk = CountingRisk()
+    await run_pipeline(
+        feed=finite_feed(bars), reporter=silent_reporter, bandit=bandit, risk=risk, lazy=gate, max_steps=80
+    )
+
+    decided = 80 - 29
+    assert gate.evaluated + gate.skipped == decided
+    assert bandit.calls == gate.evaluated
+    assert bandit.updates == gate.evaluated
+    assert gate.evaluated <= decided // 11 + 1
+    # Model atlanır, kill-switch atlanmaz.
+    assert risk.evaluations == decided
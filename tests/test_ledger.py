@@ -0,0 +1,67 @@
+import numpy as np
+
+from src.execution.ledger import TradeLedger, trade_stats
+from src.execution.simulator import PaperTrader
+from src.utils.types import BarData
+
+
+def test_trader_records_round_trips_with_charged_costs():
+    ledger = TradeLedger(capacity=1)
+    trader = PaperTrader(ledger=ledger)
+    prices = [100.0, 101.0, 99.0, 103.0, 104.0, 106.0, 107.0, 105.0, 104.0]
+    decisions = ["LONG", "LONG", "LONG", "LONG", "LONG", "LONG", "SHORT", "SHORT", "SHORT"]
+    for ts, (price, decision) in enumerate(zip(prices, decisions, strict=True)):
+        bar = BarData(timestamp=ts, open=price, high=price + 1, low=price - 1, close=price, volume=1.0)
+        trader.step(bar, decision, size=1.0)
+
+    assert len(ledger) == 1
+    assert ledger.is_open is True
+    cols = ledger.columns()
+    assert cols["side"][0] == 1
+    assert cols["entry_ts"][0] == 0 and cols["exit_ts"][0] == 6
+    assert cols["bars_held"][0] == 6
+    entry = cols["entry_price"][0]
+    assert np.isclose(cols["mae"][0], min(prices[1:7]) - 1 - entry)
+    assert np.isclose(cols["mfe"][0], max(prices[1:7]) + 1 - entry)
+    fee = trader.settings.runtime.fee_bps / 10000
+    slippage = trader.settings.runtime.slippage_bps / 10000
+    assert np.isclose(cols["pnl"][0], trader.equity + fee - 1.0)
+    # Girişte fiyata eklenen kayma ve çıkışta PnL'den düşülen kayma.
+    assert np.isclose(cols["slippage"][0], prices[0] * slippage + slippage)
+    assert np.isclose(cols["fees"][0], 2 * fee)
+
+    entry = trader.position.entry_price
+    flat_pnl = trader.force_flatten(110.0)
+    assert np.isclose(flat_pnl, (entry - 110.0) - fee - slippage)
+    assert np.isclose(ledger.column("slippage")[-1], prices[7] * slippage + slippage)
+    assert np.isclose(ledger.column("pnl")[-1], flat_pnl - fee)
+
+
+def test_bulk_ledger_stats_are_vectorized():
+    rng = np.random.default_rng(0)
+    n = 200_000
+    bulk = TradeLedger()
+    bulk.extend(
+        pnl=rng.normal(0.001, 0.01, n),
+        bars_held=rng.integers(1, 50, n),
+        side=np.where(rng.random(n) < 0.5, 1, -1),
+    )
+    stats = bulk.stats()
+    pnl = bulk.column("pnl")
+    assert stats.trades == n
+    assert np.isclose(stats.winrate, np.mean(pnl > 0))
+    assert np.isclose(stats.expectancy, pnl.mean())
+    assert np.isclose(stats.profit_factor, pnl[pnl > 0].sum() / -pnl[pnl < 0].sum())
+    assert 1 <= stats.holding_percentiles[0.5] <= 49
+    assert trade_stats(TradeLedger().columns()).trades == 0
+
+
+def test_capped_ledger_evicts_oldest_half():
+    capped = TradeLedger(capacity=2, max_trades=8)
+    for ts in range(21):
+        capped.open(ts, "LONG", 100.0, 1.0)
+        capped.close(ts, 101.0, 1, float(ts))
+    assert len(capped) <= 8 and capped.evicted == 21 - len(capped)
+    assert capped.column("pnl")[-1] == 20.0
+    capped.extend(pnl=np.arange(10.0), bars_held=np.ones(10, dtype=np.int32))
+    assert len(capped) == 8 and capped.column("pnl").tolist() == list(np.arange(2.0, 10.0))
@@ -0,0 +1,108 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.config.settings import get_settings
+from src.evaluation.history import EquityHistory
+from src.execution.ledger import TradeLedger
+from src.execution.simulator import PaperTrader
+from src.main import run_pipeline
+from src.utils.memory import MemoryProfiler
+from src.utils.types import BarData
+
+# Uzun soak koşusu için ör. SOAK_BARS=2000000 pytest tests/test_memory.py
+SOAK_BARS = int(os.environ.get("SOAK_BARS", "3000"))
+# Isınma: 200 barlık özellik penceresi, metrik pencereleri ve işlem defteri dolar,
+# tembel NumPy/sklearn önbellekleri kurulur; ölçüm (tracemalloc) bundan sonra başlar.
+WARMUP_BARS = int(os.environ.get("SOAK_WARMUP_BARS", "1000"))
+# Varsayılan yapılandırmayla (bar başı ~5 ms) 10^6 bar ~1.5 saat sürer.
+SLOW_SOAK_BARS = int(os.environ.get("SOAK_SLOW_BARS", "1000000"))
+BAR_PEAK_BUDGET = int(os.environ.get("SOAK_BAR_PEAK_BUDGET", str(512 * 1024)))
+# Isınma sonrası ölçülen eğim ~40 B/bar'dır (numpy/sklearn/pandas/loguru küçük
+# nesne havuzlarının gürültüsü); bar başına tutulan tek bir sözlük bile bunun katlarıdır.
+GROWTH_BUDGET = float(os.environ.get("SOAK_GROWTH_BUDGET", "64"))
+WINDOW = 50
+# Defter soak'a dahildir; sınırı ısınma içinde dolar ve sonrası en eskileri atar.
+LEDGER_TRADES = 32
+
+
+class SyntheticFeed:
+    """Bellekte tutulmadan üretilen rastgele yürüyüş barları."""
+
+    def __init__(self, n, seed=0):
+        self.n = n
+        self.seed = seed
+
+    async def stream_klines(self):
+        rng = np.random.default_rng(self.seed)
+        price = 100.0
+        for i in range(self.n):
+            step = float(rng.normal(0.0, 0.1))
+            close = max(1.0, price + step)
+            yield BarData(
+                timestamp=i * 60,
+                open=price,
+                high=max(price, close) + 0.05,
+                low=min(price, close) - 0.05,
+                close=close,
+                volume=1.0 + abs(step),
+            )
+            price = close
+
+
+def _short_windows(monkeypatch):
+    # Varsayılan kod yolu; yalnızca metrik pencereleri kısaltılır ki sınırlı
+    # deque'lar kısa ısınma içinde dolsun.
+    settings = get_settings()
+    for name in ("winrate", "profit_factor", "sharpe", "mdd"):
+        monkeypatch.setattr(settings.metrics.windows, name, WINDOW)
+
+
+async def _soak(bars, profiler, reporter):
+    ledger = TradeLedger(capacity=8, max_trades=LEDGER_TRADES)
+    await run_pipeline(
+        feed=SyntheticFeed(bars),
+        trader=PaperTrader(ledger=ledger),
+        reporter=reporter,
+        memory_profiler=profiler,
+        history=EquityHistory(capacity=WINDOW),
+        max_steps=bars,
+    )
+    return profiler.stop(), ledger
+
+
+@pytest.mark.asyncio
+async def test_soak_memory_stays_flat(monkeypatch, silent_reporter):
+    _short_windows(monkeypatch)
+    interval = max(75, (SOAK_BARS - WARMUP_BARS) // 8)
+    profiler = MemoryProfiler(snapshot_interval_bars=interval, warmup_bars=WARMUP_BARS)
+    report, ledger = await _soak(SOAK_BARS, profiler, silent_reporter)
+
+    assert report.bars == SOAK_BARS
+    assert len(report.traced_samples) >= 5
+    assert report.traced_samples[0][0] > WARMUP_BARS
+    assert report.modules
+    assert report.bar_peak_mean < BAR_PEAK_BUDGET
+    assert report.growth_per_bar() < GROWTH_BUDGET
+    assert len(ledger) <= LEDGER_TRADES and ledger.evicted > 0
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_long_soak_rss_stays_flat(silent_reporter):
+    # Hiçbir ayar değiştirilmeden (varsayılan pencereler, equity piramidi, defter
+    # kapalı) 10^6 bar; tracemalloc'un bar başı yükü olmadan yalnızca RSS örneklenir.
+    warmup = SLOW_SOAK_BARS // 20
+    profiler = MemoryProfiler(snapshot_interval_bars=SLOW_SOAK_BARS // 20, warmup_bars=warmup, trace=False)
+    await run_pipeline(
+        feed=SyntheticFeed(SLOW_SOAK_BARS),
+        reporter=silent_reporter,
+        memory_profiler=profiler,
+        max_steps=SLOW_SOAK_BARS,
+    )
+    report = profiler.stop()
+
+    assert report.bars == SLOW_SOAK_BARS
+    assert len(report.rss_samples) >= 10 and not report.traced_samples
+    assert report.rss_growth_per_bar() < GROWTH_BUDGET
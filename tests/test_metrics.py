@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 
+from src.evaluation.bootstrap import batch_metrics, bootstrap_summary, resample_indices
 from src.evaluation.metrics import compute_summary, evaluate_targets
 
 
@@ -26,3 +27,32 @@ def test_compute_summary_roi_from_equity():
     equity = [1.0, 1.05, 1.03]
     summary = compute_summary(pnls, equity)
     assert summary.roi == pytest.approx(0.03, rel=1e-6)
+
+
+def test_batch_metrics_match_compute_summary():
+    rng = np.random.default_rng(0)
+    pnls = rng.normal(0.001, 0.01, size=(4, 250))
+    batch = batch_metrics(pnls)
+    for row, values in enumerate(pnls):
+        equity = [1.0, *(1.0 + np.cumsum(values))]
+        summary = compute_summary(values.tolist(), equity)
+        assert batch["winrate"][row] == pytest.approx(summary.winrate)
+        assert batch["profit_factor"][row] == pytest.approx(summary.profit_factor)
+        assert batch["sharpe"][row] == pytest.approx(summary.sharpe)
+        assert batch["roi"][row] == pytest.approx(summary.roi)
+        assert batch["mdd"][row] == pytest.approx(summary.mdd)
+
+
+@pytest.mark.parametrize("method", ["stationary", "block"])
+def test_bootstrap_summary_intervals_and_probabilities(method):
+    indices = resample_indices(50, 8, 5, method, np.random.default_rng(1))
+    assert indices.shape == (8, 50)
+    assert indices.min() >= 0 and indices.max() < 50
+
+    pnls = np.random.default_rng(2).normal(0.002, 0.01, size=300)
+    result = bootstrap_summary(pnls, n_resamples=1000, block_length=10, method=method, chunk_size=128, seed=3)
+    assert result.samples["sharpe"].shape == (1000,)
+    low, high = result.intervals["sharpe"]
+    assert low <= result.point.sharpe <= high
+    assert set(result.target_probabilities) == {"winrate", "profit_factor", "sharpe", "roi", "mdd"}
+    assert all(0.0 <= p <= 1.0 for p in result.target_probabilities.values())
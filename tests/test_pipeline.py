@@ -1,23 +1,18 @@
+import asyncio
+
 import pytest
 
+from src.execution.intrabar import IntrabarGuard
 from src.execution.risk import RiskManager
 from src.execution.simulator import PaperTrader
 from src.main import run_pipeline
 from src.policy.bandit import ConstraintAwareBandit
 from src.policy.constraints import ConstraintEvaluator
 from src.signals.decision import DecisionBlender
+from src.utils.time import VirtualClock, get_clock
 from src.utils.types import BarData
 
 
-class FiniteFeed:
-    def __init__(self, bars):
-        self._bars = list(bars)
-
-    async def stream_klines(self):
-        for bar in self._bars:
-            yield bar
-
-
 class DummyReporter:
     def __init__(self):
         self.rendered = []
@@ -27,7 +22,7 @@ class DummyReporter:
 
 
 @pytest.mark.asyncio
-async def test_run_pipeline_smoke():
+async def test_run_pipeline_smoke(finite_feed):
     price = 100.0
     bars = []
     for i in range(60):
@@ -43,7 +38,7 @@ async def test_run_pipeline_smoke():
             )
         )
 
-    feed = FiniteFeed(bars)
+    feed = finite_feed(bars)
     trader = PaperTrader()
     bandit = ConstraintAwareBandit()
     constraints = ConstraintEvaluator()
@@ -65,3 +60,40 @@ async def test_run_pipeline_smoke():
     assert bandit._is_initialized is True
     assert len(constraints.pnl_window) > 0
     assert reporter.rendered, "Raporlayıcı en az bir özet üretmelidir"
+
+
+class TickingFeed:
+    def __init__(self, bars, ticks):
+        self._bars = list(bars)
+        self._ticks = list(ticks)
+        self.consumed = 0
+
+    async def stream_klines(self):
+        for bar in self._bars:
+            await asyncio.sleep(0)
+            yield bar
+
+    async def stream_ticks(self):
+        for tick in self._ticks:
+            self.consumed += 1
+            yield tick
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_starts_intrabar_guard_for_tick_feeds():
+    bars = [BarData(timestamp=i, open=100, high=100, low=100, close=100, volume=1.0) for i in range(40)]
+    feed = TickingFeed(bars, [(i, 100.0) for i in range(5)])
+    trader = PaperTrader()
+    guard = IntrabarGuard(trader)
+    await run_pipeline(feed=feed, trader=trader, reporter=DummyReporter(), intrabar=guard, max_steps=40)
+    assert feed.consumed == 5
+    assert guard.ticks == 5
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_restores_previous_clock(finite_feed):
+    before = get_clock()
+    virtual = VirtualClock(start=1672531200)
+    bars = [BarData(i, 100.0, 100.5, 99.5, 100.0, 1.0) for i in range(35)]
+    await run_pipeline(feed=finite_feed(bars), reporter=DummyReporter(), clock=virtual, max_steps=35)
+    assert get_clock() is before
@@ -21,3 +21,35 @@ def test_constraint_roi_uses_equity_curve():
     evaluator.update(0.02, equity=1.02)
     metrics = evaluator._compute_metrics()  # noqa: SLF001 - test amaçlı erişim
     assert metrics["roi"] == pytest.approx(0.02, rel=1e-6)
+
+
+def test_constraint_batch_matches_streaming():
+    rng = np.random.default_rng(7)
+    pnls = rng.normal(0.0, 0.01, size=2600)
+    pnls[rng.random(pnls.size) < 0.2] = 0.0
+    equity = 1.0 + np.cumsum(pnls)
+
+    streaming = ConstraintEvaluator()
+    expected = [streaming.update(float(p), equity=float(e)) for p, e in zip(pnls, equity, strict=True)]
+
+    batch = ConstraintEvaluator()
+    split = 300  # ilk parça pencereler dolmadan biter; ikinci parça mevcut durumdan devam eder
+    first = batch.update_batch(pnls[:split], equity[:split])
+    second = batch.update_batch(pnls[split:], equity[split:])
+
+    reward = np.concatenate([first.reward, second.reward])
+    penalty = np.concatenate([first.penalty, second.penalty])
+    level = np.concatenate([first.violation_level, second.violation_level])
+    alphas = np.vstack([first.alphas, second.alphas])
+    np.testing.assert_allclose(reward, [r.reward for r in expected], rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(penalty, [r.penalty for r in expected], rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(level, [r.violation_level for r in expected], rtol=1e-9, atol=1e-12)
+    expected_alphas = [[r.lagrange_multipliers[key] for key in first.keys] for r in expected]
+    np.testing.assert_allclose(alphas, expected_alphas, rtol=1e-9)
+    assert batch.alphas == pytest.approx(streaming.alphas, rel=1e-9)
+    assert list(batch.equity_curve) == list(streaming.equity_curve)
+
+    # Toplu çağrıdan sonra akış halinde devam etmek aynı sonucu vermeli.
+    after_stream = streaming.update(0.005, equity=float(equity[-1]) + 0.005)
+    after_batch = batch.update(0.005, equity=float(equity[-1]) + 0.005)
+    assert after_batch.reward == pytest.approx(after_stream.reward, rel=1e-9)
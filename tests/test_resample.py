@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from src.data.live_feed import HistoricalCSVFeed, HistoricalCSVFeedConfig
+from src.data.resample import MultiTimeframeAggregator, ResampledFeed
+from src.utils.types import BarData
+
+
+@pytest.mark.asyncio
+async def test_aggregator_matches_pandas_resample():
+    source = HistoricalCSVFeed(HistoricalCSVFeedConfig(path="data/btcusdt_1m_2023-01-01.csv"))
+    aggregator = MultiTimeframeAggregator(("5m", "1h"), history=100, base_interval_seconds=60)
+    feed = ResampledFeed(source, aggregator)
+    bars = []
+    async for bar in feed.stream_klines():
+        bars.append(bar)
+        if len(bars) >= 240:
+            break
+
+    frame = pd.DataFrame(
+        {"open": b.open, "high": b.high, "low": b.low, "close": b.close, "volume": b.volume} for b in bars
+    )
+    frame.index = pd.to_datetime([b.timestamp for b in bars], unit="s")
+    for tf, rule in (("5m", "5min"), ("1h", "1h")):
+        expected = frame.resample(rule).agg(
+            {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+        )
+        closed = list(aggregator.closed(tf))
+        assert len(closed) == len(expected)
+        for got, (_, row) in zip(closed, expected.iterrows(), strict=True):
+            assert got.open == pytest.approx(row["open"])
+            assert got.high == pytest.approx(row["high"])
+            assert got.low == pytest.approx(row["low"])
+            assert got.close == pytest.approx(row["close"])
+            assert got.volume == pytest.approx(row["volume"])
+
+
+def test_aggregator_exposes_partial_bar_and_features():
+    aggregator = MultiTimeframeAggregator(("5m",), base_interval_seconds=60)
+    closed = aggregator.update(BarData(0, 100.0, 101.0, 99.0, 100.5, 1.0))
+    assert closed == []
+    aggregator.update(BarData(60, 100.5, 103.0, 100.0, 102.0, 2.0))
+    partial = aggregator.partial("5m")
+    assert (partial.open, partial.high, partial.low, partial.close, partial.volume) == (100.0, 103.0, 99.0, 102.0, 3.0)
+    features = aggregator.feature_vector()
+    assert features[0] == pytest.approx(0.02)
+    assert features[1] == pytest.approx(0.75)
+    assert aggregator.feature_names() == ["5m_partial_return", "5m_range_position", "5m_closed_return"]
+
+    with pytest.raises(ValueError):
+        MultiTimeframeAggregator(("90s",), base_interval_seconds=60)
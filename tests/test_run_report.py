@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.evaluation.journal import RunJournal, read_journal
+from src.evaluation.run_report import build_run_report, main, write_html, write_parquet
+from src.utils.types import BarData
+
+
+async def write_synthetic_journal(path, n, seed=0):
+    rng = np.random.default_rng(seed)
+    pnl = rng.normal(0.0002, 0.01, n)
+    equity = 1.0 + np.cumsum(pnl)
+    violation = np.clip(rng.normal(-0.2, 0.3, n), 0.0, None)
+    journal = RunJournal(path, batch_size=4096, fsync="never")
+    await journal.start()
+    for i in range(n):
+        bar = BarData(i, 1.0, 1.0, 1.0, 1.0, 1.0)
+        journal.record(
+            bar,
+            np.zeros(2),
+            ("LONG", "SHORT", "FLAT")[i % 3 if i % 7 else 2],
+            "FLAT",
+            pnl[i],
+            equity[i],
+            violation[i] * 0.1,
+            violation[i],
+            "REDUCE" if violation[i] > 0.5 else "NORMAL",
+            1.0,
+        )
+    await journal.close()
+
+
+def brute_drawdown_periods(ts, equity):
+    peak = np.maximum.accumulate(equity)
+    dd = (peak - equity) / peak
+    periods, start = [], None
+    for i, value in enumerate(dd):
+        if value > 0 and start is None:
+            start = i
+        elif value == 0 and start is not None:
+            seg = dd[start:i]
+            periods.append((ts[start], ts[start + int(np.argmax(seg))], ts[i], seg.max(), i - start))
+            start = None
+    if start is not None:
+        seg = dd[start:]
+        periods.append((ts[start], ts[start + int(np.argmax(seg))], None, seg.max(), len(dd) - start))
+    return sorted(periods, key=lambda p: -p[3])
+
+
+@pytest.mark.asyncio
+async def test_chunked_report_matches_in_memory_computation(tmp_path):
+    path = tmp_path / "journal.bin"
+    await write_synthetic_journal(path, 20_000)
+    records = read_journal(path)
+
+    report = build_run_report(path, max_points=500, rolling_window=250, chunk_rows=1000, top_drawdowns=5)
+    single = build_run_report(path, max_points=500, rolling_window=250, chunk_rows=1 << 20, top_drawdowns=5)
+
+    equity, pnl = records["equity"], records["pnl"]
+    peak = np.maximum.accumulate(equity)
+    assert report.summary["max_drawdown"] == pytest.approx(((peak - equity) / peak).max())
+    assert report.summary["roi"] == pytest.approx(equity[-1] / equity[0] - 1)
+    assert report.summary["sharpe"] == pytest.approx(np.sqrt(252) * pnl.mean() / pnl.std(ddof=1))
+    assert report.summary == pytest.approx(single.summary)
+
+    expected = brute_drawdown_periods(records["timestamp"], equity)[:5]
+    got = [(p.start_ts, p.trough_ts, p.end_ts, p.depth, p.bars) for p in report.drawdowns]
+    assert [g[:3] + (g[4],) for g in got] == [e[:3] + (e[4],) for e in expected]
+    assert np.allclose([g[3] for g in got], [e[3] for e in expected])
+    assert got == [(p.start_ts, p.trough_ts, p.end_ts, p.depth, p.bars) for p in single.drawdowns]
+
+    stride = 40
+    assert len(report.series["equity"]) == 500
+    points = np.arange(stride - 1, 20_000, stride)
+    rolling = pd.Series(pnl).rolling(250)
+    expected_sharpe = (np.sqrt(252) * rolling.mean() / rolling.std()).to_numpy()[points]
+    assert np.allclose(report.series["rolling_sharpe"], expected_sharpe, equal_nan=True, rtol=1e-6)
+    assert np.array_equal(report.series["equity"], equity[points])
+    assert np.allclose(report.series["violation_max"], records["violation_level"].reshape(-1, stride).max(axis=1))
+    assert report.action_counts["FLAT"] == int(np.count_nonzero(records["action"] == 2))
+    assert sum(report.kill_state_counts.values()) == 20_000
+
+    html_path = write_html(report, tmp_path / "report.html")
+    assert "<svg" in html_path.read_text(encoding="utf-8")
+    table = pq.read_table(write_parquet(report, tmp_path / "report.parquet"))
+    assert table.num_rows == 500
+    assert b"maybelong.report" in table.schema.metadata
+
+    main([str(path), "--parquet", str(tmp_path / "cli.parquet"), "--html", str(tmp_path / "cli.html")])
+    assert (tmp_path / "cli.parquet").exists() and (tmp_path / "cli.html").exists()
@@ -0,0 +1,73 @@
+import asyncio
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from src.utils.sampler import StackSampler, install_signal_toggle
+
+
+def busy_hot_spot(seconds: float) -> int:
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return total
+
+
+def test_sampler_writes_collapsed_stacks(tmp_path):
+    sampler = StackSampler(interval_seconds=0.002, output_dir=tmp_path)
+    sampler.start()
+    busy_hot_spot(0.3)
+    path = sampler.stop()
+
+    assert path is not None and path.parent == tmp_path
+    lines = path.read_text().splitlines()
+    assert sampler.samples > 20
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == sampler.samples
+    hot = [line for line in lines if "busy_hot_spot" in line]
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in hot) > sampler.samples // 2
+    # Kök en solda, yaprak en sağda.
+    assert hot[0].rsplit(" ", 1)[0].split(";")[-1].startswith("busy_hot_spot (test_sampler.py:")
+    assert sampler.stop() is None
+
+
+def test_sampler_stops_when_target_thread_exits(tmp_path):
+    worker = threading.Thread(target=busy_hot_spot, args=(0.1,))
+    worker.start()
+    sampler = StackSampler(interval_seconds=0.002, output_dir=tmp_path)
+    sampler.start(worker.ident)
+    worker.join()
+    deadline = time.perf_counter() + 2.0
+    while sampler.running and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+    assert not sampler.running and sampler.target_lost
+    files = list(tmp_path.glob("profile-*.folded"))
+    assert len(files) == 1 and "busy_hot_spot" in files[0].read_text()
+    assert sampler.stop() is None
+    # Sonraki toggle örneklemeyi yeniden başlatır.
+    assert sampler.toggle() is None and sampler.running
+    assert sampler.toggle() is not None and not sampler.running
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="SIGUSR1 yok")
+@pytest.mark.asyncio
+async def test_signal_toggles_sampler(tmp_path):
+    loop = asyncio.get_running_loop()
+    sampler = StackSampler(interval_seconds=0.002, output_dir=tmp_path)
+    assert install_signal_toggle(loop, sampler, "SIGUSR1")
+    try:
+        os.kill(os.getpid(), signal.SIGUSR1)
+        await asyncio.sleep(0.05)
+        assert sampler.running
+        busy_hot_spot(0.1)
+        os.kill(os.getpid(), signal.SIGUSR1)
+        await asyncio.sleep(0.05)
+        assert not sampler.running
+    finally:
+        loop.remove_signal_handler(signal.SIGUSR1)
+    files = list(tmp_path.glob("profile-*.folded"))
+    assert len(files) == 1 and "busy_hot_spot" in files[0].read_text()
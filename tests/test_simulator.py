@@ -1,4 +1,10 @@
+import random
+
+from src.config.settings import get_settings
+from src.execution.intrabar import IntrabarGuard
+from src.execution.risk import RiskManager, RiskState
 from src.execution.simulator import PaperTrader
+from src.utils.time import VirtualClock
 from src.utils.types import BarData
 
 
@@ -17,3 +23,64 @@ def test_paper_trader_min_hold():
     pnl = trader.step(bar, "FLAT", size=0.0)
     assert trader.position is None
     assert isinstance(pnl, float)
+
+
+def test_intrabar_guard_flattens_on_hard_drawdown():
+    clock = VirtualClock(start=0)
+    trader = PaperTrader()
+    trader.equity = 100.0
+    trader.step(make_bar(100.0), "LONG", size=1.0)
+    guard = IntrabarGuard(trader, clock=clock)
+    guard.on_bar(trader.equity)
+
+    assert guard.on_price(105.0) is False
+    assert guard.peak_equity > trader.equity
+    assert guard.on_price(99.0) is False
+    assert guard.on_price(80.0) is True
+    assert trader.position is None
+    assert guard.active is True
+    assert guard.on_price(70.0) is False
+
+    stats = guard.latency_stats()
+    assert stats["ticks"] == 4 and stats["trips"] == 1
+    assert stats["tick_p99_us"] >= 0 and "action_max_us" in stats
+
+    clock._now = guard.cooldown_seconds + 1  # noqa: SLF001 - test amaçlı erişim
+    assert guard.active is False
+
+
+def test_kernel_matches_reference_trading_and_risk():
+    settings = get_settings()
+    fee = settings.runtime.fee_bps / 10000
+    slippage = settings.runtime.slippage_bps / 10000
+    min_hold = settings.runtime.min_hold_bars
+
+    rng = random.Random(3)
+    trader = PaperTrader()
+    ref_side, ref_entry, ref_size, ref_held, ref_equity = None, 0.0, 0.0, 0, 1.0
+    price = 100.0
+    for _ in range(500):
+        price *= 1 + rng.gauss(0.0, 0.01)
+        decision = rng.choice(["LONG", "SHORT", "FLAT"])
+        size = rng.choice([0.0, 0.5, 1.0])
+        pnl = trader.step(make_bar(price), decision, size)
+        expected = 0.0
+        if ref_side is not None:
+            ref_held += 1
+            diff = price - ref_entry
+            expected = (-diff if ref_side == "SHORT" else diff) * ref_size
+            if ref_held >= min_hold and decision != ref_side:
+                expected = expected - fee - slippage
+                ref_equity += expected
+                ref_side = None
+        elif decision != "FLAT" and size > 0:
+            ref_side, ref_entry, ref_size, ref_held = decision, price * (1 + slippage), size, 0
+            ref_equity -= fee
+        assert pnl == expected
+        assert trader.equity == ref_equity
+
+    risk = RiskManager()
+    for _ in range(200):
+        mdd, sharpe, roi = rng.uniform(0, 0.4), rng.uniform(-2, 3), rng.uniform(-0.1, 0.1)
+        state = risk.kill_switch(RiskState(max_drawdown=mdd, sharpe=sharpe, roi=roi))
+        assert risk.evaluate(mdd, sharpe, roi) == (state, risk.position_size(sharpe=sharpe, max_drawdown=mdd))
@@ -0,0 +1,131 @@
+import functools
+import multiprocessing as mp
+import os
+import socket
+
+import numpy as np
+
+from src.config.settings import get_settings
+from src.data.shm_ring import BarRing
+from src.supervisor import ShardSupervisor, pipeline_journal_path, shard_symbols, worker_main
+from src.utils.types import BarData
+
+BARS_PER_SYMBOL = 80
+# İşçilere aktarılan her şey argüman olarak gider; ``spawn`` ile üst sürecin
+# belleği (global değişkenler, monkeypatch'lenmiş ayarlar) kopyalanmaz.
+SPAWN = mp.get_context("spawn")
+
+
+def synthetic_source(symbol):
+    rng = np.random.default_rng(sum(map(ord, symbol)))
+    price = 100.0
+    for i in range(BARS_PER_SYMBOL):
+        close = price + float(rng.normal(0.0, 0.2))
+        yield BarData(i * 60, price, max(price, close) + 0.1, min(price, close) - 0.1, close, 1.0)
+        price = close
+
+
+def flaky_worker(crash_marker, worker_id, symbols, ring_names, metrics_queue, report_interval_seconds, **options):
+    """İlk çalıştırmada birkaç bar tüketip çöker; yeniden başlatılınca normal çalışır."""
+
+    if worker_id == 0 and not os.path.exists(crash_marker):
+        open(crash_marker, "w").close()
+        ring = BarRing.attach(ring_names[symbols[0]])
+        while ring.pending() < 10:
+            pass
+        ring.advance(10)
+        os._exit(3)
+    worker_main(worker_id, symbols, ring_names, metrics_queue, report_interval_seconds, **options)
+
+
+def configured_worker(overrides, *args, **options):
+    """``{"bölüm.alan": değer}`` ayarlarını işçi sürecinde uygulayıp ``worker_main``'i çalıştırır."""
+
+    settings = get_settings()
+    for path, value in overrides.items():
+        section, name = path.split(".")
+        setattr(getattr(settings, section), name, value)
+    worker_main(*args, **options)
+
+
+def test_shared_ring_roundtrip_and_backpressure():
+    ring = BarRing.create(capacity=4)
+    try:
+        bars = list(synthetic_source("X"))[:6]
+        assert all(ring.write(bar, block=False) for bar in bars[:4])
+        assert ring.write(bars[4], block=False) is False
+        view = ring.peek()
+        assert view.shape == (4, 6)
+        assert view[0, 4] == bars[0].close
+        ring.advance(3)
+        assert ring.write(bars[4], block=False) and ring.write(bars[5], block=False)
+        reader = BarRing.attach(ring.name)
+        assert reader.pending() == 3
+        assert reader.peek()[:, 0].tolist() == [180.0]  # halka sonunda bölünür
+        reader.advance(1)
+        assert reader.peek()[:, 0].tolist() == [240.0, 300.0]
+        reader.close()
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_supervisor_shards_symbols_and_restarts_crashed_worker(tmp_path):
+    symbols = ["AAA", "BBB", "CCC"]
+    assert shard_symbols(symbols, 2) == [["AAA", "CCC"], ["BBB"]]
+
+    supervisor = ShardSupervisor(
+        symbols,
+        synthetic_source,
+        workers=2,
+        ring_capacity=16,
+        report_interval_seconds=0.05,
+        worker_target=functools.partial(flaky_worker, str(tmp_path / "crashed")),
+        context=SPAWN,
+    )
+    result = supervisor.run()
+
+    assert result.restarts == {0: 1, 1: 0}
+    assert set(result.reports) == set(symbols)
+    for report in result.reports.values():
+        assert report["done"] is True
+        assert report["bars_consumed"] == BARS_PER_SYMBOL
+        assert np.isfinite(report["equity"])
+    # Çöken işçinin atladığı 10 bar yeniden işlenmez, halkadaki sıradan devam edilir.
+    assert result.reports["AAA"]["bars_processed"] == BARS_PER_SYMBOL - 10 - 29
+    assert result.reports["BBB"]["bars_processed"] == BARS_PER_SYMBOL - 29
+    assert result.bars_consumed == 3 * BARS_PER_SYMBOL
+
+
+def test_supervisor_gives_each_pipeline_its_own_journal_and_port(tmp_path):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        base_port = probe.getsockname()[1]
+    overrides = {
+        "journal.enabled": True,
+        "journal.path": str(tmp_path / "journal.bin"),
+        "monitoring.enabled": True,
+        "monitoring.port": base_port,
+    }
+    assert pipeline_journal_path("runs/journal.bin", "AAA") == os.path.join("runs", "journal.AAA.bin")
+
+    symbols = ["AAA", "BBB", "CCC"]
+    supervisor = ShardSupervisor(
+        symbols,
+        synthetic_source,
+        workers=2,
+        ring_capacity=16,
+        report_interval_seconds=0.05,
+        max_restarts=0,
+        worker_target=functools.partial(configured_worker, overrides),
+        context=SPAWN,
+    )
+    result = supervisor.run()
+
+    # Aynı işçideki iki pipeline (AAA, CCC) da ayrı port dinler; çakışma işçiyi çökertirdi.
+    assert result.restarts == {0: 0, 1: 0}
+    assert all(report["done"] for report in result.reports.values())
+    for symbol in symbols:
+        journal = tmp_path / f"journal.{symbol}.bin"
+        assert journal.exists() and journal.stat().st_size > 0
+    assert not (tmp_path / "journal.bin").exists()
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from src.config.settings import get_settings, override_settings
+from src.data.live_feed import HistoricalCSVFeed, HistoricalCSVFeedConfig
+from src.evaluation.replay import ReplayRunner, bars_to_array
+from src.evaluation.sweep import checkpoints, successive_halving
+
+
+def test_override_settings_copies_and_validates():
+    base = get_settings()
+    changed = override_settings(base, {"sizing.beta_mdd": 9.0, "safety.drawdown_hard": 0.5})
+    assert changed.sizing.beta_mdd == 9.0 and changed.safety.drawdown_hard == 0.5
+    assert base.sizing.beta_mdd != 9.0
+    assert changed.bandit is base.bandit
+    with pytest.raises(KeyError):
+        override_settings(base, {"sizing.nope": 1})
+
+
+def test_successive_halving_prunes_and_matches_full_run():
+    ohlcv = bars_to_array(HistoricalCSVFeed(HistoricalCSVFeedConfig(path="data/btcusdt_1m_2023-01-01.csv")).bars[:800])
+    assert checkpoints(len(ohlcv), 100, 2) == [100, 200, 400, 800]
+
+    configs = [
+        {"safety.drawdown_hard": -1.0},  # kill-switch hemen FLAT önerir
+        {"sizing.beta_sharpe": 0.1},
+        {"sizing.beta_sharpe": 0.3},
+        {"sizing.beta_mdd": 2.0},
+        {"metrics.penalties.alpha_cap": 2.0},
+    ]
+    # Varsayılan ayarlarla bu kısa seride her konfigürasyon sert düşüş eşiğini aşar; eşik yalnızca ilkinde etkin kalsın.
+    base = override_settings(get_settings(), {"safety.drawdown_hard": 1e9})
+    result = successive_halving(ohlcv, configs, min_bars=100, eta=2, seed=11, settings=base)
+
+    assert result.trials[0].pruned_at == 100 and result.trials[0].reason == "kill_switch"
+    assert len(result.finished) == 1
+    assert result.bars_processed < len(configs) * len(ohlcv) / 2
+    best = result.best
+    assert best.bars == len(ohlcv)
+
+    # Tek başına tam çalıştırma aynı sonucu vermeli.
+    np.random.seed(11 + best.index)
+    runner = ReplayRunner(ohlcv, settings=override_settings(base, configs[best.index]))
+    runner.advance(len(ohlcv))
+    assert runner.summary() == best.summary
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from src.data.feature_engineering import BASE_COLUMNS, available_features, compute_feature_matrix
+from src.data.live_feed import HistoricalCSVFeed, HistoricalCSVFeedConfig
+from src.evaluation.replay import ReplayRunner, bars_to_array
+from src.evaluation.walk_forward import make_folds, walk_forward
+
+
+def test_make_folds_rolling_and_anchored():
+    rolling = make_folds(1000, train_size=300, test_size=200)
+    assert [(f.train_start, f.train_end, f.test_end) for f in rolling] == [
+        (0, 300, 500),
+        (200, 500, 700),
+        (400, 700, 900),
+    ]
+    anchored = make_folds(1000, train_size=300, test_size=200, anchored=True)
+    assert all(f.train_start == 0 for f in anchored)
+    assert [f.test_end for f in anchored] == [500, 700, 900]
+
+
+def test_walk_forward_parallel_matches_sequential():
+    feed = HistoricalCSVFeed(HistoricalCSVFeedConfig(path="data/btcusdt_1m_2023-01-01.csv"))
+    bars = feed.bars[:600]
+
+    sequential = walk_forward(bars, train_size=200, test_size=150, max_workers=1, seed=7)
+    parallel = walk_forward(bars, train_size=200, test_size=150, max_workers=2, seed=7)
+
+    assert len(sequential.folds) == 2
+    assert all(len(f.pnls) == 150 for f in sequential.folds)
+    assert sequential.fold_summaries() == parallel.fold_summaries()
+    assert sequential.overall.mdd >= 0
+
+
+def test_walk_forward_rejects_short_series():
+    feed = HistoricalCSVFeed(HistoricalCSVFeedConfig(path="data/btcusdt_1m_2023-01-01.csv"))
+    with pytest.raises(ValueError):
+        walk_forward(feed.bars[:100], train_size=80, test_size=50, max_workers=1)
+
+
+def test_replay_features_match_streaming_window():
+    feed = HistoricalCSVFeed(HistoricalCSVFeedConfig(path="data/btcusdt_1m_2023-01-01.csv"))
+    ohlcv = bars_to_array(feed.bars[:500])
+    names = available_features()
+    arrays = {col: ohlcv[:, i + 1] for i, col in enumerate(BASE_COLUMNS)}
+    full = compute_feature_matrix(arrays, names)
+    # Canlı döngü her barda son 200 barlık pencereden hesaplar.
+    streamed = np.array(
+        [compute_feature_matrix({c: v[i - 199 : i + 1] for c, v in arrays.items()}, names)[-1] for i in range(199, 500)]
+    )
+    scale = np.abs(full[199:]).max(axis=0)
+    drift = np.abs(streamed - full[199:]).max(axis=0) / scale
+    recursive = {"rsi_14", "atr_14", "macd", "macd_signal", "macd_hist", "obv_zscore"}
+    for name, value in zip(names, drift, strict=True):
+        assert value <= (1e-5 if name in recursive else 0.0), name
+
+    runner = ReplayRunner(ohlcv, features=full)
+    runner.advance(300, record=False)
+    runner.kill_status, runner.position_size, runner.max_drawdown = "FLAT", 0.0, 0.5
+    runner.reset_account()
+    assert runner.kill_status == "NORMAL"
+    assert runner.max_drawdown == runner.sharpe_estimate == runner.roi == 0.0
+    assert runner.position_size == runner.risk.position_size(sharpe=0.0, max_drawdown=0.0)
+    assert runner.trader.equity == 1.0 and not runner.recorded_pnls